@@ -21,7 +21,9 @@ async def get_client_visits_ranking():
         raise HTTPException(status_code=400, detail="Simulación no inicializada. Inicialice la simulación desde el dashboard primero.")
     try:
         node_visits = shared_data_manager.get_node_visits() or {}
-        client_visits = {node: visits for node, visits in node_visits.items() if node.startswith('T')}
+        node_types = shared_data_manager.get_node_types()
+        client_visits = {node: visits for node, visits in node_visits.items()
+                        if shared_data_manager.get_node_type(node, node_types) == 'client'}
         sorted_clients = sorted(client_visits.items(), key=lambda x: x[1], reverse=True)
         ranking_data = [
             {"rank": i+1, "client_node": node, "visits": visits}
@@ -42,7 +44,9 @@ async def get_recharge_visits_ranking():
         raise HTTPException(status_code=400, detail="Simulación no inicializada. Inicialice la simulación desde el dashboard primero.")
     try:
         node_visits = shared_data_manager.get_node_visits() or {}
-        recharge_visits = {node: visits for node, visits in node_visits.items() if node.startswith('C')}
+        node_types = shared_data_manager.get_node_types()
+        recharge_visits = {node: visits for node, visits in node_visits.items()
+                        if shared_data_manager.get_node_type(node, node_types) == 'charging'}
         sorted_recharges = sorted(recharge_visits.items(), key=lambda x: x[1], reverse=True)
         ranking_data = [
             {"rank": i+1, "recharge_node": node, "visits": visits}
@@ -63,7 +67,9 @@ async def get_storage_visits_ranking():
         raise HTTPException(status_code=400, detail="Simulación no inicializada. Inicialice la simulación desde el dashboard primero.")
     try:
         node_visits = shared_data_manager.get_node_visits() or {}
-        storage_visits = {node: visits for node, visits in node_visits.items() if node.startswith('S')}
+        node_types = shared_data_manager.get_node_types()
+        storage_visits = {node: visits for node, visits in node_visits.items()
+                        if shared_data_manager.get_node_type(node, node_types) == 'storage'}
         sorted_storages = sorted(storage_visits.items(), key=lambda x: x[1], reverse=True)
         ranking_data = [
             {"rank": i+1, "storage_node": node, "visits": visits}
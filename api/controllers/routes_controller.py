@@ -0,0 +1,226 @@
+"""
+Controlador para endpoints de cálculo de rutas
+"""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from typing import List
+import sys
+import os
+import threading
+import time
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.shared_data import shared_data_manager
+from src.model.contraction_hierarchy import ContractionHierarchy
+from src.model.algorithms import RouteOptimizer
+from src.model.parallel_router import default_workers
+from src.model.route_cache import route_cache
+
+router = APIRouter()
+
+# Archivo donde se guarda la jerarquía preprocesada
+HIERARCHY_FILE = "contraction_hierarchy.npz"
+
+# Archivo donde se guarda la caché de rutas entre reinicios
+ROUTE_CACHE_FILE = "route_cache.pkl"
+
+# Procesos máximos que puede pedir un lote de rutas (uno por núcleo del servidor)
+MAX_ROUTE_WORKERS = default_workers()
+
+# Jerarquía en memoria y versión del grafo de la que proviene
+_hierarchy_state = {'hierarchy': None, 'graph_version': None}
+
+# Evita construir la misma jerarquía en dos hilos a la vez
+_hierarchy_lock = threading.Lock()
+
+# Optimizador del grafo actual, que conserva su pool de procesos entre lotes
+_optimizer_state = {'optimizer': None, 'graph_version': None}
+
+# Versión del grafo para la que ya se cargó la caché de rutas desde disco
+_route_cache_state = {'graph_version': None}
+
+
+class RoutePair(BaseModel):
+    """Par origen/destino de una consulta de rutas"""
+    origin: str
+    destination: str
+
+
+class BatchRouteRequest(BaseModel):
+    """Lote de pares origen/destino"""
+    pairs: List[RoutePair]
+    consider_charging: bool = True
+    workers: int = Field(1, ge=1)
+
+
+def _get_graph():
+    """
+    Obtener el grafo actual (solo se reconstruye si cambiaron los datos
+    compartidos). Con cada grafo nuevo se cargan las rutas guardadas en disco
+    que le correspondan.
+    """
+    graph = shared_data_manager.get_graph()
+    if graph is None:
+        raise HTTPException(status_code=400, detail="Simulación no inicializada. Inicialice la simulación desde el dashboard primero.")
+    if _route_cache_state['graph_version'] != graph.version:
+        _route_cache_state['graph_version'] = graph.version
+        # Un archivo dañado o de otro grafo solo significa empezar con la caché vacía
+        try:
+            if route_cache.load(ROUTE_CACHE_FILE, graph) == 0 and os.path.exists(ROUTE_CACHE_FILE):
+                print(f"ℹ️ {ROUTE_CACHE_FILE} no tiene rutas del grafo actual")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No se pudo cargar la caché de rutas {ROUTE_CACHE_FILE}: {e}")
+    return graph
+
+
+def _get_optimizer(graph) -> RouteOptimizer:
+    """
+    Obtener el optimizador del grafo actual. Se reutiliza mientras el grafo no
+    cambie para no crear un pool de procesos nuevo en cada lote.
+    """
+    if _optimizer_state['optimizer'] is None or _optimizer_state['graph_version'] != graph.version:
+        if _optimizer_state['optimizer'] is not None:
+            _optimizer_state['optimizer'].close()
+        _optimizer_state['optimizer'] = RouteOptimizer(graph)
+        _optimizer_state['graph_version'] = graph.version
+    return _optimizer_state['optimizer']
+
+
+def _build_hierarchy(graph) -> ContractionHierarchy:
+    """Construir la jerarquía de un grafo y guardarla en disco"""
+    hierarchy = ContractionHierarchy.build(graph)
+    hierarchy.save(HIERARCHY_FILE)
+    return hierarchy
+
+
+def _get_hierarchy() -> ContractionHierarchy:
+    """
+    Obtener la jerarquía del grafo actual. Solo se revisa el grafo cuando
+    cambia su versión; si el archivo en disco corresponde al grafo se
+    reutiliza, si no se reconstruye. Puede tardar segundos: desde los
+    endpoints se llama con run_in_threadpool.
+    """
+    graph = _get_graph()
+    with _hierarchy_lock:
+        if _hierarchy_state['hierarchy'] is not None and _hierarchy_state['graph_version'] == graph.version:
+            return _hierarchy_state['hierarchy']
+
+        hierarchy = None
+        if os.path.exists(HIERARCHY_FILE):
+            try:
+                hierarchy = ContractionHierarchy.load(HIERARCHY_FILE)
+            except Exception:
+                hierarchy = None
+        if hierarchy is None or not hierarchy.matches(graph):
+            hierarchy = _build_hierarchy(graph)
+
+        _hierarchy_state['hierarchy'] = hierarchy
+        _hierarchy_state['graph_version'] = graph.version
+        return hierarchy
+
+
+@router.post("/hierarchy")
+async def build_hierarchy():
+    """Preprocesar la red en una jerarquía de contracción y guardarla en disco"""
+    graph = _get_graph()
+    try:
+        start = time.perf_counter()
+        hierarchy = await run_in_threadpool(_build_hierarchy, graph)
+        elapsed = time.perf_counter() - start
+        with _hierarchy_lock:
+            _hierarchy_state['hierarchy'] = hierarchy
+            _hierarchy_state['graph_version'] = graph.version
+        return {
+            "message": "Jerarquía de contracción construida",
+            "nodes": len(hierarchy.names),
+            "shortcuts": hierarchy.num_shortcuts(),
+            "build_seconds": round(elapsed, 3),
+            "file": HIERARCHY_FILE
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error construyendo jerarquía: {str(e)}")
+
+
+@router.get("/shortest")
+async def get_shortest_route(origin: str, destination: str):
+    """Obtener la ruta más corta entre dos nodos usando la jerarquía de contracción"""
+    hierarchy = await run_in_threadpool(_get_hierarchy)
+    if origin not in hierarchy.index or destination not in hierarchy.index:
+        raise HTTPException(status_code=404, detail="Nodo de origen o destino no encontrado")
+    try:
+        path, cost, info = route_cache.get_or_compute(
+            _get_graph(), origin, destination, "contraction_hierarchy", hierarchy.autonomy,
+            lambda: hierarchy.query(origin, destination))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculando ruta: {str(e)}")
+
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"No existe ruta de {origin} a {destination}")
+
+    return {
+        "origin": origin,
+        "destination": destination,
+        "path": path,
+        "total_cost": cost,
+        "path_length": len(path),
+        "settled_nodes": info['settled_nodes']
+    }
+
+
+@router.post("/batch")
+async def get_routes_batch(request: BatchRouteRequest):
+    """
+    Calcular rutas para muchos pares origen/destino con una búsqueda por
+    origen. Los procesos pedidos se limitan a MAX_ROUTE_WORKERS y el cálculo
+    corre fuera del bucle de eventos para no bloquear otras peticiones.
+    """
+    graph = _get_graph()
+    workers = min(request.workers, MAX_ROUTE_WORKERS)
+    try:
+        pairs = [(pair.origin, pair.destination) for pair in request.pairs]
+        start = time.perf_counter()
+        results = await run_in_threadpool(_get_optimizer(graph).route_many,
+                                          pairs, request.consider_charging, workers)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculando rutas: {str(e)}")
+
+    routes = []
+    for (origin, destination), result in zip(pairs, results):
+        cost = result['total_cost']
+        routes.append({
+            "origin": origin,
+            "destination": destination,
+            "path": result['path'],
+            "total_cost": cost if cost != float('inf') else None,
+            "charging_stations": result['charging_stations'],
+            "autonomy_respected": result['autonomy_respected'],
+            "error": result.get('error')
+        })
+    return {
+        "routes": routes,
+        "total_count": len(routes),
+        "distinct_origins": len({origin for origin, _ in pairs}),
+        "elapsed_seconds": round(elapsed, 4)
+    }
+
+
+@router.get("/cache")
+async def get_route_cache_stats():
+    """Estadísticas de la caché compartida de rutas"""
+    return route_cache.stats()
+
+
+@router.post("/cache/save")
+async def save_route_cache():
+    """Guardar en disco las rutas del grafo actual para reutilizarlas tras un reinicio"""
+    graph = _get_graph()
+    try:
+        saved = route_cache.save(ROUTE_CACHE_FILE, graph)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error guardando caché de rutas: {str(e)}")
+    return {"message": "Caché de rutas guardada", "routes": saved, "file": ROUTE_CACHE_FILE}
@@ -17,6 +17,7 @@ from .controllers.clients_controller import router as clients_router
 from .controllers.orders_controller import router as orders_router
 from .controllers.reports_controller import router as reports_router
 from .controllers.info_controller import router as info_router
+from .controllers.routes_controller import router as routes_router
 
 # Crear aplicación FastAPI
 app = FastAPI(
@@ -48,7 +49,8 @@ async def root():
             "clients": "/clients/*",
             "orders": "/orders/*",
             "reports": "/reports/*",
-            "info": "/info/*"
+            "info": "/info/*",
+            "routes": "/routes/*"
         }
     }
 
@@ -66,6 +68,7 @@ app.include_router(clients_router, prefix="/clients", tags=["Clients"])
 app.include_router(orders_router, prefix="/orders", tags=["Orders"])
 app.include_router(reports_router, prefix="/reports", tags=["Reports"])
 app.include_router(info_router, prefix="/info", tags=["Information"])
+app.include_router(routes_router, prefix="/routes", tags=["Routes"])
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Script para ejecutar simulaciones por lotes sin dashboard ni API
+Ver src/sim/batch_runner.py para las opciones disponibles
+"""
+
+import sys
+
+from src.sim.batch_runner import main
+
+if __name__ == "__main__":
+    sys.exit(main())
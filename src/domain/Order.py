@@ -1,7 +1,16 @@
 import datetime
+from src.model.roles import ROLE_STORAGE, ROLE_CHARGING, ROLE_CLIENT, infer_role
+
+# Etiqueta del tipo de nodo para cada rol del grafo
+NODE_TYPE_LABELS = {
+    ROLE_STORAGE: 'Almacenamiento',
+    ROLE_CHARGING: 'Carga',
+    ROLE_CLIENT: 'Cliente'
+}
 
 class Order:
-    def __init__(self, order_id, origin, destination, client_id=None, client_name=None, priority="Normal"):
+    def __init__(self, order_id, origin, destination, client_id=None, client_name=None, priority="Normal",
+                 origin_role=None, destination_role=None):
         """
         Inicializa una orden de entrega.
         
@@ -12,6 +21,8 @@ class Order:
             client_id: ID del cliente (opcional)
             client_name: Nombre del cliente (opcional)
             priority: Prioridad de la orden ("Alta", "Normal", "Baja")
+            origin_role: Rol del nodo de origen en el grafo (opcional)
+            destination_role: Rol del nodo de destino en el grafo (opcional)
         """
         self.order_id = order_id
         self.client_id = client_id if client_id else "SYSTEM"
@@ -25,26 +36,23 @@ class Order:
         self.delivered_to = None
         self.route = None
         self.route_cost = 0
-        self.origin_type = self._get_node_type(origin)
-        self.destination_type = self._get_node_type(destination)
+        self.origin_type = self._get_node_type(origin, origin_role)
+        self.destination_type = self._get_node_type(destination, destination_role)
 
-    def _get_node_type(self, node_id):
+    def _get_node_type(self, node_id, role=None):
         """
-        Determina el tipo de nodo basado en su ID.
+        Determina el tipo de nodo a partir de su rol en el grafo.
         
         Args:
             node_id: ID del nodo
+            role: Rol del nodo; si se omite se deduce del ID
             
         Returns:
             str: Tipo de nodo ('Almacenamiento', 'Carga', 'Cliente')
         """
-        if node_id.startswith('S'):
-            return 'Almacenamiento'
-        elif node_id.startswith('C'):
-            return 'Carga'
-        elif node_id.startswith('T'):
-            return 'Cliente'
-        return 'Desconocido'
+        if role is None:
+            role = infer_role(node_id)
+        return NODE_TYPE_LABELS.get(role, 'Desconocido')
 
     def assign_route(self, route):
         """
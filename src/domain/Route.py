@@ -1,3 +1,5 @@
+from src.model.roles import ROLE_CHARGING, infer_role, role_from_name
+
 class Route:
     def __init__(self, route_id, nodes, total_cost=0, charging_points=None):
         """
@@ -41,13 +43,24 @@ class Route:
         self.total_cost = total
         return total
 
-    def identify_charging_points(self):
+    def identify_charging_points(self, graph=None):
         """
         Identifica los puntos de recarga en la ruta.
+        
+        Args:
+            graph: Grafo con los roles de los nodos (opcional)
         """
-        self.charging_points = [node for node in self.nodes if node.startswith('C')]
+        self.charging_points = [node for node in self.nodes
+                                if self._get_role(node, graph) == ROLE_CHARGING]
         return self.charging_points
 
+    @staticmethod
+    def _get_role(node, graph):
+        """Obtiene el rol de un nodo desde el grafo, o por su ID si no hay grafo."""
+        if graph is not None:
+            return graph.get_role(node)
+        return infer_role(node)
+
     def __eq__(self, other):
         """
         Compara si dos rutas son iguales basándose en sus nodos.
@@ -135,12 +148,13 @@ class Route:
         """
         return self.node_visits
 
-    def get_most_visited_nodes(self, node_type=None):
+    def get_most_visited_nodes(self, node_type=None, graph=None):
         """
         Obtiene los nodos más visitados, opcionalmente filtrados por tipo.
         
         Args:
             node_type: Tipo de nodo a filtrar ('storage', 'charging', 'client')
+            graph: Grafo con los roles de los nodos (opcional)
             
         Returns:
             list: Lista de tuplas (nodo, visitas) ordenadas por visitas
@@ -148,7 +162,7 @@ class Route:
         filtered_visits = self.node_visits
         if node_type:
             filtered_visits = {node: visits for node, visits in self.node_visits.items() 
-                             if node.startswith(node_type[0].upper())}
+                             if self._get_role(node, graph) == role_from_name(node_type)}
         
         return sorted(filtered_visits.items(), key=lambda x: x[1], reverse=True)
 
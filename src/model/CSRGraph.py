@@ -0,0 +1,339 @@
+"""
+Representación compacta del grafo en formato CSR (Compressed Sparse Row).
+Los vértices se identifican con enteros densos y las aristas se guardan en
+arreglos contiguos de NumPy, lo que evita copias de conjuntos y búsquedas
+por tuplas en los algoritmos de rutas.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .roles import ROLE_NAMES, ROLE_UNKNOWN
+from .geo import haversine_array
+
+
+class CSRGraph:
+    """
+    Grafo dirigido en formato CSR.
+
+    Los vecinos del vértice ``i`` son ``targets[offsets[i]:offsets[i+1]]`` y
+    los pesos correspondientes ``weights[offsets[i]:offsets[i+1]]``.
+    """
+
+    def __init__(self, names: List[str], offsets: np.ndarray,
+                 targets: np.ndarray, weights: np.ndarray,
+                 roles: Optional[np.ndarray] = None,
+                 coordinates: Optional[np.ndarray] = None):
+        """
+        Inicializa el grafo CSR a partir de sus arreglos.
+
+        Args:
+            names: Nombre de cada vértice, indexado por su identificador entero
+            offsets: Arreglo de tamaño n+1 con el inicio de cada fila
+            targets: Vértice destino de cada arista
+            weights: Peso de cada arista
+            roles: Rol de cada vértice (ver src.model.roles)
+            coordinates: Arreglo (n, 2) con la posición (lat, lon) de cada
+                vértice; NaN en los vértices sin posición
+        """
+        self.names = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        if roles is None:
+            roles = np.full(len(self.names), ROLE_UNKNOWN, dtype=np.int8)
+        self.roles = roles
+        self.coordinates = coordinates
+        self._lists = None
+        self._role_list = None
+        self._coordinate_list = None
+        self._heuristic_scale = None
+        self._reverse = None
+        self._integer_bound = False
+
+    def __getstate__(self) -> Dict:
+        """
+        Estado para pickle: solo los arreglos base, sin índices ni copias en
+        listas, para enviar una instantánea compacta a otros procesos.
+        """
+        return {
+            'names': self.names,
+            'offsets': self.offsets,
+            'targets': self.targets,
+            'weights': self.weights,
+            'roles': self.roles,
+            'coordinates': self.coordinates,
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        """Reconstruye los índices a partir de los arreglos base."""
+        self.__init__(state['names'], state['offsets'], state['targets'],
+                      state['weights'], state['roles'], state['coordinates'])
+
+    @classmethod
+    def from_graph(cls, graph) -> 'CSRGraph':
+        """
+        Construye la representación CSR de un Graph.
+
+        Args:
+            graph: Grafo basado en listas de adyacencia
+
+        Returns:
+            CSRGraph: Grafo compacto equivalente
+        """
+        # Los ids del CSR son los ids asignados por la tabla de símbolos del grafo
+        names = graph._vertex_names
+        index = graph._vertex_ids
+        n = len(names)
+
+        sources = []
+        targets = []
+        weights = []
+        for name in names:
+            u = index[name]
+            for neighbor in graph.adjacency_list[name]:
+                sources.append(u)
+                targets.append(index[neighbor])
+                weights.append(graph.edge_weights[(name, neighbor)])
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int32)
+        integral = all(isinstance(w, (int, np.integer)) for w in weights)
+        weights = np.asarray(weights, dtype=np.int64 if integral else np.float64)
+
+        # Ordenar por (origen, destino) para un recorrido determinista
+        order = np.lexsort((targets, sources))
+        sources = sources[order]
+        targets = targets[order]
+        weights = weights[order]
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        roles = np.asarray(graph._roles, dtype=np.int8)
+
+        coordinates = None
+        if graph._positions:
+            coordinates = np.full((n, 2), np.nan)
+            for name, position in graph._positions.items():
+                coordinates[index[name]] = position
+        return cls(names, offsets, targets, weights, roles, coordinates)
+
+    def to_csr(self) -> 'CSRGraph':
+        """Permite usar un CSRGraph donde se espera un Graph."""
+        return self
+
+    def num_vertices(self) -> int:
+        """Retorna la cantidad de vértices."""
+        return len(self.names)
+
+    def num_edges(self) -> int:
+        """Retorna la cantidad de aristas dirigidas."""
+        return int(self.targets.shape[0])
+
+    def vertices(self) -> List[str]:
+        """Retorna los nombres de los vértices."""
+        return list(self.names)
+
+    def has_vertex(self, vertex: str) -> bool:
+        """Verifica si existe un vértice con ese nombre."""
+        return vertex in self.index
+
+    def vertex_id(self, vertex: str) -> Optional[int]:
+        """
+        Obtiene el identificador entero de un vértice.
+
+        Args:
+            vertex: Nombre del vértice
+
+        Returns:
+            int: Identificador o None si no existe
+        """
+        return self.index.get(vertex)
+
+    def get_role(self, vertex: str) -> int:
+        """Obtiene el rol entero de un vértice por nombre."""
+        vertex_id = self.index.get(vertex)
+        return ROLE_UNKNOWN if vertex_id is None else int(self.roles[vertex_id])
+
+    def get_node_type(self, vertex: str) -> str:
+        """Obtiene el tipo de un vértice como texto."""
+        return ROLE_NAMES[self.get_role(vertex)]
+
+    def role_list(self) -> List[int]:
+        """
+        Copia en lista de Python del arreglo de roles, calculada una sola vez.
+
+        Returns:
+            list: Rol de cada vértice indexado por id
+        """
+        if self._role_list is None:
+            self._role_list = self.roles.tolist()
+        return self._role_list
+
+    def integer_weight_bound(self) -> Optional[int]:
+        """
+        Mayor peso si todos los pesos son enteros no negativos.
+
+        Returns:
+            int: Peso máximo, o None si hay pesos reales o negativos
+        """
+        if self._integer_bound is False:
+            bound = None
+            if self.weights.dtype.kind in 'iu':
+                if self.num_edges() == 0:
+                    bound = 0
+                elif int(self.weights.min()) >= 0:
+                    bound = int(self.weights.max())
+            self._integer_bound = bound
+        return self._integer_bound
+
+    def has_coordinates(self) -> bool:
+        """Verifica si todos los vértices tienen posición geográfica."""
+        return (self.coordinates is not None
+                and bool(np.isfinite(self.coordinates).all()))
+
+    def coordinate_list(self) -> List[Tuple[float, float]]:
+        """
+        Copia en lista de Python de las posiciones, calculada una sola vez.
+
+        Returns:
+            list: Tupla (lat, lon) de cada vértice indexada por id
+        """
+        if self._coordinate_list is None:
+            self._coordinate_list = [tuple(row) for row in self.coordinates.tolist()]
+        return self._coordinate_list
+
+    def heuristic_scale(self) -> float:
+        """
+        Menor relación peso / distancia geográfica entre los extremos de las
+        aristas. Multiplicada por la distancia haversine al destino da una
+        cota inferior del costo restante: cada arista cuesta al menos
+        ``escala × su distancia`` y, por la desigualdad triangular, la suma
+        de esas distancias no es menor que la distancia directa.
+
+        Returns:
+            float: Escala de la heurística (0 si no hay posiciones completas)
+        """
+        if self._heuristic_scale is None:
+            scale = 0.0
+            if self.has_coordinates() and self.num_edges():
+                sources, targets, weights = self.edge_arrays()
+                lat, lon = self.coordinates[:, 0], self.coordinates[:, 1]
+                lengths = haversine_array(lat[sources], lon[sources],
+                                          lat[targets], lon[targets])
+                # Las aristas entre posiciones idénticas no acotan la escala
+                mask = lengths > 0
+                if mask.any():
+                    scale = max(0.0, float(np.min(weights[mask] / lengths[mask])))
+            self._heuristic_scale = scale
+        return self._heuristic_scale
+
+    def neighbors(self, vertex_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtiene los vecinos y pesos de un vértice sin copiar datos.
+
+        Args:
+            vertex_id: Identificador entero del vértice
+
+        Returns:
+            Tuple con (vistas_de_destinos, vistas_de_pesos)
+        """
+        lo, hi = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return self.targets[lo:hi], self.weights[lo:hi]
+
+    def get_edge_weight(self, start: str, end: str):
+        """
+        Obtiene el peso de una arista por nombre de vértices.
+
+        Returns:
+            int/float: Peso de la arista o None si no existe
+        """
+        u = self.index.get(start)
+        v = self.index.get(end)
+        if u is None or v is None:
+            return None
+        targets, weights = self.neighbors(u)
+        pos = np.searchsorted(targets, v)
+        if pos < len(targets) and targets[pos] == v:
+            return weights[pos].item()
+        return None
+
+    def set_weight(self, start: int, end: int, weight) -> None:
+        """
+        Cambia el peso de una arista existente sin reconstruir el grafo. Se
+        actualizan en el lugar los arreglos, sus copias en listas y el grafo
+        invertido, y se descartan las cotas calculadas a partir de los pesos.
+
+        Args:
+            start: Id del vértice de inicio
+            end: Id del vértice de fin
+            weight: Nuevo peso
+
+        Raises:
+            ValueError: Si la arista no existe
+        """
+        self._patch_weight(start, end, weight)
+        if self._reverse is not None:
+            self._reverse._patch_weight(end, start, weight)
+
+    def _patch_weight(self, row: int, column: int, weight) -> None:
+        """Cambia el peso de la arista ``row -> column`` de este CSR."""
+        lo, hi = int(self.offsets[row]), int(self.offsets[row + 1])
+        pos = lo + int(np.searchsorted(self.targets[lo:hi], column))
+        if pos >= hi or self.targets[pos] != column:
+            raise ValueError(f"No existe la arista {self.names[row]} -> {self.names[column]}")
+        if self.weights.dtype.kind in 'iu' and not isinstance(weight, (int, np.integer)):
+            # Un peso real obliga a pasar todos los pesos a punto flotante
+            self.weights = self.weights.astype(np.float64)
+            self._lists = None
+        self.weights[pos] = weight
+        if self._lists is not None:
+            self._lists[2][pos] = self.weights[pos].item()
+        self._heuristic_scale = None
+        self._integer_bound = False
+
+    def edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retorna la lista de aristas como arreglos (origen, destino, peso).
+
+        Returns:
+            Tuple con (sources, targets, weights)
+        """
+        counts = np.diff(self.offsets)
+        sources = np.repeat(np.arange(len(self.names), dtype=np.int32), counts)
+        return sources, self.targets, self.weights
+
+    def reverse(self) -> 'CSRGraph':
+        """
+        Grafo con todas las aristas invertidas, calculado una sola vez. La
+        fila de ``v`` contiene los vértices con una arista hacia ``v``.
+
+        Returns:
+            CSRGraph: Grafo transpuesto con los mismos ids, roles y posiciones
+        """
+        if self._reverse is None:
+            sources, targets, weights = self.edge_arrays()
+            order = np.lexsort((sources, targets))
+            n = len(self.names)
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(targets, minlength=n), out=offsets[1:])
+            reverse = CSRGraph(self.names, offsets, sources[order].astype(np.int32),
+                               weights[order], self.roles, self.coordinates)
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def as_lists(self) -> Tuple[List[int], List[int], list]:
+        """
+        Copias en listas de Python de los arreglos CSR, calculadas una sola vez.
+        Los bucles en Python puro indexan listas mucho más rápido que arreglos
+        de NumPy.
+
+        Returns:
+            Tuple con (offsets, targets, weights) como listas
+        """
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.targets.tolist(),
+                           self.weights.tolist())
+        return self._lists
+
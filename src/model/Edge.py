@@ -2,6 +2,8 @@
 
 class Edge:
     """Edge structure for a graph."""
+    __slots__ = ('_start', '_end', '_weight', 'energy_cost')
+
     def __init__(self, start, end, weight=1):
         """
         Inicializa una arista con vértices de inicio y fin, y un peso opcional.
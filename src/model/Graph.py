@@ -1,20 +1,235 @@
+import itertools
+from collections import deque
 from .Edge import Edge
 from .vertex import Vertex
+from .CSRGraph import CSRGraph
+from .all_pairs import AllPairsShortestPaths, ALL_PAIRS_MAX_VERTICES
+from .shortest_path_tree import ShortestPathTreeCache
+from .charging_overlay import ChargingOverlay
+from .mst import mst_edge_list
+from .union_find import UnionFind, component_labels
+from . import traversal
+from .roles import ROLE_NAMES, ROLE_UNKNOWN, infer_role, role_from_name
+
+# Versiones de los grafos: crecen con cada modificación y no se repiten entre
+# grafos del mismo proceso, así que sirven de clave para cachés
+_versions = itertools.count(1)
+
 
 class Graph:
     def __init__(self):
         self.adjacency_list = {}  # Para almacenar los vértices y sus conexiones
         self.edge_weights = {}    # Para almacenar los pesos de las aristas
+        self._vertex_ids = {}     # Tabla de símbolos: nombre -> id entero denso
+        self._vertex_names = []   # Nombre de cada vértice indexado por id
+        self._roles = []          # Rol de cada vértice indexado por id
+        self._positions = {}      # Posición geográfica (lat, lon) por vértice
+        self._components = UnionFind()  # Componentes conexas (sin dirección) por id
+        self._csr = None          # Representación CSR, se reconstruye tras cambios
+        self._all_pairs = None    # Tabla de caminos más cortos entre todos los pares
+        self._path_trees = ShortestPathTreeCache(self)  # Árboles de caminos por origen
+        self._charging_overlays = {}  # Grafo de estaciones de recarga por autonomía
+        self._edge_objects = {}   # Objetos Edge compartidos por (inicio, fin)
+        self._edge_list = None    # Lista de edges() calculada una sola vez
+        self.version = next(_versions)  # Cambia con cada modificación del grafo
+        self._journal = None      # Registro acotado de modificaciones (opcional)
+        self._journal_floor = None  # Versión desde la que el registro está completo
+
+    @classmethod
+    def from_csr(cls, csr):
+        """
+        Reconstruye un grafo a partir de su representación CSR, conservando
+        los ids, roles y posiciones. El CSR recibido queda como caché.
+        
+        Args:
+            csr: Grafo CSR
+            
+        Returns:
+            Graph: Grafo equivalente
+        """
+        graph = cls()
+        names = csr.names
+        graph._vertex_names = list(names)
+        graph._vertex_ids = dict(csr.index)
+        graph._roles = csr.roles.tolist()
+        sources, targets, weights = csr.edge_arrays()
+        offsets = csr.offsets.tolist()
+        target_names = [names[v] for v in targets.tolist()]
+        graph.adjacency_list = {name: set(target_names[offsets[u]:offsets[u + 1]])
+                                for u, name in enumerate(names)}
+        graph.edge_weights = dict(zip(zip([names[u] for u in sources.tolist()], target_names),
+                                      weights.tolist()))
+        graph._components = UnionFind.from_labels(
+            component_labels(len(names), sources, targets).tolist())
+        if csr.coordinates is not None:
+            for name, (lat, lon) in zip(names, csr.coordinates.tolist()):
+                if lat == lat and lon == lon:  # Omitir posiciones NaN
+                    graph._positions[name] = (lat, lon)
+        graph._csr = csr
+        return graph
+
+    def _invalidate(self):
+        """Descarta las estructuras derivadas tras una modificación del grafo."""
+        self._csr = None
+        self._all_pairs = None
+        self._path_trees.invalidate()
+        self._charging_overlays = {}
+        self._edge_list = None
+
+    def _record(self, kind, **data):
+        """
+        Registra una modificación: avanza la versión y, si el registro está
+        activo, guarda el cambio.
+        
+        Args:
+            kind: Tipo de cambio ('add_vertex', 'set_role', 'add_edge',
+                'update_edge_weight' o 'set_position')
+            **data: Datos del cambio
+        """
+        self.version = next(_versions)
+        journal = self._journal
+        if journal is not None:
+            if len(journal) == journal.maxlen:
+                # El cambio más antiguo se descarta: el registro ya no cubre
+                # las versiones anteriores a él
+                self._journal_floor = journal[0]['version']
+            data['version'] = self.version
+            data['kind'] = kind
+            journal.append(data)
+
+    def enable_journal(self, maxlen=10000):
+        """
+        Activa el registro de modificaciones, acotado a los últimos cambios.
+        Solo cubre los cambios posteriores a la activación; si ya estaba
+        activo no hace nada.
+        
+        Args:
+            maxlen: Cantidad máxima de cambios guardados
+        """
+        if self._journal is not None:
+            return
+        self._journal = deque(maxlen=maxlen)
+        self._journal_floor = self.version
+
+    def changes_since(self, version):
+        """
+        Cambios posteriores a una versión del grafo, para que cachés y
+        estructuras derivadas apliquen solo las diferencias.
+        
+        Args:
+            version: Versión conocida por quien consulta
+            
+        Returns:
+            list: Cambios en orden (diccionarios con 'version', 'kind' y sus
+            datos), o None si el registro no los cubre y hay que reconstruir
+        """
+        if version == self.version:
+            return []
+        if self._journal is None or version < self._journal_floor:
+            return None
+        return [change for change in self._journal if change['version'] > version]
+
+    def to_csr(self):
+        """
+        Obtiene la representación CSR del grafo, construyéndola solo si el
+        grafo cambió desde la última llamada.
+        
+        Returns:
+            CSRGraph: Grafo compacto con identificadores enteros
+        """
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
+
+    def all_pairs_shortest_paths(self):
+        """
+        Obtiene la tabla de caminos más cortos entre todos los pares,
+        calculándola una sola vez mientras el grafo no cambie.
+        
+        Returns:
+            AllPairsShortestPaths: Matrices de distancias y siguiente salto
+        """
+        if self._all_pairs is None:
+            self._all_pairs = AllPairsShortestPaths(self)
+        return self._all_pairs
+
+    def shortest_path_trees(self):
+        """
+        Obtiene la cache de árboles de caminos más cortos por origen. Los
+        árboles se descartan automáticamente cuando el grafo cambia.
+        
+        Returns:
+            ShortestPathTreeCache: Cache de árboles del grafo
+        """
+        return self._path_trees
+
+    def charging_overlay(self, autonomy=50):
+        """
+        Obtiene el grafo superpuesto de estaciones de recarga para una
+        autonomía, construyéndolo una sola vez mientras el grafo no cambie.
+        
+        Args:
+            autonomy: Autonomía máxima del dron
+            
+        Returns:
+            ChargingOverlay: Grafo de estaciones de recarga y almacenes
+        """
+        overlay = self._charging_overlays.get(autonomy)
+        if overlay is None:
+            overlay = self._charging_overlays[autonomy] = ChargingOverlay(self, autonomy)
+        return overlay
+
+    def floyd_warshall_shortest_path(self, start, end):
+        """
+        Obtiene el camino más corto desde la tabla de todos los pares. En
+        grafos con más de ALL_PAIRS_MAX_VERTICES vértices, donde la tabla no
+        cabe en memoria, usa una búsqueda de Dijkstra para el par.
+        
+        Args:
+            start: Vértice de inicio
+            end: Vértice de destino
+            
+        Returns:
+            tuple: (camino, costo); el camino es None si no hay ruta
+        """
+        if self.to_csr().num_vertices() > ALL_PAIRS_MAX_VERTICES:
+            return self.dijkstra_shortest_path(start, end)
+        return self.all_pairs_shortest_paths().path(start, end)
+
+    def dijkstra_shortest_path(self, start, end):
+        """
+        Obtiene el camino más corto con Dijkstra (sin restricción de autonomía).
+        
+        Args:
+            start: Vértice de inicio
+            end: Vértice de destino
+            
+        Returns:
+            tuple: (camino, costo); el camino es None si no hay ruta
+        """
+        from .algorithms import DijkstraAlgorithm
+        path, cost, _ = DijkstraAlgorithm(self).find_shortest_path(start, end, consider_charging=False)
+        return (path if path else None), cost
 
-    def add_vertex(self, vertex):
+    def add_vertex(self, vertex, role=None):
         """
-        Agrega un vértice al grafo si no existe.
+        Agrega un vértice al grafo si no existe y le asigna un id entero denso.
         
         Args:
             vertex: Identificador del vértice
+            role: Rol del vértice (constante de roles o 'storage', 'charging',
+                'client'). Si se omite, se deduce del prefijo del nombre.
         """
         if vertex not in self.adjacency_list:
             self.adjacency_list[vertex] = set()
+            self._vertex_ids[vertex] = len(self._vertex_names)
+            self._vertex_names.append(vertex)
+            self._roles.append(infer_role(vertex) if role is None else role_from_name(role))
+            self._components.add()
+            self._invalidate()
+            self._record('add_vertex', vertex=vertex, role=self._roles[-1])
+        elif role is not None:
+            self.set_role(vertex, role)
 
     def add_edge(self, start, end, weight=1):
         """
@@ -29,9 +244,239 @@ class Graph:
         self.add_vertex(start)
         self.add_vertex(end)
         
+        old_weight = self.edge_weights.get((start, end))
+        if old_weight is not None and old_weight == weight:
+            return
+        
         # Agregar la conexión y el peso
         self.adjacency_list[start].add(end)
         self.edge_weights[(start, end)] = weight
+        self._edge_objects.pop((start, end), None)
+        self._components.union(self._vertex_ids[start], self._vertex_ids[end])
+        self._invalidate()
+        self._record('add_edge', start=start, end=end, weight=weight, old_weight=old_weight)
+
+    def update_edge_weight(self, start, end, weight):
+        """
+        Cambia el peso de una arista existente. El CSR se modifica en el lugar
+        y los árboles de caminos calculados se reparan de forma incremental en
+        vez de descartarse; la tabla de todos los pares y los grafos de
+        estaciones de recarga sí se descartan.
+        
+        Args:
+            start: Vértice de inicio
+            end: Vértice de fin
+            weight: Nuevo peso
+            
+        Returns:
+            dict: Origen -> lista de destinos cuyo camino o costo cambió en
+            los árboles de caminos calculados
+            
+        Raises:
+            ValueError: Si la arista no existe
+        """
+        if (start, end) not in self.edge_weights:
+            raise ValueError(f"No existe la arista {start} -> {end}")
+        old_weight = self.edge_weights[(start, end)]
+        if old_weight == weight:
+            return {}
+        
+        self.edge_weights[(start, end)] = weight
+        self._edge_objects.pop((start, end), None)
+        self._edge_list = None
+        u, v = self._vertex_ids[start], self._vertex_ids[end]
+        if self._csr is not None:
+            self._csr.set_weight(u, v, weight)
+        self._all_pairs = None
+        self._charging_overlays = {}
+        
+        self._record('update_edge_weight', start=start, end=end, weight=weight, old_weight=old_weight)
+        
+        report = self._path_trees.update_edge(u, v, old_weight, weight)
+        names = self._vertex_names
+        return {source: sorted(names[i] for i in changed) for source, changed in report.items()}
+
+    def is_connected(self):
+        """
+        Verifica si el grafo es conexo ignorando la dirección de las aristas.
+        Se mantiene de forma incremental, sin recorrer el grafo.
+        
+        Returns:
+            bool: True si hay a lo sumo una componente
+        """
+        return self._components.components <= 1
+
+    def component_count(self):
+        """
+        Cantidad de componentes conexas, ignorando la dirección de las aristas.
+        
+        Returns:
+            int: Cantidad de componentes
+        """
+        return self._components.components
+
+    def same_component(self, start, end):
+        """
+        Verifica si dos vértices están en la misma componente conexa. Si no lo
+        están no existe ninguna ruta entre ellos, así que los algoritmos de
+        rutas pueden descartar el par sin buscar.
+        
+        Args:
+            start: Vértice de inicio
+            end: Vértice de fin
+            
+        Returns:
+            bool: True si ambos existen y están conectados
+        """
+        u = self._vertex_ids.get(start)
+        v = self._vertex_ids.get(end)
+        if u is None or v is None:
+            return False
+        return self._components.connected(u, v)
+
+    def component_size(self, vertex):
+        """
+        Cantidad de vértices de la componente de un vértice.
+        
+        Args:
+            vertex: Identificador del vértice
+            
+        Returns:
+            int: Tamaño de la componente (0 si el vértice no existe)
+        """
+        u = self._vertex_ids.get(vertex)
+        return 0 if u is None else self._components.component_size(u)
+
+    def vertex_id(self, vertex):
+        """
+        Obtiene el id entero asignado a un vértice.
+        
+        Args:
+            vertex: Identificador del vértice
+            
+        Returns:
+            int: Id denso del vértice o None si no existe
+        """
+        return self._vertex_ids.get(vertex)
+
+    def vertex_name(self, vertex_id):
+        """
+        Obtiene el identificador de un vértice a partir de su id entero.
+        
+        Args:
+            vertex_id: Id denso del vértice
+            
+        Returns:
+            Identificador del vértice
+        """
+        return self._vertex_names[vertex_id]
+
+    def set_role(self, vertex, role):
+        """
+        Asigna el rol de un vértice existente.
+        
+        Args:
+            vertex: Identificador del vértice
+            role: Rol (constante de roles o nombre de tipo)
+        """
+        vertex_id = self._vertex_ids[vertex]
+        role = role_from_name(role)
+        old_role = self._roles[vertex_id]
+        if old_role != role:
+            self._roles[vertex_id] = role
+            self._invalidate()
+            self._record('set_role', vertex=vertex, role=role, old_role=old_role)
+
+    def get_role(self, vertex):
+        """
+        Obtiene el rol entero de un vértice.
+        
+        Args:
+            vertex: Identificador del vértice
+            
+        Returns:
+            int: Rol del vértice (ROLE_UNKNOWN si no existe)
+        """
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            return ROLE_UNKNOWN
+        return self._roles[vertex_id]
+
+    def get_node_type(self, vertex):
+        """
+        Obtiene el tipo de un vértice como texto.
+        
+        Args:
+            vertex: Identificador del vértice
+            
+        Returns:
+            str: 'storage', 'charging', 'client' o 'unknown'
+        """
+        return ROLE_NAMES[self.get_role(vertex)]
+
+    def vertices_with_role(self, role):
+        """
+        Obtiene los vértices que tienen un rol dado.
+        
+        Args:
+            role: Rol (constante de roles o nombre de tipo)
+            
+        Returns:
+            list: Lista de vértices con ese rol
+        """
+        role = role_from_name(role)
+        names = self._vertex_names
+        return [names[i] for i, r in enumerate(self._roles) if r == role]
+
+    def set_position(self, vertex, lat, lon):
+        """
+        Asigna la posición geográfica de un vértice existente.
+        
+        Args:
+            vertex: Identificador del vértice
+            lat: Latitud en grados
+            lon: Longitud en grados
+        """
+        if vertex not in self.adjacency_list:
+            raise ValueError(f'El vértice {vertex} no existe')
+        position = (float(lat), float(lon))
+        if self._positions.get(vertex) != position:
+            self._positions[vertex] = position
+            # Las posiciones no cambian distancias: solo se reconstruye el CSR
+            self._csr = None
+            self._record('set_position', vertex=vertex, lat=position[0], lon=position[1])
+
+    def set_positions(self, positions):
+        """
+        Asigna posiciones a varios vértices; ignora los que no existen.
+        
+        Args:
+            positions: Diccionario vértice -> (lat, lon)
+        """
+        for vertex, (lat, lon) in positions.items():
+            if vertex in self.adjacency_list:
+                self.set_position(vertex, lat, lon)
+
+    def get_position(self, vertex):
+        """
+        Obtiene la posición geográfica de un vértice.
+        
+        Args:
+            vertex: Identificador del vértice
+            
+        Returns:
+            tuple: (lat, lon) o None si el vértice no tiene posición
+        """
+        return self._positions.get(vertex)
+
+    def positions(self):
+        """
+        Obtiene las posiciones de todos los vértices que tienen una.
+        
+        Returns:
+            dict: Diccionario vértice -> (lat, lon)
+        """
+        return dict(self._positions)
 
     def vertices(self):
         """
@@ -65,10 +510,14 @@ class Graph:
         Returns:
             Edge: Objeto Edge si existe la arista, None en caso contrario
         """
-        weight = self.edge_weights.get((start, end))
-        if weight is not None:
-            return Edge(start, end, weight)
-        return None
+        edge = self._edge_objects.get((start, end))
+        if edge is None:
+            weight = self.edge_weights.get((start, end))
+            if weight is None:
+                return None
+            # Se crea un solo objeto por arista y se reutiliza en cada consulta
+            edge = self._edge_objects[(start, end)] = Edge(start, end, weight)
+        return edge
 
     def has_edge(self, start, end):
         """
@@ -105,60 +554,89 @@ class Graph:
         """
         return f"Graph(vertices={list(self.adjacency_list.keys())}, edges={self.edge_weights})"
 
-    def edges(self):
-        edges = []
-        seen = set()  # Para evitar duplicados en grafos no dirigidos
-        for start in self.adjacency_list:
-            for end in self.adjacency_list[start]:
-                if (start, end) not in seen and (end, start) not in seen:
-                    weight = self.edge_weights.get((start, end), 1)
-                    edge = Edge(start, end, weight)
-                    edges.append(edge)
-                    seen.add((start, end))
-        return edges
-
-    def bfs(self, start):
-        visited = set()
-        queue = [start]
-        result = []
-
-        while queue:
-            vertex = queue.pop(0)
-            if vertex not in visited:
-                visited.add(vertex)
-                result.append(vertex)
-                queue.extend(set(self.adjacency_list.get(vertex, [])) - visited)
+    def iter_edges(self, directed=False):
+        """
+        Recorre las aristas como tuplas (inicio, fin, peso) sin crear objetos
+        Edge. Sin dirección, de cada par con aristas en ambos sentidos se
+        entrega solo la primera encontrada, igual que edges().
+        
+        Args:
+            directed: Si entregar todas las aristas dirigidas
+            
+        Yields:
+            tuple: (inicio, fin, peso)
+        """
+        weights = self.edge_weights
+        ids = self._vertex_ids
+        for start, neighbors in self.adjacency_list.items():
+            start_id = ids[start]
+            for end in neighbors:
+                # Los vértices se recorren en orden de id: la arista inversa
+                # ya se entregó si su inicio tiene un id menor
+                if directed or start == end or (end, start) not in weights or start_id < ids[end]:
+                    yield start, end, weights[(start, end)]
 
-        return result
+    def num_edges(self, directed=False):
+        """
+        Cantidad de aristas.
+        
+        Args:
+            directed: Si contar por separado las aristas en ambos sentidos
+            
+        Returns:
+            int: Cantidad de aristas
+        """
+        if directed:
+            return len(self.edge_weights)
+        return sum(1 for _ in self.iter_edges())
 
-    def dfs(self, start, visited=None):
-        if visited is None:
-            visited = set()
-        visited.add(start)
-        result = [start]
+    def edges(self):
+        """
+        Lista de aristas sin duplicar los pares con aristas en ambos sentidos.
+        Los objetos Edge se comparten con get_edge y la lista se calcula una
+        sola vez mientras el grafo no cambie.
+        
+        Returns:
+            list: Objetos Edge
+        """
+        if self._edge_list is None:
+            get_edge = self.get_edge
+            self._edge_list = [get_edge(start, end) for start, end, _ in self.iter_edges()]
+        return list(self._edge_list)
 
-        for neighbor in self.adjacency_list.get(start, []):
-            if neighbor not in visited:
-                result.extend(self.dfs(neighbor, visited))
+    def bfs(self, start):
+        """
+        Recorrido en anchura desde un vértice (ver traversal.bfs para la
+        versión perezosa con varios orígenes, límite de profundidad y corte).
+        
+        Args:
+            start: Vértice de origen
+            
+        Returns:
+            list: Vértices en orden de visita
+        """
+        return list(traversal.bfs(self, start))
 
-        return result
+    def dfs(self, start):
+        """
+        Recorrido en profundidad desde un vértice, iterativo.
+        
+        Args:
+            start: Vértice de origen
+            
+        Returns:
+            list: Vértices en orden de visita
+        """
+        return list(traversal.dfs(self, start))
 
     def topological_sort(self):
-        visited = set()
-        stack = []
-
-        def dfs(vertex):
-            visited.add(vertex)
-            for neighbor in self.adjacency_list.get(vertex, []):
-                if neighbor not in visited:
-                    dfs(neighbor)
-            stack.append(vertex)
-
-        for vertex in self.adjacency_list:
-            if vertex not in visited:
-                dfs(vertex)
-
-        return stack[::-1] 
+        """
+        Orden topológico de los vértices, iterativo.
+        
+        Returns:
+            list: Vértices en orden topológico si el grafo es acíclico
+        """
+        return traversal.topological_sort(self)
 
     def has_vertex(self, vertex):
         """
@@ -200,34 +678,15 @@ class Graph:
             return list(self.adjacency_list[vertex])
         return [] 
 
-    def kruskal_mst(self):
+    def kruskal_mst(self, method="auto"):
         """
-        Calcula el árbol de expansión mínima (MST) usando el algoritmo de Kruskal.
+        Calcula el árbol de expansión mínima (MST) con el módulo mst, que
+        elige entre Kruskal, Prim y Borůvka según la densidad del grafo.
+        
+        Args:
+            method: Implementación: "auto", "kruskal", "prim" o "boruvka"
+            
         Returns:
             List[Tuple[str, str, float]]: Lista de aristas (u, v, peso) del MST
         """
-        parent = {v: v for v in self.vertices()}
-        rank = {v: 0 for v in self.vertices()}
-        def find(v):
-            while parent[v] != v:
-                parent[v] = parent[parent[v]]
-                v = parent[v]
-            return v
-        def union(u, v):
-            ru, rv = find(u), find(v)
-            if ru == rv:
-                return False
-            if rank[ru] < rank[rv]:
-                parent[ru] = rv
-            else:
-                parent[rv] = ru
-                if rank[ru] == rank[rv]:
-                    rank[ru] += 1
-            return True
-        edges = [(e.start(), e.end(), e.element()) for e in self.edges()]
-        edges.sort(key=lambda x: x[2])
-        mst = []
-        for u, v, w in edges:
-            if union(u, v):
-                mst.append((u, v, w))
-        return mst 
\ No newline at end of file
+        return mst_edge_list(self, method) 
\ No newline at end of file
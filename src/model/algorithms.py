@@ -4,9 +4,21 @@ Incluye Dijkstra para rutas más cortas y Kruskal para árbol de expansión mín
 """
 
 import heapq
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterable, List, Tuple, Optional, Set
 from .Graph import Graph
 from .Edge import Edge
+from .roles import ROLE_CHARGING, ROLE_UNKNOWN
+from .geo import haversine
+from .mst import mst_edge_list
+from .charging_overlay import disconnected_result
+from .route_cache import route_cache
+
+# Algoritmos de optimize_route cuyas rutas se guardan en la caché compartida
+ROUTE_CACHE_ALGORITHMS = ("dijkstra", "astar", "bidirectional", "k_shortest", "floyd_warshall")
+
+# Peso máximo para usar la cola de cubetas de Dial: hay una cubeta por valor
+# posible de peso, y se recorre una cubeta por unidad de distancia
+DIAL_MAX_WEIGHT = 256
 
 
 class DijkstraAlgorithm:
@@ -15,16 +27,35 @@ class DijkstraAlgorithm:
     entre dos nodos en un grafo ponderado.
     """
     
-    def __init__(self, graph: Graph):
+    def __init__(self, graph: Graph, queue: str = "auto"):
         """
         Inicializa el algoritmo con un grafo.
         
         Args:
-            graph: Grafo sobre el cual ejecutar el algoritmo
+            graph: Grafo (Graph o CSRGraph) sobre el cual ejecutar el algoritmo
+            queue: Cola de prioridad: "heap", "dial" o "auto" (dial cuando todos
+                los pesos son enteros pequeños no negativos)
         """
+        if queue not in ("auto", "heap", "dial"):
+            raise ValueError(f'Cola "{queue}" no soportada')
         self.graph = graph
+        self.queue = queue
         self.MAX_AUTONOMY = 50  # Autonomía máxima del dron
     
+    def queue_kind(self) -> str:
+        """
+        Cola de prioridad que usará la búsqueda sobre el grafo actual.
+        
+        Returns:
+            str: "dial" o "heap"
+        """
+        if self.queue != "auto":
+            if self.queue == "dial" and self.graph.to_csr().integer_weight_bound() is None:
+                raise ValueError('La cola "dial" requiere pesos enteros no negativos')
+            return self.queue
+        bound = self.graph.to_csr().integer_weight_bound()
+        return "dial" if bound is not None and bound <= DIAL_MAX_WEIGHT else "heap"
+    
     def find_shortest_path(self, start: str, end: str, 
                           consider_charging: bool = True) -> Tuple[List[str], float, Dict]:
         """
@@ -38,64 +69,198 @@ class DijkstraAlgorithm:
         Returns:
             Tuple con (camino, costo_total, información_adicional)
         """
-        if not self.graph.has_vertex(start) or not self.graph.has_vertex(end):
+        csr = self.graph.to_csr()
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None:
             return [], float('inf'), {}
+        if self._disconnected(start, end):
+            return [], float('inf'), self._no_route_info()
+        
+        distances, previous, settled = self.search(source, (target,), consider_charging)
+        
+        # Reconstruir el camino
+        path = self._reconstruct_path(previous, csr.names, source, target)
+        total_cost = distances[target]
+        
+        # Información adicional
+        info = {
+            'total_cost': total_cost,
+            'charging_stations': self._get_charging_stations_in_path(path) if path else [],
+            'autonomy_respected': self._check_autonomy_respect(path, total_cost),
+            'path_length': len(path) if path else 0,
+            'expanded_nodes': len(settled),
+            'queue': self.queue_kind()
+        }
+        
+        return path, total_cost, info
+    
+    def search(self, source: int, targets: Optional[Iterable[int]] = None,
+               consider_charging: bool = True) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Ejecuta Dijkstra desde un vértice sobre la representación CSR.
+        
+        Args:
+            source: Id del vértice de inicio
+            targets: Ids de destino; la búsqueda termina cuando todos quedan
+                fijados. Si es None se calcula el árbol completo.
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (distancias, id_anterior, ids_en_orden_de_fijación),
+            indexados por id de vértice (-1 si no hay anterior)
+        """
+        if self.queue_kind() == "dial":
+            return self._search_dial(source, targets, consider_charging)
         
-        # Inicialización
-        distances = {vertex: float('inf') for vertex in self.graph.vertices()}
-        distances[start] = 0
-        previous = {vertex: None for vertex in self.graph.vertices()}
-        visited = set()
+        csr = self.graph.to_csr()
+        offsets, targets_list, weights = csr.as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
         
-        # Cola de prioridad: (distancia, nodo)
-        pq = [(0, start)]
+        # Inicialización sobre arreglos indexados por id de vértice
+        n = csr.num_vertices()
+        distances = [float('inf')] * n
+        distances[source] = 0
+        previous = [-1] * n
+        visited = bytearray(n)
+        settled = []
+        pending = set(targets) if targets is not None else None
+        
+        # Cola de prioridad: (distancia, id_nodo)
+        pq = [(0, source)]
         
         while pq:
-            current_distance, current_vertex = heapq.heappop(pq)
+            current_distance, u = heapq.heappop(pq)
             
-            if current_vertex in visited:
+            if visited[u]:
                 continue
                 
-            visited.add(current_vertex)
+            visited[u] = 1
+            settled.append(u)
             
-            # Si llegamos al destino, terminamos
-            if current_vertex == end:
-                break
+            # Si llegamos a todos los destinos, terminamos
+            if pending is not None:
+                pending.discard(u)
+                if not pending:
+                    break
             
-            # Explorar vecinos
-            for neighbor in self.graph.get_neighbors(current_vertex):
-                if neighbor in visited:
+            # Explorar vecinos en la fila CSR del nodo actual
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets_list[k]
+                if visited[v]:
                     continue
                 
-                edge_weight = self.graph.get_edge_weight(current_vertex, neighbor)
-                if edge_weight is None:
-                    continue
+                edge_weight = weights[k]
                 
-                # Verificar autonomía si es necesario
-                if consider_charging and not self._can_reach_with_autonomy(
-                    current_vertex, neighbor, current_distance):
+                # Verificar autonomía si es necesario: solo las estaciones de
+                # recarga admiten tramos más largos que la autonomía
+                if consider_charging and edge_weight > autonomy and roles[v] != ROLE_CHARGING:
                     continue
                 
                 new_distance = current_distance + edge_weight
                 
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    previous[neighbor] = current_vertex
-                    heapq.heappush(pq, (new_distance, neighbor))
+                if new_distance < distances[v]:
+                    distances[v] = new_distance
+                    previous[v] = u
+                    heapq.heappush(pq, (new_distance, v))
         
-        # Reconstruir el camino
-        path = self._reconstruct_path(previous, start, end)
-        total_cost = distances[end] if distances[end] != float('inf') else float('inf')
+        return distances, previous, settled
+    
+    def _search_dial(self, source: int, targets: Optional[Iterable[int]] = None,
+                     consider_charging: bool = True) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Dijkstra con la cola de cubetas de Dial, para pesos enteros en 0..C.
+        Las distancias pendientes están siempre entre d y d + C, así que basta
+        un arreglo circular de C + 1 cubetas: insertar y extraer son O(1) y no
+        se comparan tuplas.
         
-        # Información adicional
-        info = {
-            'total_cost': total_cost,
-            'charging_stations': self._get_charging_stations_in_path(path) if path else [],
-            'autonomy_respected': self._check_autonomy_respect(path, total_cost),
-            'path_length': len(path) if path else 0
-        }
+        Args:
+            source: Id del vértice de inicio
+            targets: Ids de destino (None para el árbol completo)
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (distancias, id_anterior, ids_en_orden_de_fijación)
+        """
+        csr = self.graph.to_csr()
+        offsets, targets_list, weights = csr.as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
         
-        return path, total_cost, info
+        n = csr.num_vertices()
+        distances = [float('inf')] * n
+        distances[source] = 0
+        previous = [-1] * n
+        visited = bytearray(n)
+        settled = []
+        pending = set(targets) if targets is not None else None
+        
+        size = csr.integer_weight_bound() + 1
+        buckets = [[] for _ in range(size)]
+        buckets[0].append(source)
+        queued = 1
+        current_distance = 0
+        
+        while queued:
+            bucket = buckets[current_distance % size]
+            while bucket:
+                u = bucket.pop()
+                queued -= 1
+                
+                # Entradas obsoletas: ya fijado o mejorado después de encolarse
+                if visited[u] or distances[u] != current_distance:
+                    continue
+                
+                visited[u] = 1
+                settled.append(u)
+                
+                if pending is not None:
+                    pending.discard(u)
+                    if not pending:
+                        return distances, previous, settled
+                
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets_list[k]
+                    if visited[v]:
+                        continue
+                    
+                    edge_weight = weights[k]
+                    if consider_charging and edge_weight > autonomy and roles[v] != ROLE_CHARGING:
+                        continue
+                    
+                    new_distance = current_distance + edge_weight
+                    if new_distance < distances[v]:
+                        distances[v] = new_distance
+                        previous[v] = u
+                        buckets[new_distance % size].append(v)
+                        queued += 1
+            current_distance += 1
+        
+        return distances, previous, settled
+    
+    def _disconnected(self, start: str, end: str) -> bool:
+        """
+        Verifica si el grafo ya sabe que no hay ruta: los nodos existen pero
+        están en componentes conexas distintas. Así se descarta el par sin
+        agotar una búsqueda.
+        
+        Returns:
+            bool: True si no puede existir ruta entre los nodos
+        """
+        same_component = getattr(self.graph, 'same_component', None)
+        return (same_component is not None and self.graph.has_vertex(start)
+                and self.graph.has_vertex(end) and not same_component(start, end))
+    
+    def _no_route_info(self) -> Dict:
+        """Información adicional de una consulta sin ruta."""
+        return {
+            'total_cost': float('inf'),
+            'charging_stations': [],
+            'autonomy_respected': False,
+            'path_length': 0,
+            'expanded_nodes': 0
+        }
     
     def _can_reach_with_autonomy(self, current: str, neighbor: str, 
                                 current_distance: float) -> bool:
@@ -115,33 +280,35 @@ class DijkstraAlgorithm:
             return False
         
         # Si el vecino es una estación de recarga, siempre se puede llegar
-        if neighbor.startswith('C'):
+        if self.graph.get_role(neighbor) == ROLE_CHARGING:
             return True
         
         # Verificar si la autonomía es suficiente
         return edge_weight <= self.MAX_AUTONOMY
     
-    def _reconstruct_path(self, previous: Dict[str, Optional[str]], 
-                         start: str, end: str) -> List[str]:
+    def _reconstruct_path(self, previous: List[int], names: List[str],
+                         start: int, end: int) -> List[str]:
         """
-        Reconstruye el camino desde el diccionario de nodos anteriores.
+        Reconstruye el camino desde el arreglo de nodos anteriores.
         
         Args:
-            previous: Diccionario de nodos anteriores
-            start: Nodo de inicio
-            end: Nodo de destino
+            previous: Id del nodo anterior de cada vértice (-1 si no tiene),
+                en lista o diccionario indexado por id
+            names: Nombres de los vértices indexados por id
+            start: Id del nodo de inicio
+            end: Id del nodo de destino
             
         Returns:
             Lista de nodos que forman el camino
         """
-        if previous[end] is None and end != start:
+        if previous[end] == -1 and end != start:
             return []  # No hay camino
         
         path = []
         current = end
         
-        while current is not None:
-            path.append(current)
+        while current != -1:
+            path.append(names[current])
             current = previous[current]
         
         return path[::-1]  # Invertir para obtener el orden correcto
@@ -156,7 +323,8 @@ class DijkstraAlgorithm:
         Returns:
             Lista de estaciones de recarga en el camino
         """
-        return [node for node in path if node.startswith('C')]
+        get_role = self.graph.get_role
+        return [node for node in path if get_role(node) == ROLE_CHARGING]
     
     def _check_autonomy_respect(self, path: List[str], total_cost: float) -> bool:
         """
@@ -182,90 +350,739 @@ class DijkstraAlgorithm:
         return total_cost <= self.MAX_AUTONOMY
 
 
-class KruskalMST:
+class AStarAlgorithm(DijkstraAlgorithm):
     """
-    Implementación del algoritmo de Kruskal para encontrar el árbol de expansión mínima.
+    A* sobre la representación CSR, guiado por la distancia geográfica al
+    destino. La heurística es ``escala × haversine(v, destino)``, donde la
+    escala es la menor relación peso / distancia de las aristas del grafo, de
+    modo que nunca sobreestima el costo restante y el camino es óptimo.
+    Sin posiciones completas la heurística es 0 y equivale a Dijkstra.
     """
     
-    def __init__(self, graph: Graph):
+    def find_shortest_path(self, start: str, end: str,
+                          consider_charging: bool = True) -> Tuple[List[str], float, Dict]:
         """
-        Inicializa el algoritmo con un grafo.
+        Encuentra el camino más corto entre dos nodos con A*.
         
         Args:
-            graph: Grafo sobre el cual ejecutar el algoritmo
+            start: Nodo de inicio
+            end: Nodo de destino
+            consider_charging: Si considerar estaciones de recarga
+            
+        Returns:
+            Tuple con (camino, costo_total, información_adicional)
         """
-        self.graph = graph
+        csr = self.graph.to_csr()
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None:
+            return [], float('inf'), {}
+        if self._disconnected(start, end):
+            return [], float('inf'), self._no_route_info()
+        
+        distances, previous, settled = self.search_to(source, target, consider_charging)
+        
+        if target in previous:
+            path = self._reconstruct_path(previous, csr.names, source, target)
+        else:
+            path = []
+        total_cost = distances.get(target, float('inf'))
+        
+        info = {
+            'total_cost': total_cost,
+            'charging_stations': self._get_charging_stations_in_path(path) if path else [],
+            'autonomy_respected': self._check_autonomy_respect(path, total_cost),
+            'path_length': len(path) if path else 0,
+            'expanded_nodes': len(settled)
+        }
+        
+        return path, total_cost, info
     
-    def find_mst(self) -> Tuple[List[Edge], float]:
+    def search_to(self, source: int, target: int,
+                  consider_charging: bool = True) -> Tuple[Dict[int, float], Dict[int, int], List[int]]:
         """
-        Encuentra el árbol de expansión mínima usando Kruskal.
+        Ejecuta A* desde un vértice hasta un destino sobre la representación CSR.
         
+        Args:
+            source: Id del vértice de inicio
+            target: Id del vértice de destino
+            consider_charging: Si considerar la restricción de autonomía
+            
         Returns:
-            Tuple con (lista_de_aristas_del_mst, costo_total)
+            Tuple con (distancias, id_anterior, ids_en_orden_de_fijación).
+            Las distancias y anteriores solo incluyen los vértices alcanzados.
         """
-        # Obtener todas las aristas del grafo
-        edges = self.graph.edges()
+        csr = self.graph.to_csr()
+        offsets, targets_list, weights = csr.as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
         
-        # Ordenar aristas por peso
-        edges.sort(key=lambda edge: edge.element())
+        scale = csr.heuristic_scale()
+        if scale > 0:
+            coordinates = csr.coordinate_list()
+            target_lat, target_lon = coordinates[target]
+        estimates: Dict[int, float] = {}
         
-        # Estructura Union-Find para detectar ciclos
-        parent = {vertex: vertex for vertex in self.graph.vertices()}
-        rank = {vertex: 0 for vertex in self.graph.vertices()}
+        def heuristic(v: int) -> float:
+            # Cota inferior del costo de v al destino, calculada una vez por nodo
+            h = estimates.get(v)
+            if h is None:
+                if scale > 0:
+                    lat, lon = coordinates[v]
+                    h = scale * haversine(lat, lon, target_lat, target_lon)
+                else:
+                    h = 0.0
+                estimates[v] = h
+            return h
         
-        mst_edges = []
-        total_cost = 0
+        # Solo se guardan los vértices alcanzados: en grafos grandes A*
+        # visita una fracción de la red
+        distances: Dict[int, float] = {source: 0}
+        previous: Dict[int, int] = {source: -1}
+        closed = set()
+        settled = []
         
-        for edge in edges:
-            start, end = edge.endpoints()
+        # Cola de prioridad: (distancia + heurística, distancia, id_nodo)
+        pq = [(heuristic(source), 0, source)]
+        
+        while pq:
+            _, current_distance, u = heapq.heappop(pq)
+            
+            if u in closed:
+                continue
+            
+            closed.add(u)
+            settled.append(u)
             
-            # Verificar si agregar esta arista crearía un ciclo
-            if self._find(parent, start) != self._find(parent, end):
-                mst_edges.append(edge)
-                total_cost += edge.element()
-                self._union(parent, rank, start, end)
+            if u == target:
+                break
+            
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets_list[k]
+                if v in closed:
+                    continue
+                
+                edge_weight = weights[k]
+                
+                if consider_charging and edge_weight > autonomy and roles[v] != ROLE_CHARGING:
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                
+                if new_distance < distances.get(v, float('inf')):
+                    distances[v] = new_distance
+                    previous[v] = u
+                    heapq.heappush(pq, (new_distance + heuristic(v), new_distance, v))
         
-        return mst_edges, total_cost
+        return distances, previous, settled
+
+
+class BidirectionalDijkstra(DijkstraAlgorithm):
+    """
+    Dijkstra bidireccional: avanza desde el origen sobre el grafo y desde el
+    destino sobre el grafo invertido, expandiendo siempre el lado con menor
+    distancia en la cima de su cola. Termina cuando la suma de ambas cimas
+    alcanza el mejor costo de encuentro conocido, lo que garantiza el óptimo.
+    """
     
-    def _find(self, parent: Dict[str, str], vertex: str) -> str:
+    def find_shortest_path(self, start: str, end: str,
+                          consider_charging: bool = True) -> Tuple[List[str], float, Dict]:
         """
-        Encuentra la raíz del conjunto al que pertenece un vértice.
+        Encuentra el camino más corto entre dos nodos con búsqueda bidireccional.
         
         Args:
-            parent: Diccionario de padres
-            vertex: Vértice a buscar
+            start: Nodo de inicio
+            end: Nodo de destino
+            consider_charging: Si considerar estaciones de recarga
             
         Returns:
-            Raíz del conjunto
+            Tuple con (camino, costo_total, información_adicional); la
+            información incluye la cantidad de nodos fijados por ambas búsquedas
         """
-        if parent[vertex] != vertex:
-            parent[vertex] = self._find(parent, parent[vertex])
-        return parent[vertex]
+        csr = self.graph.to_csr()
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None:
+            return [], float('inf'), {}
+        if self._disconnected(start, end):
+            return [], float('inf'), self._no_route_info()
+        
+        ids, total_cost, settled = self.search_between(source, target, consider_charging)
+        path = [csr.names[v] for v in ids]
+        
+        info = {
+            'total_cost': total_cost,
+            'charging_stations': self._get_charging_stations_in_path(path) if path else [],
+            'autonomy_respected': self._check_autonomy_respect(path, total_cost),
+            'path_length': len(path),
+            'expanded_nodes': settled
+        }
+        
+        return path, total_cost, info
     
-    def _union(self, parent: Dict[str, str], rank: Dict[str, int], 
-               x: str, y: str) -> None:
+    def search_between(self, source: int, target: int,
+                       consider_charging: bool = True) -> Tuple[List[int], float, int]:
         """
-        Une dos conjuntos usando union by rank.
+        Ejecuta la búsqueda bidireccional entre dos ids de vértice.
         
         Args:
-            parent: Diccionario de padres
-            rank: Diccionario de rangos
-            x: Primer vértice
-            y: Segundo vértice
+            source: Id del vértice de inicio
+            target: Id del vértice de destino
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (ids_del_camino, costo, nodos_fijados). El camino es una
+            lista vacía si no hay ruta.
         """
-        root_x = self._find(parent, x)
-        root_y = self._find(parent, y)
+        if source == target:
+            return [source], 0, 1
         
-        if root_x == root_y:
-            return
+        csr = self.graph.to_csr()
+        forward = csr.as_lists()
+        backward = csr.reverse().as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
         
-        if rank[root_x] < rank[root_y]:
-            parent[root_x] = root_y
-        elif rank[root_x] > rank[root_y]:
-            parent[root_y] = root_x
-        else:
-            parent[root_y] = root_x
-            rank[root_x] += 1
+        # Estado de cada dirección: distancias, anteriores, fijados y cola
+        dist = ({source: 0}, {target: 0})
+        previous = ({source: -1}, {target: -1})
+        closed = (set(), set())
+        queues = ([(0, source)], [(0, target)])
+        
+        best = float('inf')
+        meeting = -1
+        
+        while queues[0] and queues[1]:
+            # Regla de parada: ningún camino por nodos sin fijar puede mejorar
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            current_distance, u = heapq.heappop(queues[side])
+            if u in closed[side]:
+                continue
+            closed[side].add(u)
+            
+            offsets, targets_list, weights = forward if side == 0 else backward
+            own_dist, own_previous = dist[side], previous[side]
+            other_dist = dist[1 - side]
+            
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets_list[k]
+                edge_weight = weights[k]
+                
+                # La arista real es u -> v hacia adelante y v -> u hacia atrás;
+                # la autonomía se revisa sobre su extremo final
+                if consider_charging and edge_weight > autonomy:
+                    head = v if side == 0 else u
+                    if roles[head] != ROLE_CHARGING:
+                        continue
+                
+                new_distance = current_distance + edge_weight
+                if v not in closed[side] and new_distance < own_dist.get(v, float('inf')):
+                    own_dist[v] = new_distance
+                    own_previous[v] = u
+                    heapq.heappush(queues[side], (new_distance, v))
+                
+                # Posible encuentro con la otra búsqueda
+                if v in other_dist:
+                    candidate = own_dist[v] + other_dist[v]
+                    if candidate < best:
+                        best = candidate
+                        meeting = v
+        
+        settled = len(closed[0]) + len(closed[1])
+        if meeting == -1:
+            return [], float('inf'), settled
+        
+        # Unir el tramo desde el origen con el tramo hacia el destino
+        path = []
+        v = meeting
+        while v != -1:
+            path.append(v)
+            v = previous[0][v]
+        path.reverse()
+        v = previous[1][meeting]
+        while v != -1:
+            path.append(v)
+            v = previous[1][v]
+        return path, best, settled
+
+
+class YenKShortestPaths(DijkstraAlgorithm):
+    """
+    Algoritmo de Yen para los k caminos simples más cortos entre dos nodos.
+    
+    Cada camino nuevo sale de desviar uno anterior en un nodo de desvío: se
+    conserva la raíz hasta ese nodo y se busca el mejor tramo de desvío sin
+    las aristas ya usadas con la misma raíz ni los nodos de la raíz.
+    
+    Las búsquedas de desvío no empiezan en frío: se calcula una sola vez el
+    árbol de caminos más cortos hacia el destino (Dijkstra sobre el grafo
+    invertido) y se usa como heurística exacta de A*. Quitar aristas solo
+    alarga caminos, así que la heurística sigue siendo admisible, y en cuanto
+    la búsqueda llega a un nodo cuyo camino del árbol no toca nada quitado se
+    completa con ese tramo sin seguir expandiendo. Además, cada camino solo
+    se desvía desde su propio punto de desvío en adelante (mejora de Lawler):
+    los prefijos que comparte con su camino padre ya se exploraron.
+    """
+    
+    def find_k_shortest_paths(self, start: str, end: str, k: int,
+                              consider_charging: bool = True) -> Tuple[List[Tuple[List[str], float]], Dict]:
+        """
+        Encuentra hasta k caminos simples entre dos nodos, de menor a mayor costo.
+        
+        Args:
+            start: Nodo de inicio
+            end: Nodo de destino
+            k: Cantidad máxima de caminos
+            consider_charging: Si considerar estaciones de recarga
+            
+        Returns:
+            Tuple con (lista de (camino, costo), información_adicional); la
+            información incluye la cantidad de nodos fijados en los desvíos
+        """
+        csr = self.graph.to_csr()
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None or k < 1:
+            return [], {}
+        if self._disconnected(start, end):
+            return [], {'expanded_nodes': 0}
+        
+        paths, expanded = self.search_k(source, target, k, consider_charging)
+        names = csr.names
+        return [([names[v] for v in ids], cost) for ids, cost in paths], {'expanded_nodes': expanded}
+    
+    def search_k(self, source: int, target: int, k: int,
+                 consider_charging: bool = True) -> Tuple[List[Tuple[List[int], float]], int]:
+        """
+        Ejecuta el algoritmo de Yen entre dos ids de vértice.
+        
+        Args:
+            source: Id del vértice de inicio
+            target: Id del vértice de destino
+            k: Cantidad máxima de caminos
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (lista de (ids_del_camino, costo), nodos_fijados)
+        """
+        to_target, successor = self._tree_to(target, consider_charging)
+        if to_target[source] == float('inf'):
+            return [], 0
+        
+        # Primer camino: la rama del árbol desde el origen
+        ids = [source]
+        while ids[-1] != target:
+            ids.append(successor[ids[-1]])
+        prefix_costs = [to_target[source] - to_target[v] for v in ids]
+        
+        # Cada camino guarda sus costos acumulados y su punto de desvío
+        found = [(ids, prefix_costs, 0)]
+        seen = {tuple(ids)}
+        candidates = []
+        expanded = 0
+        
+        while len(found) < k:
+            ids, prefix_costs, deviation = found[-1]
+            for i in range(deviation, len(ids) - 1):
+                spur = ids[i]
+                root = ids[:i + 1]
+                
+                # Aristas que salen del nodo de desvío en caminos con la misma raíz
+                removed_edges = {path[i + 1] for path, _, _ in found
+                                 if len(path) > i + 1 and path[:i + 1] == root}
+                removed_nodes = set(root[:-1])
+                
+                spur_ids, spur_costs, settled = self._spur_search(
+                    spur, target, removed_nodes, removed_edges,
+                    to_target, successor, consider_charging)
+                expanded += settled
+                if spur_ids is None:
+                    continue
+                
+                candidate = root[:-1] + spur_ids
+                key = tuple(candidate)
+                if key in seen:
+                    continue
+                seen.add(key)
+                costs = prefix_costs[:i] + [prefix_costs[i] + c for c in spur_costs]
+                heapq.heappush(candidates, (costs[-1], len(seen), candidate, costs, i))
+            
+            if not candidates:
+                break
+            _, _, candidate, costs, deviation = heapq.heappop(candidates)
+            found.append((candidate, costs, deviation))
+        
+        return [(ids, prefix_costs[-1]) for ids, prefix_costs, _ in found], expanded
+    
+    def _tree_to(self, target: int, consider_charging: bool) -> Tuple[List[float], List[int]]:
+        """
+        Árbol de caminos más cortos hacia un destino, con Dijkstra sobre el
+        grafo invertido.
+        
+        Args:
+            target: Id del vértice de destino
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (distancia_al_destino, id_siguiente) por id de vértice
+            (-1 si no tiene siguiente)
+        """
+        csr = self.graph.to_csr()
+        offsets, targets_list, weights = csr.reverse().as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
+        
+        n = csr.num_vertices()
+        distances = [float('inf')] * n
+        distances[target] = 0
+        successor = [-1] * n
+        visited = bytearray(n)
+        pq = [(0, target)]
+        
+        while pq:
+            current_distance, u = heapq.heappop(pq)
+            if visited[u]:
+                continue
+            visited[u] = 1
+            
+            # La arista real es v -> u: la autonomía se revisa sobre u
+            long_edges_allowed = not consider_charging or roles[u] == ROLE_CHARGING
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets_list[k]
+                if visited[v]:
+                    continue
+                edge_weight = weights[k]
+                if edge_weight > autonomy and not long_edges_allowed:
+                    continue
+                new_distance = current_distance + edge_weight
+                if new_distance < distances[v]:
+                    distances[v] = new_distance
+                    successor[v] = u
+                    heapq.heappush(pq, (new_distance, v))
+        
+        return distances, successor
+    
+    def _spur_search(self, spur: int, target: int, removed_nodes: Set[int],
+                     removed_edges: Set[int], to_target: List[float],
+                     successor: List[int], consider_charging: bool
+                     ) -> Tuple[Optional[List[int]], List[float], int]:
+        """
+        Busca el tramo de desvío más corto con A*, usando el árbol hacia el
+        destino como heurística y como atajo.
+        
+        Args:
+            spur: Id del nodo de desvío
+            target: Id del vértice de destino
+            removed_nodes: Nodos de la raíz, que el tramo no puede visitar
+            removed_edges: Nodos siguientes prohibidos desde el nodo de desvío
+            to_target: Distancia de cada nodo al destino
+            successor: Siguiente nodo de cada uno en el árbol
+            consider_charging: Si considerar la restricción de autonomía
+            
+        Returns:
+            Tuple con (ids_del_tramo, costos_acumulados, nodos_fijados); los
+            ids son None si no hay tramo
+        """
+        csr = self.graph.to_csr()
+        offsets, targets_list, weights = csr.as_lists()
+        roles = csr.role_list()
+        autonomy = self.MAX_AUTONOMY
+        
+        # Si la rama del árbol desde un nodo no toca nada quitado, es su mejor
+        # camino al destino también en el grafo con aristas quitadas
+        clean: Dict[int, bool] = {}
+        
+        def tree_is_clean(v: int) -> bool:
+            chain = []
+            while v not in clean:
+                if v in removed_nodes:
+                    clean[v] = False
+                    break
+                if v == target:
+                    clean[v] = True
+                    break
+                if v == spur and successor[v] in removed_edges:
+                    clean[v] = False
+                    break
+                chain.append(v)
+                v = successor[v]
+            result = clean[v]
+            for u in chain:
+                clean[u] = result
+            return result
+        
+        distances: Dict[int, float] = {spur: 0}
+        previous: Dict[int, int] = {spur: -1}
+        closed = set()
+        pq = [(to_target[spur], 0, spur)]
+        
+        while pq:
+            _, current_distance, u = heapq.heappop(pq)
+            if u in closed:
+                continue
+            closed.add(u)
+            
+            if tree_is_clean(u):
+                # Camino hasta u y luego la rama del árbol
+                ids = []
+                v = u
+                while v != -1:
+                    ids.append(v)
+                    v = previous[v]
+                ids.reverse()
+                costs = [distances[v] for v in ids]
+                v = u
+                while v != target:
+                    v = successor[v]
+                    ids.append(v)
+                    costs.append(current_distance + to_target[u] - to_target[v])
+                return ids, costs, len(closed)
+            
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets_list[k]
+                if v in closed or v in removed_nodes or to_target[v] == float('inf'):
+                    continue
+                if u == spur and v in removed_edges:
+                    continue
+                
+                edge_weight = weights[k]
+                if consider_charging and edge_weight > autonomy and roles[v] != ROLE_CHARGING:
+                    continue
+                
+                new_distance = current_distance + edge_weight
+                if new_distance < distances.get(v, float('inf')):
+                    distances[v] = new_distance
+                    previous[v] = u
+                    heapq.heappush(pq, (new_distance + to_target[v], new_distance, v))
+        
+        return None, [], len(closed)
+
+
+class ChargingAwareRouter:
+    """
+    Ruta con restricción de batería mediante un algoritmo de etiquetas
+    (label-setting) al estilo de Dijkstra.
+    
+    Cada etiqueta representa un estado (nodo, batería, recargas, costo) y
+    guarda solo un puntero a su etiqueta padre, de modo que los caminos no se
+    copian en cada paso. En cada nodo se conservan únicamente las etiquetas no
+    dominadas: una etiqueta domina a otra si tiene menos o igual recargas y
+    costo, y más o igual batería. Las etiquetas se procesan en orden
+    lexicográfico (recargas, costo), por lo que la primera que alcanza el
+    destino minimiza las recargas y, entre ellas, el costo.
+    
+    Modelo de batería: al salir de o llegar a una estación de recarga la
+    batería queda completa (y se cuenta una recarga al llegar desde un nodo
+    que no es de recarga); en otro caso el tramo consume su peso.
+    """
+    
+    def __init__(self, graph: Graph, autonomy: float = 50,
+                 unavailable: Optional[Iterable[str]] = None):
+        """
+        Inicializa el enrutador.
+        
+        Args:
+            graph: Grafo (Graph o CSRGraph) sobre el cual buscar rutas
+            autonomy: Autonomía máxima del dron
+            unavailable: Estaciones de recarga que no pueden usarse (por
+                ejemplo, saturadas); se recorren como nodos comunes
+        """
+        self.graph = graph
+        self.autonomy = autonomy
+        self.unavailable = set(unavailable) if unavailable else set()
+    
+    def find_path(self, start: str, end: str) -> Dict:
+        """
+        Encuentra la ruta con menos recargas y menor costo respetando la batería.
+        Si no hay ruta completa, devuelve el camino parcial más largo explorado.
+        
+        Args:
+            start: Nodo de inicio
+            end: Nodo de destino
+            
+        Returns:
+            dict con las claves 'path', 'completed', 'battery_left', 'reason',
+            'partial_path', 'partial_battery_left', 'full_path',
+            'full_battery_left', además de 'total_cost' y 'recharges'
+        """
+        csr = self.graph.to_csr()
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None:
+            return {'path': [], 'completed': False, 'battery_left': None, 'reason': 'Nodos no válidos',
+                    'partial_path': [], 'partial_battery_left': None, 'full_path': [],
+                    'full_battery_left': None, 'total_cost': float('inf'), 'recharges': None}
+        same_component = getattr(self.graph, 'same_component', None)
+        if same_component is not None and not same_component(start, end):
+            return disconnected_result(start, self.autonomy)
+        
+        offsets, targets, weights = csr.as_lists()
+        roles = csr.role_list()
+        if self.unavailable:
+            roles = list(roles)
+            for station in self.unavailable:
+                station_id = csr.vertex_id(station)
+                if station_id is not None and roles[station_id] == ROLE_CHARGING:
+                    roles[station_id] = ROLE_UNKNOWN
+        autonomy = self.autonomy
+        
+        # Etiquetas en arreglos paralelos; la etiqueta 0 es el estado inicial
+        label_node = [source]
+        label_parent = [-1]
+        label_cost = [0]
+        label_battery = [autonomy]
+        label_recharges = [0]
+        label_depth = [1]
+        label_alive = [True]
+        
+        # Etiquetas no dominadas de cada nodo
+        frontier = {source: [0]}
+        
+        # Cola de prioridad: (recargas, costo, -batería, id_etiqueta)
+        pq = [(0, 0, -autonomy, 0)]
+        found = -1
+        deepest = 0
+        
+        while pq:
+            recharges, cost, neg_battery, label = heapq.heappop(pq)
+            if not label_alive[label]:
+                continue
+            
+            u = label_node[label]
+            if u == target:
+                found = label
+                break
+            
+            # Guardar el camino parcial más largo
+            if label_depth[label] > label_depth[deepest]:
+                deepest = label
+            
+            battery = -neg_battery
+            depth = label_depth[label] + 1
+            at_station = roles[u] == ROLE_CHARGING
+            
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                edge_cost = weights[k]
+                if at_station or roles[v] == ROLE_CHARGING:
+                    new_battery = autonomy
+                    new_recharges = recharges if at_station else recharges + 1
+                else:
+                    new_battery = battery - edge_cost
+                    if new_battery < 0:
+                        continue
+                    new_recharges = recharges
+                new_cost = cost + edge_cost
+                
+                # Descartar la etiqueta si alguna existente en v la domina
+                labels = frontier.get(v)
+                if labels is None:
+                    labels = frontier[v] = []
+                dominated = False
+                for other in labels:
+                    if (label_recharges[other] <= new_recharges and label_cost[other] <= new_cost
+                            and label_battery[other] >= new_battery):
+                        dominated = True
+                        break
+                if dominated:
+                    continue
+                
+                # Eliminar las etiquetas que la nueva domina
+                survivors = []
+                for other in labels:
+                    if (new_recharges <= label_recharges[other] and new_cost <= label_cost[other]
+                            and new_battery >= label_battery[other]):
+                        label_alive[other] = False
+                    else:
+                        survivors.append(other)
+                
+                new_label = len(label_node)
+                label_node.append(v)
+                label_parent.append(label)
+                label_cost.append(new_cost)
+                label_battery.append(new_battery)
+                label_recharges.append(new_recharges)
+                label_depth.append(depth)
+                label_alive.append(True)
+                survivors.append(new_label)
+                frontier[v] = survivors
+                heapq.heappush(pq, (new_recharges, new_cost, -new_battery, new_label))
+        
+        names = csr.names
+        
+        def unwind(label):
+            path = []
+            while label != -1:
+                path.append(names[label_node[label]])
+                label = label_parent[label]
+            return path[::-1]
+        
+        if found != -1:
+            path = unwind(found)
+            battery_left = label_battery[found]
+            return {
+                'path': path,
+                'completed': True,
+                'battery_left': battery_left,
+                'reason': '',
+                'partial_path': path,
+                'partial_battery_left': battery_left,
+                'full_path': path,
+                'full_battery_left': battery_left,
+                'total_cost': label_cost[found],
+                'recharges': label_recharges[found]
+            }
+        
+        # Devolver el camino parcial más largo
+        partial = unwind(deepest)
+        return {
+            'path': partial,
+            'completed': False,
+            'battery_left': label_battery[deepest],
+            'reason': 'No se pudo completar la ruta con la autonomía disponible',
+            'partial_path': partial,
+            'partial_battery_left': label_battery[deepest],
+            'full_path': [],
+            'full_battery_left': None,
+            'total_cost': float('inf'),
+            'recharges': None
+        }
+
+
+class KruskalMST:
+    """
+    Árbol de expansión mínima del grafo. Delega en el módulo mst, que elige
+    entre Kruskal, Prim y Borůvka según la densidad; las tres
+    implementaciones devuelven el mismo árbol.
+    """
+    
+    def __init__(self, graph: Graph, method: str = "auto"):
+        """
+        Inicializa el algoritmo con un grafo.
+        
+        Args:
+            graph: Grafo sobre el cual ejecutar el algoritmo
+            method: Implementación: "auto", "kruskal", "prim" o "boruvka"
+        """
+        self.graph = graph
+        self.method = method
+    
+    def find_mst(self) -> Tuple[List[Edge], float]:
+        """
+        Encuentra el árbol de expansión mínima.
+        
+        Returns:
+            Tuple con (lista_de_aristas_del_mst, costo_total)
+        """
+        # Los Graph comparten sus objetos Edge; los CSRGraph no los tienen
+        get_edge = getattr(self.graph, 'get_edge', None)
+        mst_edges = [get_edge(u, v) if get_edge else Edge(u, v, w)
+                     for u, v, w in mst_edge_list(self.graph, self.method)]
+        total_cost = sum(edge.element() for edge in mst_edges)
+        return mst_edges, total_cost
     
     def get_mst_nodes(self, mst_edges: List[Edge]) -> Set[str]:
         """
@@ -299,22 +1116,46 @@ class RouteOptimizer:
         """
         self.graph = graph
         self.dijkstra = DijkstraAlgorithm(graph)
+        self.astar = AStarAlgorithm(graph)
+        self.bidirectional = BidirectionalDijkstra(graph)
+        self.k_shortest = YenKShortestPaths(graph)
         self.kruskal = KruskalMST(graph)
+        self._parallel = None  # ParallelRouter reutilizado entre llamadas a route_many
+    
+    def close(self) -> None:
+        """Cierra el pool de procesos de route_many, si se creó."""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
     
     def optimize_route(self, start: str, end: str, 
-                      algorithm: str = "dijkstra") -> Dict:
+                      algorithm: str = "dijkstra", k: int = 3) -> Dict:
         """
-        Optimiza una ruta entre dos nodos.
+        Optimiza una ruta entre dos nodos. Las rutas se guardan en la caché
+        compartida (ver route_cache), salvo las de "mst".
         
         Args:
             start: Nodo de inicio
             end: Nodo de destino
-            algorithm: Algoritmo a usar ("dijkstra" o "mst")
+            algorithm: Algoritmo a usar ("dijkstra", "astar", "bidirectional",
+                "k_shortest", "floyd_warshall" o "mst")
+            k: Cantidad de rutas alternativas para "k_shortest"
             
         Returns:
             Diccionario con información de la ruta optimizada
         """
-        if algorithm.lower() == "dijkstra":
+        algorithm = algorithm.lower()
+        if algorithm not in ROUTE_CACHE_ALGORITHMS:
+            return self._optimize_route(start, end, algorithm, k)
+        # Las alternativas dependen de k, así que k forma parte de la clave
+        name = f"k_shortest:{k}" if algorithm == "k_shortest" else algorithm
+        return route_cache.get_or_compute(
+            self.graph, start, end, name, self.dijkstra.MAX_AUTONOMY,
+            lambda: self._optimize_route(start, end, algorithm, k))
+    
+    def _optimize_route(self, start: str, end: str, algorithm: str, k: int) -> Dict:
+        """Calcula la ruta de optimize_route sin pasar por la caché."""
+        if algorithm == "dijkstra":
             path, cost, info = self.dijkstra.find_shortest_path(start, end)
             return {
                 'algorithm': 'Dijkstra',
@@ -322,9 +1163,62 @@ class RouteOptimizer:
                 'total_cost': cost,
                 'charging_stations': info['charging_stations'],
                 'autonomy_respected': info['autonomy_respected'],
-                'path_length': info['path_length']
+                'path_length': info['path_length'],
+                'expanded_nodes': info['expanded_nodes']
+            }
+        elif algorithm == "astar":
+            path, cost, info = self.astar.find_shortest_path(start, end)
+            return {
+                'algorithm': 'A*',
+                'path': path,
+                'total_cost': cost,
+                'charging_stations': info.get('charging_stations', []),
+                'autonomy_respected': info.get('autonomy_respected', False),
+                'path_length': info.get('path_length', 0),
+                'expanded_nodes': info.get('expanded_nodes', 0)
+            }
+        elif algorithm == "bidirectional":
+            path, cost, info = self.bidirectional.find_shortest_path(start, end)
+            return {
+                'algorithm': 'Dijkstra bidireccional',
+                'path': path,
+                'total_cost': cost,
+                'charging_stations': info.get('charging_stations', []),
+                'autonomy_respected': info.get('autonomy_respected', False),
+                'path_length': info.get('path_length', 0),
+                'expanded_nodes': info.get('expanded_nodes', 0)
+            }
+        elif algorithm == "k_shortest":
+            routes, info = self.k_shortest.find_k_shortest_paths(start, end, k)
+            alternatives = [{
+                'path': path,
+                'total_cost': cost,
+                'charging_stations': self.dijkstra._get_charging_stations_in_path(path),
+                'autonomy_respected': self.dijkstra._check_autonomy_respect(path, cost),
+                'path_length': len(path)
+            } for path, cost in routes]
+            best = alternatives[0] if alternatives else {
+                'path': [], 'total_cost': float('inf'), 'charging_stations': [],
+                'autonomy_respected': False, 'path_length': 0
             }
-        elif algorithm.lower() == "mst":
+            return {
+                'algorithm': 'K rutas más cortas (Yen)',
+                **best,
+                'alternatives': alternatives,
+                'expanded_nodes': info.get('expanded_nodes', 0)
+            }
+        elif algorithm == "floyd_warshall":
+            path, cost = self.graph.floyd_warshall_shortest_path(start, end)
+            path = path or []
+            return {
+                'algorithm': 'Floyd-Warshall',
+                'path': path,
+                'total_cost': cost,
+                'charging_stations': self.dijkstra._get_charging_stations_in_path(path),
+                'autonomy_respected': self.dijkstra._check_autonomy_respect(path, cost),
+                'path_length': len(path)
+            }
+        elif algorithm == "mst":
             mst_edges, total_cost = self.kruskal.find_mst()
             mst_nodes = self.kruskal.get_mst_nodes(mst_edges)
             
@@ -349,6 +1243,94 @@ class RouteOptimizer:
                 'error': f'Algoritmo "{algorithm}" no soportado'
             }
     
+    def route_many(self, pairs: Iterable[Tuple[str, str]],
+                   consider_charging: bool = True, workers: int = 1) -> List[Dict]:
+        """
+        Calcula rutas con Dijkstra para muchos pares origen/destino, con una
+        sola búsqueda por origen distinto que termina cuando todos sus
+        destinos quedan fijados.
+        
+        Args:
+            pairs: Pares (origen, destino)
+            consider_charging: Si considerar estaciones de recarga
+            workers: Cantidad de procesos; con más de uno los orígenes se
+                reparten en un pool de procesos (ver ParallelRouter) que se
+                reutiliza mientras el grafo y los procesos no cambien
+            
+        Returns:
+            Lista de resultados en el orden de entrada, con el mismo formato
+            que optimize_route(algorithm="dijkstra")
+        """
+        pairs = list(pairs)
+        autonomy = self.dijkstra.MAX_AUTONOMY if consider_charging else None
+        results = [route_cache.get(self.graph, start, end, "dijkstra_batch", autonomy)
+                   for start, end in pairs]
+        missing = list(dict.fromkeys(pair for pair, result in zip(pairs, results) if result is None))
+        if missing:
+            computed = dict(zip(missing, self._route_pairs(missing, consider_charging, workers)))
+            for (start, end), result in computed.items():
+                route_cache.put(self.graph, start, end, "dijkstra_batch", autonomy, result)
+            results = [computed[pair] if result is None else result
+                       for pair, result in zip(pairs, results)]
+        return results
+    
+    def _route_pairs(self, pairs: List[Tuple[str, str]], consider_charging: bool = True,
+                     workers: int = 1) -> List[Dict]:
+        """Calcula las rutas de route_many sin pasar por la caché."""
+        if workers > 1:
+            from .parallel_router import ParallelRouter
+            self._parallel = ParallelRouter.reuse(self._parallel, self.graph, workers)
+            return self._parallel.route_many(pairs, consider_charging)
+        
+        csr = self.graph.to_csr()
+        results: List[Optional[Dict]] = [None] * len(pairs)
+        
+        # Agrupar los índices de los pares por origen
+        groups: Dict[int, List[Tuple[int, int]]] = {}
+        for i, (start, end) in enumerate(pairs):
+            source = csr.vertex_id(start)
+            target = csr.vertex_id(end)
+            if source is None or target is None:
+                results[i] = {
+                    'algorithm': 'Dijkstra',
+                    'path': [],
+                    'total_cost': float('inf'),
+                    'charging_stations': [],
+                    'autonomy_respected': False,
+                    'path_length': 0,
+                    'error': 'Nodo de origen o destino no encontrado'
+                }
+                continue
+            if self.dijkstra._disconnected(start, end):
+                results[i] = {
+                    'algorithm': 'Dijkstra',
+                    'path': [],
+                    'total_cost': float('inf'),
+                    'charging_stations': [],
+                    'autonomy_respected': False,
+                    'path_length': 0
+                }
+                continue
+            groups.setdefault(source, []).append((i, target))
+        
+        # Una búsqueda por origen; sus arreglos se descartan al terminar el grupo
+        for source, requests in groups.items():
+            targets = {target for _, target in requests}
+            distances, previous, _ = self.dijkstra.search(source, targets, consider_charging)
+            for i, target in requests:
+                path = self.dijkstra._reconstruct_path(previous, csr.names, source, target)
+                cost = distances[target]
+                results[i] = {
+                    'algorithm': 'Dijkstra',
+                    'path': path,
+                    'total_cost': cost,
+                    'charging_stations': self.dijkstra._get_charging_stations_in_path(path),
+                    'autonomy_respected': self.dijkstra._check_autonomy_respect(path, cost),
+                    'path_length': len(path)
+                }
+        
+        return results
+    
     def get_mst_visualization_data(self) -> Dict:
         """
         Obtiene datos del MST para visualización.
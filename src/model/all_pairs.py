@@ -0,0 +1,163 @@
+"""
+Caminos más cortos entre todos los pares de nodos.
+Construye una matriz de distancias y una matriz de siguiente salto una sola
+vez por versión del grafo; luego cada consulta origen/destino es un recorrido
+de la tabla en O(largo del camino). Las matrices ocupan O(n²) memoria, por
+lo que la tabla solo se construye hasta ALL_PAIRS_MAX_VERTICES vértices; en
+grafos mayores las consultas usan búsquedas por par (ver
+Graph.floyd_warshall_shortest_path).
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Hasta este tamaño se usa Floyd–Warshall vectorizado (O(n³) en NumPy);
+# para grafos mayores se ejecuta Dijkstra desde cada vértice sobre el CSR.
+FLOYD_WARSHALL_MAX_VERTICES = 400
+
+# Vértices máximos de la tabla: las dos matrices n×n (float64 e int32) ocupan
+# unos 12·n² bytes, ~300 MB con 5000 vértices y decenas de GB con 50000.
+ALL_PAIRS_MAX_VERTICES = 5000
+
+
+class AllPairsShortestPaths:
+    """
+    Tabla de caminos más cortos entre todos los pares de vértices.
+
+    ``distances[i, j]`` es el costo mínimo de i a j (inf si no hay camino) y
+    ``next_hop[i, j]`` es el vértice que sigue a i en ese camino (-1 si no hay).
+    """
+
+    def __init__(self, graph, method: Optional[str] = None):
+        """
+        Calcula la tabla para un grafo.
+
+        Args:
+            graph: Grafo (Graph o CSRGraph)
+            method: 'floyd_warshall' o 'dijkstra'; por defecto se elige según
+                la cantidad de vértices
+
+        Raises:
+            ValueError: Si el grafo tiene más de ALL_PAIRS_MAX_VERTICES vértices
+                o el método no existe
+        """
+        self.csr = graph.to_csr()
+        n = self.csr.num_vertices()
+        if n > ALL_PAIRS_MAX_VERTICES:
+            raise ValueError(f"La tabla de todos los pares admite hasta {ALL_PAIRS_MAX_VERTICES} "
+                             f"vértices (el grafo tiene {n})")
+        if method is None:
+            method = 'floyd_warshall' if n <= FLOYD_WARSHALL_MAX_VERTICES else 'dijkstra'
+        if method == 'floyd_warshall':
+            self.distances, self.next_hop = self._floyd_warshall()
+        elif method == 'dijkstra':
+            self.distances, self.next_hop = self._repeated_dijkstra()
+        else:
+            raise ValueError(f'Método "{method}" no soportado')
+        self.method = method
+
+    def _floyd_warshall(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Floyd–Warshall con una actualización vectorizada de la matriz por cada
+        vértice intermedio k.
+
+        Returns:
+            Tuple con (matriz_de_distancias, matriz_de_siguiente_salto)
+        """
+        csr = self.csr
+        n = csr.num_vertices()
+        distances = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+
+        sources, targets, weights = csr.edge_arrays()
+        distances[sources, targets] = weights
+        next_hop[sources, targets] = targets
+        diagonal = np.arange(n)
+        distances[diagonal, diagonal] = 0
+        next_hop[diagonal, diagonal] = diagonal
+
+        for k in range(n):
+            through_k = distances[:, k, None] + distances[None, k, :]
+            better = through_k < distances
+            if better.any():
+                rows, cols = np.nonzero(better)
+                distances[rows, cols] = through_k[rows, cols]
+                next_hop[rows, cols] = next_hop[rows, k]
+
+        return distances, next_hop
+
+    def _repeated_dijkstra(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ejecuta Dijkstra desde cada vértice sobre el CSR; conviene en grafos
+        grandes y dispersos.
+
+        Returns:
+            Tuple con (matriz_de_distancias, matriz_de_siguiente_salto)
+        """
+        from .algorithms import DijkstraAlgorithm
+
+        csr = self.csr
+        n = csr.num_vertices()
+        dijkstra = DijkstraAlgorithm(csr)
+        distances = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+
+        for source in range(n):
+            dist, previous, settled = dijkstra.search(source, consider_charging=False)
+            distances[source] = dist
+            # El primer salto de cada vértice es el de su anterior, salvo los
+            # vecinos directos del origen; los vértices se fijan en orden, así
+            # que el anterior ya está resuelto.
+            row = [-1] * n
+            row[source] = source
+            for v in settled[1:]:
+                parent = previous[v]
+                row[v] = v if parent == source else row[parent]
+            next_hop[source] = row
+
+        return distances, next_hop
+
+    def distance(self, start: str, end: str) -> float:
+        """
+        Obtiene el costo mínimo entre dos vértices.
+
+        Returns:
+            float: Costo mínimo (inf si no hay camino o algún vértice no existe)
+        """
+        u = self.csr.vertex_id(start)
+        v = self.csr.vertex_id(end)
+        if u is None or v is None:
+            return float('inf')
+        return self._cost(self.distances[u, v])
+
+    def path(self, start: str, end: str) -> Tuple[Optional[List[str]], float]:
+        """
+        Reconstruye el camino más corto recorriendo la tabla de siguiente salto.
+
+        Args:
+            start: Vértice de inicio
+            end: Vértice de destino
+
+        Returns:
+            Tuple con (camino, costo). El camino es None si no hay ruta.
+        """
+        u = self.csr.vertex_id(start)
+        v = self.csr.vertex_id(end)
+        if u is None or v is None or self.next_hop[u, v] == -1:
+            return None, float('inf')
+
+        names = self.csr.names
+        next_hop = self.next_hop
+        cost = self._cost(self.distances[u, v])
+        path = [names[u]]
+        while u != v:
+            u = int(next_hop[u, v])
+            path.append(names[u])
+        return path, cost
+
+    def _cost(self, value) -> float:
+        """Convierte una distancia de la matriz al tipo de los pesos del grafo."""
+        value = value.item()
+        if self.csr.weights.dtype.kind == 'i' and value != float('inf'):
+            return int(value)
+        return value
@@ -0,0 +1,416 @@
+"""
+Grafo superpuesto de estaciones de recarga para rutas de largo alcance.
+Sus vértices son las estaciones de recarga y los almacenes; hay una arista
+entre dos de ellos cuando el dron puede ir de uno al otro con una sola carga,
+y cada arista guarda su costo y el sub-camino sobre el grafo base. Las
+consultas recorren este grafo pequeño y solo expanden los sub-caminos al final.
+
+Usa el mismo modelo de batería que ChargingAwareRouter: al salir de o llegar
+a una estación la batería queda completa (llegar desde un nodo que no es de
+recarga cuenta una recarga) y los tramos entre nodos que no son de recarga
+consumen su peso. Las rutas minimizan primero las recargas y luego el costo.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+from .roles import ROLE_CHARGING, ROLE_STORAGE
+from .all_pairs import FLOYD_WARSHALL_MAX_VERTICES
+
+
+class ChargingOverlay:
+    """
+    Grafo de estaciones de recarga y almacenes con tramos de una sola carga.
+
+    ``edges[u]`` es una lista de (v, recargas, costo, sub_camino) donde el
+    sub-camino son los ids de vértice de u a v sobre el grafo base.
+    """
+
+    def __init__(self, graph, autonomy: float = 50):
+        """
+        Construye el grafo superpuesto.
+
+        Args:
+            graph: Grafo (Graph o CSRGraph)
+            autonomy: Autonomía máxima del dron
+        """
+        self.csr = graph.to_csr()
+        self.autonomy = autonomy
+        self._forward = self.csr.as_lists()
+        self._backward = self.csr.reverse().as_lists()
+        self._roles = self.csr.role_list()
+        self.edges: Dict[int, List[Tuple[int, int, float, Tuple[int, ...]]]] = {}
+        self._build()
+
+    def _reach(self, source: int, lists) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Dijkstra acotado por la autonomía sobre los nodos que no son de recarga.
+
+        Args:
+            source: Id del vértice de inicio
+            lists: Arreglos CSR (offsets, vecinos, pesos) del sentido a recorrer
+
+        Returns:
+            Tuple con (distancias, id_anterior) de los vértices alcanzados
+        """
+        offsets, targets, weights = lists
+        roles = self._roles
+        autonomy = self.autonomy
+        dist = {source: 0}
+        previous = {source: -1}
+        pq = [(0, source)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if roles[v] == ROLE_CHARGING:
+                    continue
+                nd = d + weights[k]
+                if nd <= autonomy and nd < dist.get(v, float('inf')):
+                    dist[v] = nd
+                    previous[v] = u
+                    heapq.heappush(pq, (nd, v))
+        return dist, previous
+
+    def _station_hits(self, source: int) -> Tuple[Dict[int, Tuple[float, int]], Dict[int, int]]:
+        """
+        Estaciones alcanzables con una carga desde un nodo que no es de recarga.
+
+        Returns:
+            Tuple con (estación -> (costo, último nodo antes de la estación),
+            id_anterior de la búsqueda para reconstruir los sub-caminos)
+        """
+        offsets, targets, weights = self._forward
+        roles = self._roles
+        dist, previous = self._reach(source, self._forward)
+        best: Dict[int, Tuple[float, int]] = {}
+        for y, d in dist.items():
+            for k in range(offsets[y], offsets[y + 1]):
+                station = targets[k]
+                if roles[station] != ROLE_CHARGING:
+                    continue
+                cost = d + weights[k]
+                if station not in best or cost < best[station][0]:
+                    best[station] = (cost, y)
+        return best, previous
+
+    @staticmethod
+    def _segment(previous: Dict[int, int], last: int, station: int) -> Tuple[int, ...]:
+        """Reconstruye el sub-camino de una búsqueda acotada hasta una estación."""
+        segment = [station]
+        while last != -1:
+            segment.append(last)
+            last = previous[last]
+        return tuple(reversed(segment))
+
+    def _start_edges(self, source: int) -> List[Tuple[int, int, float, Tuple[int, ...]]]:
+        """Aristas desde un nodo que no es de recarga hacia las estaciones."""
+        hits, previous = self._station_hits(source)
+        return [(station, 1, cost, self._segment(previous, last, station))
+                for station, (cost, last) in hits.items()]
+
+    def _build(self) -> None:
+        """Calcula las aristas de las estaciones y de los almacenes."""
+        offsets, targets, weights = self._forward
+        roles = self._roles
+
+        for u, role in enumerate(roles):
+            if role == ROLE_STORAGE:
+                # Los almacenes solo son origen: salen con la batería completa
+                self.edges[u] = self._start_edges(u)
+                continue
+            if role != ROLE_CHARGING:
+                continue
+
+            # Mejor tramo (recargas, costo) hacia cada estación; los sub-caminos
+            # se reconstruyen solo para los tramos elegidos
+            best: Dict[int, Tuple[int, float, int, int]] = {}
+            searches: Dict[int, Dict[int, int]] = {}
+            for k in range(offsets[u], offsets[u + 1]):
+                x, w = targets[k], weights[k]
+                if roles[x] == ROLE_CHARGING:
+                    # Entre estaciones no se consume batería ni se recarga
+                    if x != u and (x not in best or (0, w) < best[x][:2]):
+                        best[x] = (0, w, -1, -1)
+                    continue
+                # Al salir de la estación x queda con batería completa
+                hits, searches[x] = self._station_hits(x)
+                for station, (cost, last) in hits.items():
+                    if station == u:
+                        continue
+                    candidate = (1, w + cost)
+                    if station not in best or candidate < best[station][:2]:
+                        best[station] = (1, w + cost, x, last)
+
+            edges = []
+            for station, (recharges, cost, x, last) in best.items():
+                if x == -1:
+                    segment = (u, station)
+                else:
+                    segment = (u,) + self._segment(searches[x], last, station)
+                edges.append((station, recharges, cost, segment))
+            self.edges[u] = edges
+
+    def num_edges(self) -> int:
+        """Retorna la cantidad de aristas del grafo superpuesto."""
+        return sum(len(edges) for edges in self.edges.values())
+
+    def find_path(self, start: str, end: str) -> Optional[Dict]:
+        """
+        Encuentra la ruta con menos recargas y menor costo usando el grafo
+        superpuesto.
+
+        Args:
+            start: Nodo de inicio
+            end: Nodo de destino
+
+        Returns:
+            dict en el formato de ChargingAwareRouter.find_path para rutas
+            completas, o None si no existe una ruta factible
+        """
+        csr = self.csr
+        source = csr.vertex_id(start)
+        target = csr.vertex_id(end)
+        if source is None or target is None:
+            return None
+        roles = self._roles
+        autonomy = self.autonomy
+
+        if source == target:
+            return self._result([source], 0, 0, autonomy)
+
+        # Tramo final: distancia de cada nodo al destino con una sola carga
+        target_is_station = roles[target] == ROLE_CHARGING
+        if target_is_station:
+            to_target, next_hop = {target: 0}, {target: -1}
+        else:
+            to_target, next_hop = self._reach(target, self._backward)
+
+        # Cola: (recargas, costo, es_final, nodo, anterior, sub_camino)
+        # Las entradas finales ya llegaron al destino.
+        pq = []
+        settled: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+        if roles[source] == ROLE_CHARGING or source in self.edges:
+            heapq.heappush(pq, (0, 0, 0, source, -1, (source,)))
+        else:
+            # Origen sin aristas precalculadas: se calculan en la consulta
+            settled[source] = (-1, (source,))
+            for station, recharges, cost, segment in self._start_edges(source):
+                heapq.heappush(pq, (recharges, cost, 0, station, source, segment))
+        if roles[source] != ROLE_CHARGING and source in to_target:
+            # Ruta directa sin pasar por estaciones
+            heapq.heappush(pq, (0, to_target[source], 1, source, -1, (source,)))
+
+        offsets, targets, weights = self._forward
+        while pq:
+            recharges, cost, final, u, parent, segment = heapq.heappop(pq)
+            if final:
+                # u es el último nodo del recorrido por el grafo superpuesto
+                path = self._unwind(settled, parent, segment) if parent != -1 else list(segment)
+                x = path[-1]
+                while next_hop[x] != -1:
+                    x = next_hop[x]
+                    path.append(x)
+                return self._result(path, cost, recharges, self._battery_left(path))
+            if u in settled:
+                continue
+            settled[u] = (parent, segment)
+
+            if u == target:
+                heapq.heappush(pq, (recharges, cost, 1, u, u, (u,)))
+                continue
+
+            if roles[u] == ROLE_CHARGING and not target_is_station:
+                # Tramo final desde la estación hacia el destino
+                best = None
+                for k in range(offsets[u], offsets[u + 1]):
+                    x = targets[k]
+                    if roles[x] != ROLE_CHARGING and x in to_target:
+                        candidate = weights[k] + to_target[x]
+                        if best is None or candidate < best[0]:
+                            best = (candidate, x)
+                if best is not None:
+                    heapq.heappush(pq, (recharges, cost + best[0], 1, best[1], u, (u, best[1])))
+
+            for v, edge_recharges, edge_cost, edge_segment in self.edges.get(u, ()):
+                if v not in settled:
+                    heapq.heappush(pq, (recharges + edge_recharges, cost + edge_cost, 0,
+                                        v, u, edge_segment))
+        return None
+
+    def _unwind(self, settled: Dict[int, Tuple[int, Tuple[int, ...]]],
+                last: int, tail: Tuple[int, ...]) -> List[int]:
+        """
+        Expande los sub-caminos del recorrido por el grafo superpuesto.
+
+        Args:
+            settled: Vértice -> (anterior, sub_camino con el que se llegó)
+            last: Último vértice del grafo superpuesto
+            tail: Sub-camino que sale de ``last``
+
+        Returns:
+            list: Ids del camino completo sobre el grafo base
+        """
+        segments = [tail]
+        u = last
+        while u != -1:
+            parent, segment = settled[u]
+            segments.append(segment)
+            u = parent
+        path = list(segments[-1])
+        for segment in reversed(segments[:-1]):
+            path.extend(segment[1:])
+        return path
+
+    def _battery_left(self, path: List[int]) -> float:
+        """Simula la batería a lo largo del camino con el modelo del enrutador."""
+        roles = self._roles
+        csr = self.csr
+        battery = self.autonomy
+        for u, v in zip(path, path[1:]):
+            if roles[u] == ROLE_CHARGING or roles[v] == ROLE_CHARGING:
+                battery = self.autonomy
+            else:
+                battery -= csr.get_edge_weight(csr.names[u], csr.names[v])
+        return battery
+
+    def _result(self, ids: List[int], cost: float, recharges: int, battery_left: float) -> Dict:
+        """Arma el resultado en el formato de ChargingAwareRouter.find_path."""
+        path = [self.csr.names[v] for v in ids]
+        return {
+            'path': path,
+            'completed': True,
+            'battery_left': battery_left,
+            'reason': '',
+            'partial_path': path,
+            'partial_battery_left': battery_left,
+            'full_path': path,
+            'full_battery_left': battery_left,
+            'total_cost': cost,
+            'recharges': recharges
+        }
+
+
+def route_with_charging(graph, start: str, end: str, autonomy: float = 50) -> Dict:
+    """
+    Ruta con menos recargas y menor costo entre dos nodos de un Graph.
+    Primero prueba el atajo de caminos más cortos precalculados; si no
+    aplica usa el grafo de estaciones de recarga, y si no hay ruta completa
+    recurre al enrutador de etiquetas para obtener el camino parcial.
+
+    Args:
+        graph: Grafo del sistema
+        start: Nodo de inicio
+        end: Nodo de destino
+        autonomy: Autonomía máxima del dron
+
+    Returns:
+        dict en el formato de ChargingAwareRouter.find_path
+    """
+    if graph.has_vertex(start) and graph.has_vertex(end) and not graph.same_component(start, end):
+        return disconnected_result(start, autonomy)
+    result = _direct_route(graph, start, end, autonomy)
+    if result is None:
+        result = graph.charging_overlay(autonomy).find_path(start, end)
+    if result is None:
+        from .algorithms import ChargingAwareRouter
+        result = ChargingAwareRouter(graph, autonomy).find_path(start, end)
+    return result
+
+
+def disconnected_result(start: str, autonomy: float) -> Dict:
+    """
+    Resultado sin ruta para nodos en componentes conexas distintas, en el
+    formato de ChargingAwareRouter.find_path: el dron no sale del origen.
+
+    Args:
+        start: Nodo de inicio
+        autonomy: Autonomía máxima del dron
+
+    Returns:
+        dict: Resultado no completado
+    """
+    return {
+        'path': [start],
+        'completed': False,
+        'battery_left': autonomy,
+        'reason': 'No existe conexión entre los nodos',
+        'partial_path': [start],
+        'partial_battery_left': autonomy,
+        'full_path': [],
+        'full_battery_left': None,
+        'total_cost': float('inf'),
+        'recharges': None
+    }
+
+
+def _bounded_shortest_path(csr, start: str, end: str, limit: float) -> Tuple[Optional[List[str]], float]:
+    """
+    Camino más corto entre dos vértices si su costo no supera el límite:
+    Dijkstra que termina al fijar el destino o al pasar el límite, así que
+    solo recorre los vértices a menos de ``limit`` del origen.
+
+    Returns:
+        Tuple con (camino, costo). El camino es None si no hay ruta dentro del límite.
+    """
+    source, target = csr.vertex_id(start), csr.vertex_id(end)
+    if source is None or target is None:
+        return None, float('inf')
+    offsets, targets, weights = csr.as_lists()
+    dist = {source: 0}
+    previous = {source: -1}
+    pq = [(0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        if u == target:
+            path = []
+            while u != -1:
+                path.append(csr.names[u])
+                u = previous[u]
+            return path[::-1], d
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + weights[k]
+            if nd <= limit and nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                previous[v] = u
+                heapq.heappush(pq, (nd, v))
+    return None, float('inf')
+
+
+def _direct_route(graph, start: str, end: str, autonomy: float) -> Optional[Dict]:
+    """
+    Atajo con el camino más corto: la tabla de todos los pares en grafos
+    pequeños, o una búsqueda acotada por la autonomía en grafos grandes.
+    Si el camino más corto no pasa por estaciones de recarga y su costo cabe
+    en la autonomía, es también la ruta sin recargas de menor costo.
+
+    Returns:
+        dict: Resultado en el formato de ChargingAwareRouter.find_path, o
+        None si el atajo no aplica
+    """
+    csr = graph.to_csr()
+    if csr.num_vertices() <= FLOYD_WARSHALL_MAX_VERTICES:
+        path, cost = graph.floyd_warshall_shortest_path(start, end)
+    else:
+        path, cost = _bounded_shortest_path(csr, start, end, autonomy)
+    if not path or cost > autonomy:
+        return None
+    if any(graph.get_role(node) == ROLE_CHARGING for node in path):
+        return None
+    battery_left = autonomy - cost
+    return {
+        'path': path,
+        'completed': True,
+        'battery_left': battery_left,
+        'reason': '',
+        'partial_path': path,
+        'partial_battery_left': battery_left,
+        'full_path': path,
+        'full_battery_left': battery_left,
+        'total_cost': cost,
+        'recharges': 0
+    }
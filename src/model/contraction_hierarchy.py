@@ -0,0 +1,409 @@
+"""
+Jerarquía de contracción (Contraction Hierarchies) para consultas de rutas.
+El preprocesamiento contrae los vértices uno a uno en orden de importancia y
+agrega aristas atajo que preservan las distancias; luego cada consulta es una
+búsqueda bidireccional que solo sube en la jerarquía y explora unos pocos
+cientos de nodos incluso en redes grandes. La jerarquía se puede guardar en
+disco y reutilizar mientras el grafo no cambie.
+"""
+
+import hashlib
+import heapq
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .roles import ROLE_CHARGING
+
+# Máximo de nodos fijados en cada búsqueda de testigos; si se alcanza sin
+# encontrar un camino alternativo se agrega el atajo, lo que es siempre seguro
+WITNESS_SETTLE_LIMIT = 60
+
+
+def graph_fingerprint(csr) -> str:
+    """
+    Huella del grafo: cambia si cambian los vértices, las aristas o los pesos.
+
+    Args:
+        csr: Grafo CSR
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    digest = hashlib.sha1()
+    digest.update('\x00'.join(map(str, csr.names)).encode('utf-8'))
+    for array in (csr.offsets, csr.targets, csr.weights, csr.roles):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+class ContractionHierarchy:
+    """
+    Jerarquía de contracción de un grafo dirigido.
+
+    ``rank[v]`` es la posición de v en el orden de contracción. El grafo de
+    subida hacia adelante guarda las aristas u -> w con rank[w] > rank[u]; el
+    de subida hacia atrás guarda, en la fila de w, las aristas u -> w con
+    rank[u] > rank[w]. ``middle`` indica el vértice contraído que reemplaza
+    cada atajo.
+    """
+
+    def __init__(self, names: List[str], rank: np.ndarray,
+                 up_offsets: np.ndarray, up_targets: np.ndarray, up_weights: np.ndarray,
+                 down_offsets: np.ndarray, down_sources: np.ndarray, down_weights: np.ndarray,
+                 shortcuts: np.ndarray, fingerprint: str = '',
+                 consider_charging: bool = True, autonomy: float = 50):
+        """
+        Inicializa la jerarquía a partir de sus arreglos.
+
+        Args:
+            names: Nombre de cada vértice indexado por id
+            rank: Orden de contracción de cada vértice
+            up_offsets, up_targets, up_weights: CSR de subida hacia adelante
+            down_offsets, down_sources, down_weights: CSR de subida hacia atrás
+            shortcuts: Arreglo (k, 3) con (origen, destino, vértice_intermedio)
+            fingerprint: Huella del grafo del que se construyó
+            consider_charging: Si se aplicó la restricción de autonomía
+            autonomy: Autonomía usada para filtrar aristas
+        """
+        self.names = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.rank = rank
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.down_offsets = down_offsets
+        self.down_sources = down_sources
+        self.down_weights = down_weights
+        self.shortcuts = shortcuts
+        self.fingerprint = fingerprint
+        self.consider_charging = consider_charging
+        self.autonomy = autonomy
+
+        # Copias en listas para los bucles de consulta
+        self._up = (up_offsets.tolist(), up_targets.tolist(), up_weights.tolist())
+        self._down = (down_offsets.tolist(), down_sources.tolist(), down_weights.tolist())
+        self._middle: Dict[Tuple[int, int], int] = {
+            (u, w): m for u, w, m in shortcuts.tolist()
+        }
+
+    @classmethod
+    def build(cls, graph, consider_charging: bool = True, autonomy: float = 50,
+              witness_limit: int = WITNESS_SETTLE_LIMIT) -> 'ContractionHierarchy':
+        """
+        Construye la jerarquía contrayendo los vértices por orden de importancia.
+
+        Args:
+            graph: Grafo (Graph o CSRGraph)
+            consider_charging: Si descartar, como Dijkstra, las aristas más
+                largas que la autonomía que no llegan a una estación de recarga
+            autonomy: Autonomía máxima del dron
+            witness_limit: Máximo de nodos fijados por búsqueda de testigos
+
+        Returns:
+            ContractionHierarchy: Jerarquía lista para consultas
+        """
+        csr = graph.to_csr()
+        n = csr.num_vertices()
+        sources, targets, weights = csr.edge_arrays()
+        if consider_charging:
+            allowed = (weights <= autonomy) | (csr.roles[targets] == ROLE_CHARGING)
+            sources, targets, weights = sources[allowed], targets[allowed], weights[allowed]
+
+        # Grafo restante (solo vértices sin contraer), como diccionarios
+        out_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        for u, w, c in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+            if u != w:
+                out_edges[u][w] = c
+                in_edges[w][u] = c
+
+        middle: Dict[Tuple[int, int], int] = {}
+        contracted = bytearray(n)
+        contracted_neighbors = [0] * n
+        rank = np.zeros(n, dtype=np.int32)
+        up_rows: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        down_rows: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+
+        def witness_distances(u: int, skip: int, max_cost: float,
+                              pending: set) -> Dict[int, float]:
+            # Dijkstra acotado desde u sin pasar por el vértice que se contrae
+            dist = {u: 0}
+            pq = [(0, u)]
+            settled = 0
+            while pq and pending and settled < witness_limit:
+                d, x = heapq.heappop(pq)
+                if d > dist[x]:
+                    continue
+                if d > max_cost:
+                    break
+                settled += 1
+                pending.discard(x)
+                for y, c in out_edges[x].items():
+                    if y == skip:
+                        continue
+                    nd = d + c
+                    if nd < dist.get(y, float('inf')):
+                        dist[y] = nd
+                        heapq.heappush(pq, (nd, y))
+            return dist
+
+        def needed_shortcuts(v: int) -> List[Tuple[int, int, float]]:
+            # Atajos u -> w necesarios al quitar v: aquellos sin camino testigo
+            # igual o más corto que u -> v -> w
+            result = []
+            outs = out_edges[v]
+            if not outs:
+                return result
+            max_out = max(outs.values())
+            for u, c_in in in_edges[v].items():
+                candidates = [w for w in outs if w != u]
+                if not candidates:
+                    continue
+                dist = witness_distances(u, v, c_in + max_out, set(candidates))
+                for w in candidates:
+                    cost = c_in + outs[w]
+                    if dist.get(w, float('inf')) > cost:
+                        result.append((u, w, cost))
+            return result
+
+        level = [0] * n
+
+        def priority(v: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            # Diferencia de aristas más vecinos ya contraídos y nivel en la
+            # jerarquía: reparten el orden y mantienen baja la altura
+            shortcuts = needed_shortcuts(v)
+            removed = len(in_edges[v]) + len(out_edges[v])
+            value = 2 * (len(shortcuts) - removed) + contracted_neighbors[v] + level[v]
+            return value, shortcuts
+
+        queue = [(priority(v)[0], v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            if contracted[v]:
+                continue
+            # Actualización perezosa: si la prioridad empeoró, reinsertar
+            current, shortcuts = priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, cost in shortcuts:
+                if cost < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    middle[(u, w)] = v
+
+            # Las aristas restantes de v van a vértices de mayor rango
+            up_rows[v] = list(out_edges[v].items())
+            down_rows[v] = list(in_edges[v].items())
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+                level[w] = max(level[w], level[v] + 1)
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+            contracted[v] = 1
+            rank[v] = order
+            order += 1
+
+        up = cls._rows_to_csr(up_rows, weights.dtype)
+        down = cls._rows_to_csr(down_rows, weights.dtype)
+        # Cada atajo sobrevive hasta que se contrae uno de sus extremos, así que
+        # todos quedan registrados en las filas de la jerarquía
+        shortcuts = np.asarray([(u, w, m) for (u, w), m in middle.items()],
+                               dtype=np.int32).reshape(-1, 3)
+        return cls(csr.names, rank, *up, *down, shortcuts, graph_fingerprint(csr),
+                   consider_charging, autonomy)
+
+    @staticmethod
+    def _rows_to_csr(rows: List[List[Tuple[int, float]]],
+                     dtype) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convierte filas de (vecino, peso) en arreglos CSR."""
+        counts = [len(row) for row in rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        neighbors = np.fromiter((x for row in rows for x, _ in row), dtype=np.int32,
+                                count=int(offsets[-1]))
+        weights = np.fromiter((c for row in rows for _, c in row), dtype=dtype,
+                              count=int(offsets[-1]))
+        return offsets, neighbors, weights
+
+    def save(self, path: str) -> None:
+        """
+        Guarda la jerarquía en disco en formato .npz.
+
+        Args:
+            path: Ruta del archivo
+        """
+        np.savez(path,
+                 names=np.asarray(self.names, dtype=str),
+                 rank=self.rank,
+                 up_offsets=self.up_offsets, up_targets=self.up_targets,
+                 up_weights=self.up_weights,
+                 down_offsets=self.down_offsets, down_sources=self.down_sources,
+                 down_weights=self.down_weights,
+                 shortcuts=self.shortcuts,
+                 fingerprint=np.asarray(self.fingerprint),
+                 consider_charging=np.asarray(self.consider_charging),
+                 autonomy=np.asarray(self.autonomy))
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """
+        Carga una jerarquía guardada con save.
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            ContractionHierarchy: Jerarquía cargada
+        """
+        with np.load(path) as data:
+            return cls(data['names'].tolist(), data['rank'],
+                       data['up_offsets'], data['up_targets'], data['up_weights'],
+                       data['down_offsets'], data['down_sources'], data['down_weights'],
+                       data['shortcuts'], str(data['fingerprint']),
+                       bool(data['consider_charging']), data['autonomy'].item())
+
+    def matches(self, graph) -> bool:
+        """
+        Verifica si la jerarquía corresponde al estado actual de un grafo.
+
+        Returns:
+            bool: True si el grafo no cambió desde la construcción
+        """
+        return self.fingerprint == graph_fingerprint(graph.to_csr())
+
+    def num_shortcuts(self) -> int:
+        """Retorna la cantidad de atajos de la jerarquía."""
+        return int(self.shortcuts.shape[0])
+
+    def query(self, start: str, end: str) -> Tuple[Optional[List[str]], float, Dict]:
+        """
+        Encuentra el camino más corto entre dos vértices.
+
+        Args:
+            start: Vértice de inicio
+            end: Vértice de destino
+
+        Returns:
+            Tuple con (camino, costo, información). El camino es None si no hay
+            ruta o algún vértice no existe.
+        """
+        source = self.index.get(start)
+        target = self.index.get(end)
+        if source is None or target is None:
+            return None, float('inf'), {'settled_nodes': 0}
+        ids, cost, settled = self.query_ids(source, target)
+        info = {'settled_nodes': settled}
+        if ids is None:
+            return None, float('inf'), info
+        return [self.names[v] for v in ids], cost, info
+
+    def query_ids(self, source: int, target: int) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Búsqueda bidireccional hacia arriba en la jerarquía.
+
+        Returns:
+            Tuple con (ids_del_camino, costo, nodos_fijados)
+        """
+        if source == target:
+            return [source], 0, 1
+
+        graphs = (self._up, self._down)
+        dist = ({source: 0}, {target: 0})
+        previous = ({source: -1}, {target: -1})
+        queues = ([(0, source)], [(0, target)])
+        best = float('inf')
+        meeting = -1
+        settled = 0
+
+        while queues[0] or queues[1]:
+            # Cada dirección termina cuando su cima ya no puede mejorar el mejor
+            for side in (0, 1):
+                if queues[side] and queues[side][0][0] >= best:
+                    queues[side].clear()
+            if not queues[0] and not queues[1]:
+                break
+            if not queues[1] or (queues[0] and queues[0][0][0] <= queues[1][0][0]):
+                side = 0
+            else:
+                side = 1
+
+            d, u = heapq.heappop(queues[side])
+            own_dist = dist[side]
+            if d > own_dist[u]:
+                continue
+            settled += 1
+
+            other = dist[1 - side].get(u)
+            if other is not None and d + other < best:
+                best = d + other
+                meeting = u
+
+            # Detención por demanda: si un vértice superior ya alcanzado llega
+            # a u más barato, u no está en ningún camino óptimo de esta dirección
+            offsets, neighbors, weights = graphs[1 - side]
+            stalled = False
+            for k in range(offsets[u], offsets[u + 1]):
+                if own_dist.get(neighbors[k], float('inf')) + weights[k] < d:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+
+            offsets, neighbors, weights = graphs[side]
+            own_previous = previous[side]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = neighbors[k]
+                nd = d + weights[k]
+                if nd < own_dist.get(v, float('inf')):
+                    own_dist[v] = nd
+                    own_previous[v] = u
+                    heapq.heappush(queues[side], (nd, v))
+
+        if meeting == -1:
+            return None, float('inf'), settled
+
+        # Camino en la jerarquía: origen -> encuentro -> destino
+        forward = []
+        v = meeting
+        while v != -1:
+            forward.append(v)
+            v = previous[0][v]
+        forward.reverse()
+        v = previous[1][meeting]
+        while v != -1:
+            forward.append(v)
+            v = previous[1][v]
+        return self._unpack(forward), best, settled
+
+    def _unpack(self, path: List[int]) -> List[int]:
+        """
+        Reemplaza recursivamente cada atajo por los dos tramos que representa.
+
+        Args:
+            path: Camino con posibles atajos
+
+        Returns:
+            list: Camino equivalente sobre las aristas originales
+        """
+        middle = self._middle
+        result = [path[0]]
+        # Pila de tramos por expandir, en orden inverso
+        stack = [(path[i], path[i + 1]) for i in range(len(path) - 2, -1, -1)]
+        while stack:
+            u, w = stack.pop()
+            m = middle.get((u, w))
+            if m is None:
+                result.append(w)
+            else:
+                stack.append((m, w))
+                stack.append((u, m))
+        return result
@@ -0,0 +1,172 @@
+"""
+Mantenimiento incremental de árboles de caminos más cortos.
+Cuando cambia el peso de una arista solo se reparan los vértices cuyo camino
+puede verse afectado, al estilo de Ramalingam y Reps:
+
+- Si la arista se abarata, se propaga la mejora con Dijkstra a partir de su
+  extremo final, solo por los vértices cuya distancia baja.
+- Si se encarece (o deja de poder usarse) y pertenece al árbol, solo el
+  subárbol que cuelga de ella pierde su camino: sus vértices se reconectan
+  desde sus mejores vecinos de entrada fuera del subárbol y se reordenan
+  con Dijkstra dentro del subárbol. Si no pertenece al árbol nada cambia.
+"""
+
+import heapq
+from typing import List, Set
+from .roles import ROLE_CHARGING
+
+
+def _usable(weight, head: int, roles: List[int], consider_charging: bool, autonomy: float) -> bool:
+    """Indica si una arista se puede usar con la restricción de autonomía."""
+    return not consider_charging or weight <= autonomy or roles[head] == ROLE_CHARGING
+
+
+def tree_children(tree) -> List[Set[int]]:
+    """
+    Hijos de cada vértice en un árbol de caminos, calculados una sola vez y
+    mantenidos por las reparaciones.
+
+    Args:
+        tree: ShortestPathTree
+
+    Returns:
+        list: Conjunto de ids hijos de cada vértice
+    """
+    if tree.children is None:
+        children = [set() for _ in tree.previous]
+        for v, parent in enumerate(tree.previous):
+            if parent != -1:
+                children[parent].add(v)
+        tree.children = children
+    return tree.children
+
+
+def repair_tree(tree, start: int, end: int, old_weight, new_weight,
+                consider_charging: bool = False, autonomy: float = 50) -> Set[int]:
+    """
+    Repara un árbol de caminos más cortos tras cambiar el peso de una arista.
+    El CSR del árbol ya debe tener el peso nuevo.
+
+    Args:
+        tree: ShortestPathTree a reparar en el lugar
+        start: Id del vértice de inicio de la arista
+        end: Id del vértice de fin de la arista
+        old_weight: Peso anterior
+        new_weight: Peso nuevo
+        consider_charging: Si el árbol aplica la restricción de autonomía
+        autonomy: Autonomía máxima del dron
+
+    Returns:
+        set: Ids de los vértices cuyo camino o costo desde el origen cambió
+    """
+    roles = tree.csr.role_list()
+    was_usable = _usable(old_weight, end, roles, consider_charging, autonomy)
+    is_usable = _usable(new_weight, end, roles, consider_charging, autonomy)
+
+    if is_usable and (not was_usable or new_weight < old_weight):
+        return _propagate_decrease(tree, start, end, new_weight, consider_charging, autonomy)
+    if was_usable and (not is_usable or new_weight > old_weight):
+        return _repair_increase(tree, end, start, consider_charging, autonomy)
+    return set()
+
+
+def _propagate_decrease(tree, start: int, end: int, weight,
+                        consider_charging: bool, autonomy: float) -> Set[int]:
+    """Propaga una arista más barata: solo bajan distancias desde ``end``."""
+    distances, previous = tree.distances, tree.previous
+    candidate = distances[start] + weight
+    if candidate >= distances[end]:
+        return set()
+
+    offsets, targets, weights = tree.csr.as_lists()
+    roles = tree.csr.role_list()
+    children = tree_children(tree)
+    changed = set()
+
+    def relax(u: int, v: int, distance) -> None:
+        if previous[v] != -1:
+            children[previous[v]].discard(v)
+        distances[v] = distance
+        previous[v] = u
+        children[u].add(v)
+        changed.add(v)
+        heapq.heappush(pq, (distance, v))
+
+    pq = []
+    relax(start, end, candidate)
+    while pq:
+        distance, u = heapq.heappop(pq)
+        if distance > distances[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            w = weights[k]
+            if distance + w < distances[v] and _usable(w, v, roles, consider_charging, autonomy):
+                relax(u, v, distance + w)
+    return changed
+
+
+def _repair_increase(tree, end: int, start: int,
+                     consider_charging: bool, autonomy: float) -> Set[int]:
+    """Reconecta el subárbol de ``end`` si la arista encarecida es del árbol."""
+    distances, previous = tree.distances, tree.previous
+    if previous[end] != start:
+        return set()
+
+    children = tree_children(tree)
+    roles = tree.csr.role_list()
+
+    # Subárbol que cuelga de la arista: solo sus caminos pueden empeorar
+    affected = [end]
+    for u in affected:
+        affected.extend(children[u])
+    members = set(affected)
+    old = {v: (distances[v], previous[v]) for v in affected}
+    children[start].discard(end)
+    for v in affected:
+        children[v].clear()
+        distances[v] = float('inf')
+        previous[v] = -1
+
+    # Mejor entrada a cada vértice del subárbol desde fuera de él
+    r_offsets, r_sources, r_weights = tree.csr.reverse().as_lists()
+    pq = []
+    for v in affected:
+        for k in range(r_offsets[v], r_offsets[v + 1]):
+            u = r_sources[k]
+            if u in members or distances[u] == float('inf'):
+                continue
+            w = r_weights[k]
+            if distances[u] + w < distances[v] and _usable(w, v, roles, consider_charging, autonomy):
+                distances[v] = distances[u] + w
+                previous[v] = u
+        if distances[v] < float('inf'):
+            heapq.heappush(pq, (distances[v], v))
+
+    # Dijkstra dentro del subárbol; los padres se fijan antes que los hijos,
+    # así que un camino cambia si cambia el vértice o alguno de sus ancestros
+    offsets, targets, weights = tree.csr.as_lists()
+    changed = set()
+    settled = set()
+    while pq:
+        distance, u = heapq.heappop(pq)
+        if u in settled or distance > distances[u]:
+            continue
+        settled.add(u)
+        parent = previous[u]
+        children[parent].add(u)
+        if (distance, parent) != old[u] or parent in changed:
+            changed.add(u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if v not in members or v in settled:
+                continue
+            w = weights[k]
+            if distance + w < distances[v] and _usable(w, v, roles, consider_charging, autonomy):
+                distances[v] = distance + w
+                previous[v] = u
+                heapq.heappush(pq, (distance + w, v))
+
+    # Los vértices que no se pudieron reconectar quedan inalcanzables
+    changed.update(v for v in affected if v not in settled)
+    return changed
@@ -0,0 +1,43 @@
+"""
+Utilidades geográficas para los nodos de la red.
+Las posiciones se expresan como (latitud, longitud) en grados.
+"""
+
+import math
+import numpy as np
+
+# Radio medio de la Tierra en kilómetros
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Distancia sobre la superficie terrestre entre dos posiciones.
+
+    Args:
+        lat1, lon1: Posición de origen en grados
+        lat2, lon2: Posición de destino en grados
+
+    Returns:
+        float: Distancia en kilómetros
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_array(lat1: np.ndarray, lon1: np.ndarray,
+                    lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de haversine sobre arreglos de NumPy.
+
+    Returns:
+        np.ndarray: Distancias en kilómetros
+    """
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    a = (np.sin((phi2 - phi1) / 2) ** 2
+         + np.cos(phi1) * np.cos(phi2) * np.sin(np.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
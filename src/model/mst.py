@@ -0,0 +1,213 @@
+"""
+Árbol (bosque) de expansión mínima sobre listas de aristas en arreglos.
+El grafo se trata como no dirigido: de cada par de vértices se conserva la
+arista más liviana. Hay tres implementaciones que devuelven el mismo bosque,
+porque las aristas se comparan por (peso, posición) y ese orden total hace
+único el resultado:
+
+- Kruskal: ``argsort`` de NumPy y Union-Find sobre arreglos.
+- Prim: sobre la matriz de adyacencia, O(n²), conveniente en grafos densos.
+- Borůvka: cada ronda elige en bloque la arista mínima de salida de todas
+  las componentes con operaciones vectorizadas, así que las rondas no
+  recorren aristas en Python y se pueden repartir entre procesos.
+"""
+
+from typing import List, Tuple
+import numpy as np
+from .union_find import UnionFind
+
+# Densidad (aristas / pares de vértices) desde la que se usa Prim
+PRIM_MIN_DENSITY = 0.25
+# Prim usa una matriz n × n, así que se limita a grafos medianos
+PRIM_MAX_VERTICES = 3000
+# Cantidad de vértices desde la que Borůvka supera a Kruskal en grafos dispersos
+BORUVKA_MIN_VERTICES = 1000
+
+MST_METHODS = ("auto", "kruskal", "prim", "boruvka")
+
+
+def undirected_edges(csr) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aristas no dirigidas de un grafo CSR: una por par de vértices, la más
+    liviana, con la orientación de la arista original.
+
+    Args:
+        csr: Grafo CSR
+
+    Returns:
+        Tuple con (sources, targets, weights), ordenadas por par de vértices
+    """
+    n = csr.num_vertices()
+    sources, targets, weights = csr.edge_arrays()
+    sources = sources.astype(np.int64)
+    targets = targets.astype(np.int64)
+    keep = sources != targets
+    sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+    pair = np.minimum(sources, targets) * n + np.maximum(sources, targets)
+    order = np.lexsort((weights, pair))
+    _, first = np.unique(pair[order], return_index=True)
+    chosen = order[first]
+    return sources[chosen], targets[chosen], weights[chosen]
+
+
+def choose_method(num_vertices: int, num_edges: int) -> str:
+    """
+    Elige la implementación según la densidad del grafo.
+
+    Args:
+        num_vertices: Cantidad de vértices
+        num_edges: Cantidad de aristas no dirigidas
+
+    Returns:
+        str: "prim", "boruvka" o "kruskal"
+    """
+    pairs = num_vertices * (num_vertices - 1) / 2
+    if pairs and num_edges / pairs >= PRIM_MIN_DENSITY and num_vertices <= PRIM_MAX_VERTICES:
+        return "prim"
+    if num_vertices >= BORUVKA_MIN_VERTICES:
+        return "boruvka"
+    return "kruskal"
+
+
+def minimum_spanning_forest(graph, method: str = "auto") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcula el bosque de expansión mínima de un grafo.
+
+    Args:
+        graph: Grafo (Graph o CSRGraph)
+        method: "auto" (según la densidad), "kruskal", "prim" o "boruvka"
+
+    Returns:
+        Tuple con (sources, targets, weights) de las aristas del bosque, en
+        ids de vértice y ordenadas por peso
+
+    Raises:
+        ValueError: Si el método no existe
+    """
+    if method not in MST_METHODS:
+        raise ValueError(f'Método de MST "{method}" no soportado')
+    csr = graph.to_csr()
+    n = csr.num_vertices()
+    sources, targets, weights = undirected_edges(csr)
+    if method == "auto":
+        method = choose_method(n, len(weights))
+
+    # Orden total de las aristas: por peso y, a igual peso, por posición
+    rank = np.empty(len(weights), dtype=np.int64)
+    rank[np.lexsort((np.arange(len(weights)), weights))] = np.arange(len(weights))
+
+    if method == "kruskal":
+        chosen = _kruskal(n, sources, targets, rank)
+    elif method == "prim":
+        chosen = _prim(n, sources, targets, rank)
+    else:
+        chosen = _boruvka(n, sources, targets, rank)
+
+    chosen = chosen[np.argsort(rank[chosen])]
+    return sources[chosen], targets[chosen], weights[chosen]
+
+
+def mst_edge_list(graph, method: str = "auto") -> List[Tuple[str, str, float]]:
+    """
+    Bosque de expansión mínima como lista de aristas con nombres.
+
+    Args:
+        graph: Grafo (Graph o CSRGraph)
+        method: Implementación (ver minimum_spanning_forest)
+
+    Returns:
+        list: Tuplas (origen, destino, peso) ordenadas por peso
+    """
+    names = graph.to_csr().names
+    sources, targets, weights = minimum_spanning_forest(graph, method)
+    return [(names[u], names[v], w) for u, v, w in
+            zip(sources.tolist(), targets.tolist(), weights.tolist())]
+
+
+def _kruskal(n: int, sources: np.ndarray, targets: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """Kruskal: aristas en orden creciente, descartando las que cierran ciclos."""
+    order = np.argsort(rank)
+    components = UnionFind(n)
+    union = components.union
+    chosen = []
+    for i, u, v in zip(order.tolist(), sources[order].tolist(), targets[order].tolist()):
+        if union(u, v):
+            chosen.append(i)
+            if components.components == 1:
+                break
+    return np.asarray(chosen, dtype=np.int64)
+
+
+def _prim(n: int, sources: np.ndarray, targets: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """
+    Prim sobre la matriz de adyacencia: cada paso toma con ``argmin`` el
+    vértice más cercano al árbol, O(n²) en total sin importar las aristas.
+    """
+    inf = len(rank)
+    # Rango de la arista entre cada par de vértices (inf si no hay arista)
+    key = np.full((n, n), inf, dtype=np.int64)
+    key[sources, targets] = rank
+    key[targets, sources] = rank
+    edge_of_rank = np.empty(len(rank), dtype=np.int64)
+    edge_of_rank[rank] = np.arange(len(rank))
+
+    in_tree = np.zeros(n, dtype=bool)
+    best = np.full(n, inf, dtype=np.int64)
+    chosen = []
+    for _ in range(n):
+        candidates = np.where(in_tree, inf + 1, best)
+        u = int(np.argmin(candidates))
+        if candidates[u] < inf:
+            chosen.append(edge_of_rank[candidates[u]])
+        # Con candidates[u] == inf empieza otra componente del bosque
+        in_tree[u] = True
+        np.minimum(best, key[u], out=best)
+    return np.asarray(chosen, dtype=np.int64)
+
+
+def _boruvka(n: int, sources: np.ndarray, targets: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """Borůvka vectorizado: en cada ronda cada componente toma su arista mínima."""
+    edge_of_rank = np.empty(len(rank), dtype=np.int64)
+    edge_of_rank[rank] = np.arange(len(rank))
+    component = np.arange(n)
+    active = np.arange(len(sources))
+    chosen = []
+    while active.size:
+        cu = component[sources[active]]
+        cv = component[targets[active]]
+        crossing = cu != cv
+        active, cu, cv = active[crossing], cu[crossing], cv[crossing]
+        if not active.size:
+            break
+
+        # Arista mínima de salida de cada componente, vista desde ambos
+        # extremos: como los rangos son únicos basta el menor rango
+        ranks = rank[active]
+        lightest = np.full(n, len(rank), dtype=np.int64)
+        np.minimum.at(lightest, cu, ranks)
+        np.minimum.at(lightest, cv, ranks)
+        best = edge_of_rank[np.unique(lightest[lightest < len(rank)])]
+        chosen.append(best)
+
+        # Unir las componentes por las aristas elegidas: cada etiqueta apunta
+        # a la menor de su grupo, con saltos de puntero hasta estabilizarse
+        a = component[sources[best]]
+        b = component[targets[best]]
+        label = np.arange(n)
+        while True:
+            la, lb = label[a], label[b]
+            low = np.minimum(la, lb)
+            np.minimum.at(label, la, low)
+            np.minimum.at(label, lb, low)
+            while True:
+                jumped = label[label]
+                if np.array_equal(jumped, label):
+                    break
+                label = jumped
+            if np.array_equal(label[a], label[b]):
+                break
+        component = label[component]
+    if not chosen:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(chosen)
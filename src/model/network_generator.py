@@ -0,0 +1,331 @@
+"""
+Generación de redes sintéticas grandes (de miles a millones de nodos).
+Ninguno de los modos construye la lista de todos los pares de nodos, así que
+el costo crece con la cantidad de aristas y no con n²:
+
+- "random": una cadena sobre una permutación aleatoria garantiza la
+  conectividad, y las aristas extra se sortean por muestreo con rechazo de
+  pares distintos.
+- "geometric": grafo geométrico aleatorio. Los nodos se ubican al azar en
+  una zona alrededor de Temuco y cada uno se une a sus k vecinos más
+  cercanos, buscados con una grilla espacial; el peso crece con la distancia.
+  Las componentes que quedan sueltas se unen a la más grande por su par de
+  nodos más cercano.
+
+Cada conexión se agrega en ambos sentidos y el grafo se arma de una vez a
+partir de arreglos CSR. Con la misma semilla se obtiene la misma red.
+"""
+
+import math
+from typing import List, Optional, Tuple
+import numpy as np
+from .CSRGraph import CSRGraph
+from .Graph import Graph
+from .roles import ROLE_CHARGING, ROLE_CLIENT, ROLE_STORAGE
+from .union_find import component_labels
+
+GENERATOR_MODES = ("random", "geometric")
+
+# Centro de la zona donde se ubican los nodos (Temuco, Chile)
+BASE_LAT, BASE_LON = -38.7385268, -72.5900592
+# Lado de la zona en grados por raíz del número de nodos: la densidad de
+# nodos se mantiene (150 nodos ocupan ~0.02°, como en el mapa del dashboard)
+DEGREES_PER_SQRT_NODE = 0.0015
+# Nodos por celda de la grilla espacial en promedio
+POINTS_PER_CELL = 2
+# Nodos procesados a la vez en la búsqueda de vecinos, para acotar la memoria
+KNN_BATCH = 65536
+
+
+def role_counts(num_nodes: int) -> Tuple[int, int, int]:
+    """
+    Cantidad de nodos de cada tipo: 20% almacenamiento, 20% recarga y el
+    resto clientes, con al menos uno de cada tipo.
+
+    Args:
+        num_nodes: Cantidad total de nodos
+
+    Returns:
+        Tuple con (almacenamiento, recarga, clientes)
+    """
+    storage = max(1, int(num_nodes * 0.2))
+    charging = max(1, int(num_nodes * 0.2))
+    return storage, charging, num_nodes - storage - charging
+
+
+def generate_network(num_nodes: int, num_edges: Optional[int] = None, mode: str = "geometric",
+                     k: int = 4, max_weight: int = 5, seed: Optional[int] = None) -> Graph:
+    """
+    Genera una red conexa con nodos S (almacenamiento), C (recarga) y T
+    (clientes) en las proporciones de role_counts.
+
+    Args:
+        num_nodes: Cantidad de nodos (al menos 3)
+        num_edges: Conexiones en el modo "random" (por defecto 1.5 por nodo);
+            el modo "geometric" usa k en su lugar
+        mode: "random" o "geometric"
+        k: Vecinos más cercanos de cada nodo en el modo "geometric"
+        max_weight: Peso máximo de una arista (los pesos son enteros desde 1)
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        Graph: Red generada; en el modo "geometric" con posiciones
+
+    Raises:
+        ValueError: Si el modo no existe o los parámetros no son válidos
+    """
+    if mode not in GENERATOR_MODES:
+        raise ValueError(f'Modo de generación "{mode}" no soportado')
+    if num_nodes < 3:
+        raise ValueError("La red necesita al menos 3 nodos")
+    if max_weight < 1:
+        raise ValueError("El peso máximo debe ser al menos 1")
+    rng = np.random.default_rng(seed)
+
+    coordinates = None
+    if mode == "random":
+        if num_edges is None:
+            num_edges = max(num_nodes - 1, int(num_nodes * 1.5))
+        max_edges = num_nodes * (num_nodes - 1) // 2
+        if not num_nodes - 1 <= num_edges <= max_edges:
+            raise ValueError(f"El número de aristas debe estar entre {num_nodes - 1} y {max_edges}")
+        sources, targets = _random_pairs(num_nodes, num_edges, rng)
+        weights = rng.integers(1, max_weight + 1, size=len(sources))
+    else:
+        if not 1 <= k < num_nodes:
+            raise ValueError(f"k debe estar entre 1 y {num_nodes - 1}")
+        points = rng.random((num_nodes, 2))
+        sources, targets, distances = _geometric_pairs(points, k)
+        weights = _distance_weights(distances, max_weight)
+        side = DEGREES_PER_SQRT_NODE * math.sqrt(num_nodes)
+        coordinates = np.column_stack((BASE_LAT + (points[:, 0] - 0.5) * side,
+                                       BASE_LON + (points[:, 1] - 0.5) * side))
+
+    return _build_graph(num_nodes, sources, targets, weights, coordinates)
+
+
+def _node_names(num_nodes: int) -> Tuple[List[str], np.ndarray]:
+    """Nombres y roles de los nodos: primero S, luego C y al final T."""
+    storage, charging, clients = role_counts(num_nodes)
+    names = ([f"S{i + 1}" for i in range(storage)] +
+             [f"C{i + 1}" for i in range(charging)] +
+             [f"T{i + 1}" for i in range(clients)])
+    roles = np.repeat(np.array([ROLE_STORAGE, ROLE_CHARGING, ROLE_CLIENT], dtype=np.int8),
+                      [storage, charging, clients])
+    return names, roles
+
+
+def _build_graph(num_nodes: int, sources: np.ndarray, targets: np.ndarray,
+                 weights: np.ndarray, coordinates: Optional[np.ndarray]) -> Graph:
+    """Arma el grafo con cada conexión en ambos sentidos."""
+    names, roles = _node_names(num_nodes)
+    all_sources = np.concatenate((sources, targets)).astype(np.int64)
+    all_targets = np.concatenate((targets, sources)).astype(np.int32)
+    all_weights = np.concatenate((weights, weights)).astype(np.int64)
+
+    order = np.lexsort((all_targets, all_sources))
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(all_sources, minlength=num_nodes), out=offsets[1:])
+    csr = CSRGraph(names, offsets, all_targets[order], all_weights[order], roles, coordinates)
+    return Graph.from_csr(csr)
+
+
+def _random_pairs(num_nodes: int, num_edges: int, rng) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cadena sobre una permutación aleatoria más aristas extra distintas,
+    sorteadas en bloques y descartando pares repetidos.
+    """
+    chain = rng.permutation(num_nodes).astype(np.int64)
+    u, v = chain[:-1], chain[1:]
+    keys = np.minimum(u, v) * num_nodes + np.maximum(u, v)
+    missing = num_edges - len(keys)
+
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    if missing > max_edges // 2:
+        # Red densa (solo posible con pocos nodos): sortear entre todos los
+        # pares libres es más barato que rechazar la mayoría de los intentos
+        a, b = np.triu_indices(num_nodes, 1)
+        free = np.setdiff1d(a * num_nodes + b, keys)
+        keys = np.concatenate((keys, rng.choice(free, size=missing, replace=False)))
+    else:
+        while missing > 0:
+            size = int(missing * 1.2) + 16
+            a = rng.integers(0, num_nodes, size=size)
+            b = rng.integers(0, num_nodes, size=size)
+            drawn = np.minimum(a, b) * num_nodes + np.maximum(a, b)
+            drawn = drawn[a != b]
+            # Únicos en el orden en que se sortearon, para no sesgar el corte
+            _, first = np.unique(drawn, return_index=True)
+            drawn = drawn[np.sort(first)]
+            drawn = drawn[~np.isin(drawn, keys)][:missing]
+            keys = np.concatenate((keys, drawn))
+            missing -= len(drawn)
+    return keys // num_nodes, keys % num_nodes
+
+
+def _geometric_pairs(points: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pares de nodos de los k vecinos más cercanos de cada nodo, más las
+    uniones necesarias para que el grafo quede conexo.
+
+    Returns:
+        Tuple con (sources, targets, distancias), un par por conexión
+    """
+    n = len(points)
+    grid = _Grid(points)
+    neighbors, distances = grid.k_nearest(k)
+    u = np.repeat(np.arange(n), k)
+    v = neighbors.ravel()
+    d = distances.ravel()
+
+    keys = np.minimum(u, v) * n + np.maximum(u, v)
+    keys, first = np.unique(keys, return_index=True)
+    u, v, d = keys // n, keys % n, d[first]
+
+    extra_u, extra_v, extra_d = _join_components(grid, component_labels(n, u, v))
+    return (np.concatenate((u, extra_u)), np.concatenate((v, extra_v)),
+            np.concatenate((d, extra_d)))
+
+
+def _distance_weights(distances: np.ndarray, max_weight: int) -> np.ndarray:
+    """
+    Pesos enteros de 1 a max_weight proporcionales a la distancia; el tope
+    corresponde al percentil 99 de las distancias, para que unas pocas
+    uniones largas no compriman el resto de los pesos.
+    """
+    if not len(distances):
+        return np.zeros(0, dtype=np.int64)
+    unit = np.percentile(distances, 99) / max_weight
+    if unit <= 0:
+        return np.ones(len(distances), dtype=np.int64)
+    return np.clip(np.ceil(distances / unit), 1, max_weight).astype(np.int64)
+
+
+def _join_components(grid: '_Grid', labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Une cada componente suelta a la más grande: se busca, anillo por anillo
+    de la grilla, el nodo de la componente grande más cercano a algún nodo
+    de la componente suelta.
+    """
+    components, sizes = np.unique(labels, return_counts=True)
+    main = components[np.argmax(sizes)]
+    in_main = labels == main
+    extra = ([], [], [])
+    for component in components:
+        if component == main:
+            continue
+        members = np.flatnonzero(labels == component)
+        best = (math.inf, -1, -1)
+        for node in members.tolist():
+            target, distance = grid.nearest_where(node, in_main)
+            if distance < best[0]:
+                best = (distance, node, target)
+        extra[0].append(best[1])
+        extra[1].append(best[2])
+        extra[2].append(best[0])
+    return (np.asarray(extra[0], dtype=np.int64), np.asarray(extra[1], dtype=np.int64),
+            np.asarray(extra[2], dtype=np.float64))
+
+
+class _Grid:
+    """
+    Grilla espacial sobre puntos del cuadrado unitario: los puntos se ordenan
+    por celda y cada celda guarda el rango de sus puntos en ese orden.
+    """
+
+    def __init__(self, points: np.ndarray):
+        self.points = points
+        n = len(points)
+        self.side = max(1, int(math.sqrt(n / POINTS_PER_CELL)))
+        self.cell_size = 1.0 / self.side
+        cells = np.minimum((points * self.side).astype(np.int64), self.side - 1)
+        self.cx, self.cy = cells[:, 0], cells[:, 1]
+        cell_ids = self.cx * self.side + self.cy
+        self.order = np.argsort(cell_ids, kind="stable")
+        sorted_ids = cell_ids[self.order]
+        all_cells = np.arange(self.side * self.side)
+        self.starts = np.searchsorted(sorted_ids, all_cells)
+        self.ends = np.searchsorted(sorted_ids, all_cells, side="right")
+
+    def _candidates(self, nodes: np.ndarray, radius: int) -> np.ndarray:
+        """
+        Puntos de las celdas a distancia de Chebyshev ``radius`` o menos de
+        la celda de cada nodo, rellenando con -1.
+        """
+        columns = []
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                x = self.cx[nodes] + dx
+                y = self.cy[nodes] + dy
+                inside = (x >= 0) & (x < self.side) & (y >= 0) & (y < self.side)
+                cell = np.where(inside, x * self.side + y, 0)
+                start = self.starts[cell]
+                count = np.where(inside, self.ends[cell] - start, 0)
+                for j in range(int(count.max(initial=0))):
+                    columns.append(np.where(j < count, self.order[np.minimum(start + j, len(self.order) - 1)], -1))
+        if not columns:
+            return np.full((len(nodes), 1), -1, dtype=np.int64)
+        return np.column_stack(columns)
+
+    def k_nearest(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Los k vecinos más cercanos de cada punto. Un resultado buscado en las
+        celdas a distancia r es exacto si el k-ésimo vecino está a menos de
+        r celdas; si no, el punto se vuelve a buscar con un radio mayor.
+
+        Returns:
+            Tuple con (vecinos, distancias), arreglos (n, k)
+        """
+        n = len(self.points)
+        neighbors = np.empty((n, k), dtype=np.int64)
+        distances = np.empty((n, k))
+        pending = np.arange(n)
+        radius = 1
+        while len(pending):
+            unresolved = []
+            for begin in range(0, len(pending), KNN_BATCH):
+                nodes = pending[begin:begin + KNN_BATCH]
+                candidates = self._candidates(nodes, radius)
+                valid = (candidates >= 0) & (candidates != nodes[:, None])
+                delta = self.points[np.maximum(candidates, 0)] - self.points[nodes][:, None, :]
+                dist = np.where(valid, np.hypot(delta[..., 0], delta[..., 1]), np.inf)
+                if dist.shape[1] < k:
+                    unresolved.append(nodes)
+                    continue
+                nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                near_dist = np.take_along_axis(dist, nearest, axis=1)
+                order = np.argsort(near_dist, axis=1)
+                nearest = np.take_along_axis(nearest, order, axis=1)
+                near_dist = np.take_along_axis(near_dist, order, axis=1)
+                # Con todas las celdas ya revisadas no puede haber vecinos más lejos
+                exact = (near_dist[:, -1] <= radius * self.cell_size) | (radius >= self.side)
+                done = nodes[exact]
+                neighbors[done] = np.take_along_axis(candidates[exact], nearest[exact], axis=1)
+                distances[done] = near_dist[exact]
+                unresolved.append(nodes[~exact])
+            pending = np.concatenate(unresolved)
+            radius += 1
+        return neighbors, distances
+
+    def nearest_where(self, node: int, mask: np.ndarray) -> Tuple[int, float]:
+        """
+        El punto más cercano a un nodo entre los que cumplen la máscara.
+
+        Returns:
+            Tuple con (punto, distancia), o (-1, inf) si ninguno la cumple
+        """
+        nodes = np.array([node])
+        radius = 1
+        while True:
+            candidates = self._candidates(nodes, radius)[0]
+            candidates = candidates[candidates >= 0]
+            candidates = candidates[mask[candidates]]
+            if len(candidates):
+                delta = self.points[candidates] - self.points[node]
+                dist = np.hypot(delta[:, 0], delta[:, 1])
+                best = int(np.argmin(dist))
+                if dist[best] <= radius * self.cell_size or radius >= self.side:
+                    return int(candidates[best]), float(dist[best])
+            elif radius >= self.side:
+                return -1, math.inf
+            radius += 1
@@ -0,0 +1,211 @@
+"""
+Cálculo de rutas en paralelo con un pool de procesos.
+Cada proceso recibe una sola vez una instantánea compacta del grafo (CSR) y
+luego atiende lotes de pares origen/destino agrupados por origen; quien
+calcula muchos lotes sobre el mismo grafo reutiliza el pool (ver reuse). Los
+resultados se ubican por posición, así que no dependen del orden en que
+terminan los procesos ni de la cantidad de procesos.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Estado de cada proceso del pool, creado por _init_worker
+_worker_state: Dict = {}
+
+
+def _init_worker(csr) -> None:
+    """
+    Inicializa un proceso: reconstruye el grafo desde la instantánea CSR.
+
+    Args:
+        csr: Instantánea del grafo
+    """
+    from .Graph import Graph
+
+    _worker_state['graph'] = Graph.from_csr(csr)
+
+
+def _in_worker(function, chunk: List[Tuple[str, str]], *args) -> List[Dict]:
+    """Ejecuta una función de lote sobre el grafo del proceso."""
+    return function(_worker_state['graph'], chunk, *args)
+
+
+def _route_chunk(graph, pairs: List[Tuple[str, str]], consider_charging: bool) -> List[Dict]:
+    """Rutas de Dijkstra de un lote de pares, en el orden del lote."""
+    from .algorithms import RouteOptimizer
+
+    return RouteOptimizer(graph)._route_pairs(pairs, consider_charging)
+
+
+def _charging_chunk(graph, pairs: List[Tuple[str, str]], autonomy: float) -> List[Dict]:
+    """Rutas con recargas de un lote de pares, en el orden del lote."""
+    from .charging_overlay import route_with_charging
+
+    return [route_with_charging(graph, start, end, autonomy) for start, end in pairs]
+
+
+def default_workers() -> int:
+    """Cantidad de procesos por defecto: un proceso por núcleo disponible."""
+    return os.cpu_count() or 1
+
+
+class ParallelRouter:
+    """
+    Enrutador que reparte lotes de pares entre procesos.
+
+    Se usa como administrador de contexto para cerrar el pool al terminar:
+
+        with ParallelRouter(graph, workers=8) as router:
+            results = router.route_many(pairs)
+    """
+
+    def __init__(self, graph, workers: Optional[int] = None, autonomy: float = 50,
+                 chunks_per_worker: int = 4):
+        """
+        Inicializa el enrutador tomando una instantánea del grafo.
+
+        Args:
+            graph: Grafo (Graph o CSRGraph); los cambios posteriores no se ven
+            workers: Cantidad de procesos (None para uno por núcleo)
+            autonomy: Autonomía máxima del dron
+            chunks_per_worker: Lotes por proceso, para repartir mejor la carga
+        """
+        self.graph = graph
+        self.csr = graph.to_csr()
+        self.version = getattr(graph, 'version', None)  # Los cambios de pesos no crean otro CSR
+        self.workers = max(1, workers or default_workers())
+        self.autonomy = autonomy
+        self.chunks_per_worker = chunks_per_worker
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def reuse(cls, router: Optional['ParallelRouter'], graph, workers: Optional[int] = None,
+              autonomy: float = 50) -> 'ParallelRouter':
+        """
+        Devuelve el enrutador dado si se creó sobre la misma instantánea del
+        grafo, con los mismos procesos y autonomía, para seguir usando su
+        pool; si no, lo cierra y crea otro.
+
+        Args:
+            router: Enrutador anterior (o None)
+            graph: Grafo actual
+            workers: Cantidad de procesos (None para uno por núcleo)
+            autonomy: Autonomía máxima del dron
+
+        Returns:
+            ParallelRouter: Enrutador para el grafo actual
+        """
+        if (router is not None and router.csr is graph.to_csr()
+                and router.version == getattr(graph, 'version', None)
+                and router.workers == max(1, workers or default_workers())
+                and router.autonomy == autonomy):
+            return router
+        if router is not None:
+            router.close()
+        return cls(graph, workers, autonomy)
+
+    def __enter__(self) -> 'ParallelRouter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cierra el pool de procesos."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _run(self, function, chunks: List[List[Tuple[str, str]]], *args) -> List[List[Dict]]:
+        """
+        Ejecuta una función de lote sobre cada lote. Con un solo proceso se
+        ejecuta en el proceso actual, sin pool.
+
+        Returns:
+            list: Resultados de cada lote, en el orden de los lotes
+        """
+        if self.workers == 1:
+            if not hasattr(self.graph, 'charging_overlay'):
+                # Las rutas con recargas usan las cachés de Graph
+                from .Graph import Graph
+                self.graph = Graph.from_csr(self.csr)
+            return [function(self.graph, chunk, *args) for chunk in chunks]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     initializer=_init_worker,
+                                                     initargs=(self.csr,))
+        futures = [self._executor.submit(_in_worker, function, chunk, *args) for chunk in chunks]
+        return [future.result() for future in futures]
+
+    def _partition(self, pairs: List[Tuple[str, str]]) -> List[List[int]]:
+        """
+        Reparte los índices de los pares en lotes, sin separar los pares de
+        un mismo origen, de modo que cada origen se busca en un solo proceso.
+
+        Returns:
+            list: Lotes de índices de pares
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, (origin, _) in enumerate(pairs):
+            groups.setdefault(origin, []).append(i)
+
+        count = min(len(groups), self.workers * self.chunks_per_worker) or 1
+        chunks: List[List[int]] = [[] for _ in range(count)]
+        sizes = [0] * count
+        # Los orígenes más cargados primero, cada uno al lote más liviano;
+        # el desempate por posición hace el reparto determinista
+        ordered = sorted(groups.values(), key=lambda indices: (-len(indices), indices[0]))
+        for indices in ordered:
+            target = min(range(count), key=lambda c: (sizes[c], c))
+            chunks[target].extend(indices)
+            sizes[target] += len(indices)
+        return [chunk for chunk in chunks if chunk]
+
+    def route_many(self, pairs: Iterable[Tuple[str, str]],
+                   consider_charging: bool = True) -> List[Dict]:
+        """
+        Calcula rutas de Dijkstra para muchos pares en paralelo.
+
+        Args:
+            pairs: Pares (origen, destino)
+            consider_charging: Si considerar estaciones de recarga
+
+        Returns:
+            Lista de resultados en el orden de entrada, con el formato de
+            RouteOptimizer.route_many
+        """
+        pairs = list(pairs)
+        partition = self._partition(pairs)
+        chunks = [[pairs[i] for i in indices] for indices in partition]
+        results: List[Optional[Dict]] = [None] * len(pairs)
+        for indices, chunk_results in zip(partition, self._run(_route_chunk, chunks, consider_charging)):
+            for i, result in zip(indices, chunk_results):
+                results[i] = result
+        return results
+
+    def find_paths_with_charging(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """
+        Calcula rutas con recargas para muchos pares en paralelo; los pares
+        repetidos se calculan una sola vez.
+
+        Args:
+            pairs: Pares (origen, destino)
+
+        Returns:
+            dict: (origen, destino) -> resultado en el formato de
+            ChargingAwareRouter.find_path, en el orden de primera aparición
+        """
+        unique = list(dict.fromkeys(pairs))
+        partition = self._partition(unique)
+        chunks = [[unique[i] for i in indices] for indices in partition]
+        results: List[Optional[Dict]] = [None] * len(unique)
+        for indices, chunk_results in zip(partition, self._run(_charging_chunk, chunks, self.autonomy)):
+            for i, result in zip(indices, chunk_results):
+                results[i] = result
+        return dict(zip(unique, results))
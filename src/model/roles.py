@@ -0,0 +1,48 @@
+"""
+Roles de los vértices de la red logística.
+Cada vértice del grafo guarda su rol como un entero pequeño, de modo que los
+algoritmos comparan enteros en lugar de analizar el nombre del nodo.
+"""
+
+ROLE_UNKNOWN = 0
+ROLE_STORAGE = 1
+ROLE_CHARGING = 2
+ROLE_CLIENT = 3
+
+# Nombre del tipo de nodo indexado por rol
+ROLE_NAMES = ('unknown', 'storage', 'charging', 'client')
+
+_ROLES_BY_NAME = {name: role for role, name in enumerate(ROLE_NAMES)}
+_ROLES_BY_PREFIX = {'S': ROLE_STORAGE, 'C': ROLE_CHARGING, 'T': ROLE_CLIENT}
+
+
+def role_from_name(node_type):
+    """
+    Convierte un nombre de tipo ('storage', 'charging', 'client') en su rol.
+
+    Args:
+        node_type: Nombre del tipo de nodo o rol entero
+
+    Returns:
+        int: Rol correspondiente (ROLE_UNKNOWN si no se reconoce)
+    """
+    if isinstance(node_type, int):
+        return node_type if 0 <= node_type < len(ROLE_NAMES) else ROLE_UNKNOWN
+    return _ROLES_BY_NAME.get(node_type, ROLE_UNKNOWN)
+
+
+def infer_role(vertex):
+    """
+    Deduce el rol a partir de la convención de nombres S*/C*/T*.
+    Solo se usa como respaldo cuando un vértice se agrega sin rol explícito
+    (por ejemplo, grafos reconstruidos desde datos antiguos).
+
+    Args:
+        vertex: Identificador del vértice
+
+    Returns:
+        int: Rol deducido
+    """
+    if isinstance(vertex, str) and vertex:
+        return _ROLES_BY_PREFIX.get(vertex[0], ROLE_UNKNOWN)
+    return ROLE_UNKNOWN
@@ -0,0 +1,216 @@
+"""
+Caché compartida de resultados de rutas.
+Las entradas se identifican por (versión del grafo, origen, destino,
+algoritmo, autonomía): como la versión cambia con cada modificación del
+grafo (ver Graph.version), un resultado nunca se sirve para un grafo
+distinto del que lo produjo y no hace falta invalidar nada a mano. Las
+entradas de versiones viejas simplemente dejan de pedirse y salen por LRU.
+
+La caché puede guardarse en disco junto con la huella del grafo; al cargarla
+solo se aceptan las entradas si la huella coincide con el grafo actual, y se
+vuelven a asociar a su versión.
+"""
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from .contraction_hierarchy import graph_fingerprint
+
+# Cantidad de rutas guardadas por defecto
+DEFAULT_MAX_ENTRIES = 50000
+
+RouteKey = Tuple[int, str, str, str, Optional[float]]
+
+
+class RouteCache:
+    """
+    Caché LRU acotada de resultados de rutas, con contadores de aciertos y
+    fallos. Los resultados se comparten entre quienes los piden, así que no
+    deben modificarse.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_entries: Cantidad máxima de rutas guardadas
+        """
+        if max_entries < 1:
+            raise ValueError("La caché debe admitir al menos una ruta")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[RouteKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(graph, origin: str, destination: str, algorithm: str,
+            autonomy: Optional[float]) -> RouteKey:
+        """
+        Clave de una ruta.
+
+        Args:
+            graph: Grafo sobre el que se calcula la ruta
+            origin: Nodo de origen
+            destination: Nodo de destino
+            algorithm: Nombre del algoritmo (con sus parámetros si los tiene)
+            autonomy: Autonomía usada, o None si la ruta no la considera
+
+        Returns:
+            Tuple: Clave de la caché
+        """
+        return (graph.version, origin, destination, algorithm, autonomy)
+
+    def get(self, graph, origin: str, destination: str, algorithm: str,
+            autonomy: Optional[float]) -> Optional[Any]:
+        """
+        Busca una ruta y cuenta el acierto o el fallo.
+
+        Returns:
+            El resultado guardado, o None si no está
+        """
+        key = self.key(graph, origin, destination, algorithm, autonomy)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def contains(self, graph, origin: str, destination: str, algorithm: str,
+                 autonomy: Optional[float]) -> bool:
+        """Indica si una ruta está guardada, sin contarla ni renovarla."""
+        return self.key(graph, origin, destination, algorithm, autonomy) in self._entries
+
+    def put(self, graph, origin: str, destination: str, algorithm: str,
+            autonomy: Optional[float], result: Any) -> None:
+        """
+        Guarda una ruta, descartando las menos usadas si se supera el límite.
+
+        Args:
+            result: Resultado a guardar (no puede ser None)
+        """
+        key = self.key(graph, origin, destination, algorithm, autonomy)
+        with self._lock:
+            self._store(key, result)
+
+    def _store(self, key: RouteKey, result: Any) -> None:
+        """Guarda una entrada; se llama con el candado tomado."""
+        entries = self._entries
+        entries[key] = result
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, graph, origin: str, destination: str, algorithm: str,
+                       autonomy: Optional[float], compute: Callable[[], Any]) -> Any:
+        """
+        Devuelve la ruta guardada o la calcula y la guarda.
+
+        Args:
+            graph: Grafo sobre el que se calcula la ruta
+            origin: Nodo de origen
+            destination: Nodo de destino
+            algorithm: Nombre del algoritmo
+            autonomy: Autonomía usada, o None si la ruta no la considera
+            compute: Función sin argumentos que calcula el resultado
+
+        Returns:
+            El resultado guardado o recién calculado
+        """
+        result = self.get(graph, origin, destination, algorithm, autonomy)
+        if result is None:
+            result = compute()
+            self.put(graph, origin, destination, algorithm, autonomy, result)
+        return result
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia los contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Estadísticas de uso de la caché.
+
+        Returns:
+            dict: Entradas, límite, aciertos, fallos, descartes y tasa de aciertos
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def save(self, path: str, graph) -> int:
+        """
+        Guarda en disco las rutas de la versión actual de un grafo, junto con
+        la huella del grafo.
+
+        Args:
+            path: Archivo de destino
+            graph: Grafo cuyas rutas se guardan
+
+        Returns:
+            int: Cantidad de rutas guardadas
+        """
+        version = graph.version
+        with self._lock:
+            entries = [(key[1:], result) for key, result in self._entries.items()
+                       if key[0] == version]
+        payload = {'fingerprint': graph_fingerprint(graph.to_csr()), 'entries': entries}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return len(entries)
+
+    def load(self, path: str, graph) -> int:
+        """
+        Carga rutas guardadas con save si corresponden al grafo, asociándolas
+        a su versión actual.
+
+        Args:
+            path: Archivo a leer
+            graph: Grafo actual
+
+        Returns:
+            int: Cantidad de rutas cargadas (0 si el archivo no existe o es
+            de otro grafo)
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+            ValueError: Si el archivo está dañado o no es una caché de rutas
+        """
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            raise ValueError(f"Archivo de caché de rutas dañado o incompatible: {e}") from e
+        if not isinstance(payload, dict) or not isinstance(payload.get('entries'), list):
+            raise ValueError("El archivo no contiene una caché de rutas")
+        if payload.get('fingerprint') != graph_fingerprint(graph.to_csr()):
+            return 0
+        version = graph.version
+        with self._lock:
+            for key, result in payload['entries']:
+                self._store((version,) + tuple(key), result)
+        return len(payload['entries'])
+
+
+# Instancia compartida por el dashboard, la API y la generación de órdenes
+route_cache = RouteCache()
@@ -0,0 +1,196 @@
+"""
+Árboles de caminos más cortos por origen.
+Una sola ejecución de Dijkstra desde un origen responde cualquier destino
+recorriendo los punteros al nodo anterior, por lo que conviene guardar el
+árbol completo de los orígenes frecuentes (por ejemplo, los almacenes).
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Árboles guardados por defecto: cada uno ocupa memoria proporcional al grafo
+DEFAULT_MAX_TREES = 32
+
+
+class ShortestPathTree:
+    """
+    Árbol de caminos más cortos desde un vértice de origen.
+    """
+
+    def __init__(self, csr, source: int, distances: List[float], previous: List[int]):
+        """
+        Inicializa el árbol a partir del resultado de Dijkstra.
+
+        Args:
+            csr: Grafo CSR sobre el que se calculó el árbol
+            source: Id del vértice de origen
+            distances: Distancia mínima a cada vértice, indexada por id
+            previous: Id del vértice anterior en el árbol (-1 si no tiene)
+        """
+        self.csr = csr
+        self.source = source
+        self.distances = distances
+        self.previous = previous
+        self.children = None  # Hijos de cada vértice, ver dynamic_sssp
+
+    def distance(self, end: str) -> float:
+        """
+        Obtiene la distancia mínima desde el origen.
+
+        Returns:
+            float: Distancia (inf si no es alcanzable o no existe)
+        """
+        v = self.csr.vertex_id(end)
+        return float('inf') if v is None else self.distances[v]
+
+    def path_ids(self, target: int) -> Optional[List[int]]:
+        """
+        Reconstruye el camino hasta un vértice como lista de ids.
+
+        Returns:
+            list: Ids desde el origen hasta el destino, o None si no hay camino
+        """
+        if self.previous[target] == -1 and target != self.source:
+            return None
+        path = []
+        while target != -1:
+            path.append(target)
+            target = self.previous[target]
+        return path[::-1]
+
+    def path(self, end: str) -> Tuple[Optional[List[str]], float]:
+        """
+        Reconstruye el camino más corto desde el origen.
+
+        Args:
+            end: Vértice de destino
+
+        Returns:
+            Tuple con (camino, costo). El camino es None si no hay ruta.
+        """
+        v = self.csr.vertex_id(end)
+        if v is None:
+            return None, float('inf')
+        ids = self.path_ids(v)
+        if ids is None:
+            return None, float('inf')
+        names = self.csr.names
+        return [names[i] for i in ids], self.distances[v]
+
+
+class ShortestPathTreeCache:
+    """
+    Cache LRU acotada de árboles de caminos más cortos, uno por origen.
+    Se vacía cuando el grafo cambia.
+    """
+
+    def __init__(self, graph, consider_charging: bool = False, max_trees: int = DEFAULT_MAX_TREES):
+        """
+        Inicializa la cache.
+
+        Args:
+            graph: Grafo (Graph o CSRGraph)
+            consider_charging: Si aplicar la restricción de autonomía de Dijkstra
+            max_trees: Cantidad máxima de árboles guardados; al superarla se
+                descartan los menos usados
+        """
+        if max_trees < 1:
+            raise ValueError("La cache debe admitir al menos un árbol")
+        self.graph = graph
+        self.consider_charging = consider_charging
+        self.max_trees = max_trees
+        self._trees: "OrderedDict[str, ShortestPathTree]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, source: str) -> Optional[ShortestPathTree]:
+        """
+        Obtiene el árbol de un origen, calculándolo con un solo Dijkstra si
+        no está en la cache.
+
+        Args:
+            source: Vértice de origen
+
+        Returns:
+            ShortestPathTree: Árbol del origen, o None si el vértice no existe
+        """
+        tree = self._trees.get(source)
+        if tree is not None:
+            self._trees.move_to_end(source)
+        else:
+            from .algorithms import DijkstraAlgorithm
+
+            csr = self.graph.to_csr()
+            source_id = csr.vertex_id(source)
+            if source_id is None:
+                return None
+            distances, previous, _ = DijkstraAlgorithm(csr).search(
+                source_id, consider_charging=self.consider_charging)
+            tree = ShortestPathTree(csr, source_id, distances, previous)
+            self._trees[source] = tree
+            while len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+                self.evictions += 1
+        return tree
+
+    def warm(self, sources: Iterable[str]) -> None:
+        """
+        Calcula de antemano los árboles de varios orígenes. Con más orígenes
+        que max_trees solo quedan los últimos.
+
+        Args:
+            sources: Vértices de origen
+        """
+        for source in sources:
+            self.get(source)
+
+    def path(self, start: str, end: str) -> Tuple[Optional[List[str]], float]:
+        """
+        Obtiene el camino más corto entre dos vértices usando el árbol del origen.
+
+        Returns:
+            Tuple con (camino, costo). El camino es None si no hay ruta.
+        """
+        tree = self.get(start)
+        if tree is None:
+            return None, float('inf')
+        return tree.path(end)
+
+    def update_edge(self, start: int, end: int, old_weight, new_weight) -> Dict[str, Set[int]]:
+        """
+        Repara los árboles calculados tras cambiar el peso de una arista, sin
+        recalcularlos (a lo más max_trees árboles). Los árboles de un CSR
+        anterior al actual se descartan.
+
+        Args:
+            start: Id del vértice de inicio de la arista
+            end: Id del vértice de fin de la arista
+            old_weight: Peso anterior
+            new_weight: Peso nuevo (ya aplicado al CSR)
+
+        Returns:
+            dict: Origen -> ids de los destinos cuyo camino o costo cambió,
+            solo para los orígenes con cambios
+        """
+        from .dynamic_sssp import repair_tree
+
+        csr = self.graph.to_csr()
+        report = {}
+        for source, tree in list(self._trees.items()):
+            if tree.csr is not csr:
+                del self._trees[source]
+                continue
+            changed = repair_tree(tree, start, end, old_weight, new_weight,
+                                  self.consider_charging)
+            if changed:
+                report[source] = changed
+        return report
+
+    def invalidate(self) -> None:
+        """Descarta todos los árboles calculados."""
+        self._trees.clear()
+
+    def __contains__(self, source: str) -> bool:
+        return source in self._trees
+
+    def __len__(self) -> int:
+        return len(self._trees)
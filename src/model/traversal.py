@@ -0,0 +1,173 @@
+"""
+Recorridos iterativos del grafo (BFS y DFS).
+Los recorridos son generadores: entregan los vértices a medida que los
+visitan, así que se pueden cortar en cualquier momento sin recorrer el resto
+del grafo. BFS usa una ``deque`` (extracción O(1)) y DFS una pila explícita
+de iteradores, sin recursión, de modo que no dependen del límite de
+recursión de Python en grafos profundos.
+"""
+
+from collections import deque
+from typing import Callable, Hashable, Iterable, Iterator, List, Optional, Set
+
+
+def _sources(graph, sources) -> List[Hashable]:
+    """Normaliza los orígenes: un vértice o un iterable de vértices."""
+    if isinstance(sources, str):
+        return [sources]
+    try:
+        if sources in graph.adjacency_list:
+            return [sources]
+    except TypeError:  # Iterables no hashables, como listas
+        pass
+    return list(dict.fromkeys(sources))
+
+
+def bfs(graph, sources, max_depth: Optional[int] = None,
+        stop: Optional[Callable[[Hashable], bool]] = None,
+        with_depth: bool = False) -> Iterator:
+    """
+    Recorrido en anchura desde uno o varios orígenes.
+
+    Args:
+        graph: Grafo con lista de adyacencia
+        sources: Vértice de origen o iterable de orígenes (todos con profundidad 0)
+        max_depth: Profundidad máxima a visitar (None para no limitar)
+        stop: Predicado de corte; el recorrido termina después de entregar
+            el primer vértice que lo cumple
+        with_depth: Si entregar tuplas (vértice, profundidad)
+
+    Yields:
+        Vértices en orden de visita (o tuplas con su profundidad)
+    """
+    adjacency = graph.adjacency_list
+    empty = ()
+    starts = _sources(graph, sources)
+    visited = set(starts)
+    queue = deque((vertex, 0) for vertex in starts)
+
+    while queue:
+        vertex, depth = queue.popleft()
+        yield (vertex, depth) if with_depth else vertex
+        if stop is not None and stop(vertex):
+            return
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbor in adjacency.get(vertex, empty):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1))
+
+
+def dfs(graph, sources, max_depth: Optional[int] = None,
+        stop: Optional[Callable[[Hashable], bool]] = None,
+        with_depth: bool = False) -> Iterator:
+    """
+    Recorrido en profundidad (preorden) desde uno o varios orígenes, en el
+    mismo orden que la versión recursiva.
+
+    Args:
+        graph: Grafo con lista de adyacencia
+        sources: Vértice de origen o iterable de orígenes, recorridos en orden
+        max_depth: Profundidad máxima a visitar (None para no limitar)
+        stop: Predicado de corte; el recorrido termina después de entregar
+            el primer vértice que lo cumple
+        with_depth: Si entregar tuplas (vértice, profundidad)
+
+    Yields:
+        Vértices en orden de visita (o tuplas con su profundidad)
+    """
+    adjacency = graph.adjacency_list
+    empty = ()
+    visited = set()
+
+    for source in _sources(graph, sources):
+        if source in visited:
+            continue
+        visited.add(source)
+        yield (source, 0) if with_depth else source
+        if stop is not None and stop(source):
+            return
+        # Pila de (iterador de vecinos, profundidad del vértice dueño)
+        stack = [(iter(adjacency.get(source, empty)), 0)]
+        while stack:
+            neighbors, depth = stack[-1]
+            if max_depth is not None and depth >= max_depth:
+                stack.pop()
+                continue
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield (neighbor, depth + 1) if with_depth else neighbor
+                    if stop is not None and stop(neighbor):
+                        return
+                    stack.append((iter(adjacency.get(neighbor, empty)), depth + 1))
+                    break
+            else:
+                stack.pop()
+
+
+def dfs_postorder(graph, sources: Optional[Iterable] = None) -> Iterator:
+    """
+    Recorrido en profundidad en postorden: cada vértice se entrega después
+    de todos los alcanzables desde él que no se habían visitado.
+
+    Args:
+        graph: Grafo con lista de adyacencia
+        sources: Orígenes (None para todos los vértices, en orden de inserción)
+
+    Yields:
+        Vértices en postorden
+    """
+    adjacency = graph.adjacency_list
+    empty = ()
+    visited = set()
+    if sources is None:
+        sources = list(adjacency)
+
+    for source in _sources(graph, sources):
+        if source in visited:
+            continue
+        visited.add(source)
+        stack = [(source, iter(adjacency.get(source, empty)))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append((neighbor, iter(adjacency.get(neighbor, empty))))
+                    break
+            else:
+                stack.pop()
+                yield vertex
+
+
+def topological_sort(graph) -> List[Hashable]:
+    """
+    Orden topológico (postorden invertido) de todos los vértices.
+
+    Args:
+        graph: Grafo con lista de adyacencia
+
+    Returns:
+        list: Vértices en orden topológico si el grafo es acíclico
+    """
+    order = list(dfs_postorder(graph))
+    order.reverse()
+    return order
+
+
+def reachable(graph, sources, max_depth: Optional[int] = None) -> Set[Hashable]:
+    """
+    Conjunto de vértices alcanzables desde los orígenes siguiendo la
+    dirección de las aristas.
+
+    Args:
+        graph: Grafo con lista de adyacencia
+        sources: Vértice de origen o iterable de orígenes
+        max_depth: Profundidad máxima (None para no limitar)
+
+    Returns:
+        set: Vértices alcanzables, incluidos los orígenes
+    """
+    return set(bfs(graph, sources, max_depth))
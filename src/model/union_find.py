@@ -0,0 +1,138 @@
+"""
+Estructura Union-Find (conjuntos disjuntos) sobre ids enteros densos.
+Usa unión por tamaño y compresión de caminos por división a la mitad, ambas
+iterativas, así que no depende del límite de recursión de Python.
+Para grafos grandes ya armados, ``component_labels`` calcula las componentes
+con NumPy y ``UnionFind.from_labels`` crea la estructura a partir de ellas.
+"""
+
+from typing import List
+import numpy as np
+
+
+def component_labels(n: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Componente de cada vértice, identificada por su menor id, por propagación
+    de etiquetas con saltos de puntero, sin recorrer las aristas en Python.
+
+    Args:
+        n: Cantidad de vértices
+        sources: Vértice de inicio de cada arista
+        targets: Vértice de fin de cada arista
+
+    Returns:
+        np.ndarray: Etiqueta de cada vértice
+    """
+    label = np.arange(n)
+    while True:
+        ls, lt = label[sources], label[targets]
+        if np.array_equal(ls, lt):
+            return label
+        low = np.minimum(ls, lt)
+        np.minimum.at(label, ls, low)
+        np.minimum.at(label, lt, low)
+        while True:
+            jumped = label[label]
+            if np.array_equal(jumped, label):
+                break
+            label = jumped
+
+
+class UnionFind:
+    """
+    Conjuntos disjuntos sobre los ids ``0..n-1``, ampliable con ``add``.
+    """
+
+    def __init__(self, n: int = 0):
+        """
+        Inicializa n conjuntos de un elemento.
+
+        Args:
+            n: Cantidad inicial de elementos
+        """
+        self.parent: List[int] = list(range(n))
+        self.size: List[int] = [1] * n
+        self.components = n
+
+    @classmethod
+    def from_labels(cls, labels: List[int]) -> 'UnionFind':
+        """
+        Crea la estructura con los conjuntos dados por etiquetas, donde la
+        etiqueta de cada conjunto es uno de sus elementos (ver component_labels).
+
+        Args:
+            labels: Etiqueta de cada elemento
+
+        Returns:
+            UnionFind: Estructura con cada elemento apuntando a su etiqueta
+        """
+        components = cls()
+        components.parent = list(labels)
+        size = [0] * len(labels)
+        for label in components.parent:
+            size[label] += 1
+        components.size = [count or 1 for count in size]
+        components.components = sum(1 for x, label in enumerate(components.parent) if x == label)
+        return components
+
+    def add(self) -> int:
+        """
+        Agrega un elemento en un conjunto propio.
+
+        Returns:
+            int: Id del nuevo elemento
+        """
+        element = len(self.parent)
+        self.parent.append(element)
+        self.size.append(1)
+        self.components += 1
+        return element
+
+    def find(self, x: int) -> int:
+        """
+        Encuentra la raíz del conjunto de un elemento.
+
+        Args:
+            x: Id del elemento
+
+        Returns:
+            int: Id de la raíz
+        """
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """
+        Une los conjuntos de dos elementos.
+
+        Args:
+            x: Id del primer elemento
+            y: Id del segundo elemento
+
+        Returns:
+            bool: True si estaban en conjuntos distintos
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.components -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        """Verifica si dos elementos están en el mismo conjunto."""
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        """Cantidad de elementos del conjunto de un elemento."""
+        return self.size[self.find(x)]
+
+    def __len__(self) -> int:
+        return len(self.parent)
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from .tda.Map import Map
+from .model.roles import ROLE_NAMES, infer_role
 
 @dataclass
 class SharedSimulationData:
@@ -43,6 +44,9 @@ class SharedDataManager:
         # Maps para acceso O(1) a clientes y órdenes
         self._clients_map = Map()
         self._orders_map = Map()
+        # Grafo reconstruido y versión del archivo de la que proviene
+        self._graph = None
+        self._graph_data_version = None
     
     def _convert_datetime_to_string(self, obj):
         """Convertir objetos datetime a strings para serialización JSON"""
@@ -140,14 +144,16 @@ class SharedDataManager:
                     try:
                         graph_data = {
                             'vertices': list(graph.vertices()),
+                            'node_types': {v: graph.get_node_type(v) for v in graph.vertices()},
+                            'positions': {v: list(p) for v, p in graph.positions().items()},
                             'edges': []
                         }
-                        for edge in graph.edges():
+                        for start, end, weight in graph.iter_edges(directed=True):
                             # Solo serializar datos básicos, no métodos
                             graph_data['edges'].append({
-                                'start': str(edge.start),
-                                'end': str(edge.end),
-                                'weight': float(edge.element())
+                                'start': str(start),
+                                'end': str(end),
+                                'weight': float(weight)
                             })
                     except Exception as e:
                         print(f"⚠️  Error serializando grafo: {e}")
@@ -211,6 +217,13 @@ class SharedDataManager:
             traceback.print_exc()
             return None
     
+    def data_version(self) -> Optional[float]:
+        """Marca de modificación del archivo compartido (None si no existe)"""
+        try:
+            return os.path.getmtime(self._data_file)
+        except OSError:
+            return None
+    
     def is_initialized(self) -> bool:
         """Verificar si la simulación está inicializada"""
         data = self._load_data()
@@ -238,7 +251,16 @@ class SharedDataManager:
         return []
     
     def get_graph(self):
-        """Obtener el grafo reconstruido desde los datos serializados"""
+        """
+        Obtener el grafo reconstruido desde los datos serializados. El grafo
+        solo se reconstruye si el archivo cambió; si no, se devuelve el mismo
+        objeto (y su ``version``, así que las cachés que dependen de él siguen
+        siendo válidas).
+        """
+        version = self.data_version()
+        if self._graph is not None and self._graph_data_version == version:
+            return self._graph
+        
         data = self._load_data()
         if not data or 'graph' not in data or not data['graph']:
             return None
@@ -250,21 +272,40 @@ class SharedDataManager:
             graph = Graph()
             graph_data = data['graph']
             
-            # Agregar vértices
+            # Agregar vértices con su rol (los datos antiguos no traen tipos)
+            node_types = graph_data.get('node_types', {})
             for vertex in graph_data['vertices']:
-                graph.add_vertex(vertex)
+                graph.add_vertex(vertex, node_types.get(vertex))
             
             # Agregar aristas
             for edge_data in graph_data['edges']:
                 graph.add_edge(edge_data['start'], edge_data['end'], edge_data['weight'])
             
+            # Restaurar posiciones geográficas (usadas por A*)
+            graph.set_positions(graph_data.get('positions', {}))
+            
             print(f"✅ Grafo reconstruido: {len(graph_data['vertices'])} nodos, {len(graph_data['edges'])} aristas")
+            self._graph = graph
+            self._graph_data_version = version
             return graph
             
         except Exception as e:
             print(f"❌ Error reconstruyendo grafo: {e}")
             return None
     
+    def get_node_types(self) -> Dict:
+        """Obtener el tipo de cada nodo ('storage', 'charging', 'client') según el grafo guardado"""
+        data = self._load_data()
+        if data and data.get('graph'):
+            return data['graph'].get('node_types', {})
+        return {}
+    
+    def get_node_type(self, node: str, node_types: Optional[Dict] = None) -> str:
+        """Obtener el tipo de un nodo usando los tipos guardados, o su ID si no están disponibles"""
+        if node_types and node in node_types:
+            return node_types[node]
+        return ROLE_NAMES[infer_role(node)]
+    
     def get_nodes_from_routes(self) -> List:
         """Obtener lista de nodos únicos desde las rutas"""
         routes = self.get_routes()
@@ -327,9 +368,12 @@ class SharedDataManager:
         node_visits = data.get('node_visits', {})
         
         # Contar nodos por tipo basado en las visitas
-        storage_nodes = [n for n in node_visits.keys() if n.startswith('S')]
-        charging_nodes = [n for n in node_visits.keys() if n.startswith('C')]
-        client_nodes = [n for n in node_visits.keys() if n.startswith('T')]
+        graph_data = data.get('graph') or {}
+        node_types = graph_data.get('node_types', {})
+        types = {n: self.get_node_type(n, node_types) for n in node_visits.keys()}
+        storage_nodes = [n for n, t in types.items() if t == 'storage']
+        charging_nodes = [n for n, t in types.items() if t == 'charging']
+        client_nodes = [n for n, t in types.items() if t == 'client']
         
         total_nodes = len(set(list(node_visits.keys())))
         
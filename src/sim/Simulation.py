@@ -1,33 +1,570 @@
+"""
+Simulación de eventos discretos de la flota de drones.
+Cada almacén tiene su flota; las órdenes llegan a su almacén de origen y
+esperan en una cola FIFO hasta que haya un dron libre. El dron despega,
+recorre arista por arista la ruta de la orden, recarga en las estaciones
+(nodos de carga) cuando la batería no alcanza hasta la próxima estación,
+entrega y vuelve a su base, donde cambia la batería (ver Simulation._mission).
+
+Las estaciones tienen pads limitados y cola de espera (ver charging); al
+despachar, el dron reserva un pad para cada recarga prevista y, si alguna
+estación ya está saturada en ese horario, se busca una ruta que no recargue
+en ella.
+
+El tiempo está en minutos y la energía en unidades de peso de arista, igual
+que la autonomía del resto del sistema. El consumo sigue el modelo de los
+enrutadores: las aristas que salen o llegan a una estación no gastan batería.
+"""
+
+import heapq
+import random
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from src.model.roles import ROLE_CHARGING, ROLE_STORAGE
+from src.model.charging_overlay import route_with_charging
+from src.model.route_cache import route_cache
+from src.model.algorithms import ChargingAwareRouter
+from .SimulationInitializer import ROUTE_CACHE_ALGORITHM
+from .charging import (ChargingStation, PRIORITY_RANK, DEFAULT_PRIORITY_RANK, QUEUE_POLICIES,
+                       WAIT_BIN_LABELS, charge_model)
+from .drone import Drone, Mission, IDLE, TAKEOFF, FLYING, QUEUED, CHARGING, DELIVERING
+from .events import (EventQueue, ORDER_ARRIVAL, TAKEOFF_DONE, EDGE_ARRIVAL,
+                     CHARGE_DONE, DELIVERY_DONE, EVENT_NAMES)
+
+# Minutos de un día de operación
+DAY_MINUTES = 24 * 60
+
+# Rutas alternativas guardadas por par origen/destino para evitar estaciones saturadas
+MAX_DETOURS = 3
+
+
 class Simulation:
-    def __init__(self, graph):
+    """
+    Simulación de eventos discretos de la flota. El tiempo está en minutos y
+    avanza de evento en evento (ver events): llegadas de órdenes, fin de
+    despegue, llegada al final de una arista, fin de recarga y fin de
+    entrega. Cada evento cambia el estado de un dron (ver drone) y programa
+    el siguiente. Las distancias son pesos de aristas recorridos a ``speed``
+    unidades por minuto, la batería está en las mismas unidades y las
+    recargas ocupan un pad de su estación (ver charging).
+    """
+
+    def __init__(self, graph, drones_per_storage: int = 3, autonomy: float = 50,
+                 speed: float = 1.0, charge_rate: float = 5.0, takeoff_time: float = 1.0,
+                 service_time: float = 2.0, pads: int = 2, station_pads: Optional[Dict[str, int]] = None,
+                 charge: Union[str, object] = "linear", queue_policy: str = "fifo",
+                 avoid_saturated: bool = True):
+        """
+        Inicializa la simulación con una flota en cada almacén del grafo.
+
+        Args:
+            graph: Grafo del sistema (con roles asignados)
+            drones_per_storage: Drones con base en cada almacén
+            autonomy: Autonomía de cada dron (carga completa)
+            speed: Unidades de peso recorridas por minuto
+            charge_rate: Unidades de carga por minuto de los modelos "linear" y "tapered"
+            takeoff_time: Minutos que tarda un despegue
+            service_time: Minutos que tarda una entrega
+            pads: Pads de cada estación de recarga
+            station_pads: Pads de estaciones particulares (estación -> pads)
+            charge: Modelo de carga: "linear", "tapered", "swap" o un objeto
+                con el método duration(batería, capacidad)
+            queue_policy: Cola de las estaciones: "fifo" o "priority"
+            avoid_saturated: Si desviar las misiones que recargarían en una
+                estación con todos los pads reservados
+
+        Raises:
+            ValueError: Si algún parámetro no es positivo
+        """
+        if drones_per_storage < 1:
+            raise ValueError("Cada almacén necesita al menos un dron")
+        if min(autonomy, speed, charge_rate) <= 0 or min(takeoff_time, service_time) < 0:
+            raise ValueError("Los parámetros de la flota deben ser positivos")
+        if pads < 1:
+            raise ValueError("Cada estación necesita al menos un pad")
+        if queue_policy not in QUEUE_POLICIES:
+            raise ValueError(f"Política de cola desconocida: {queue_policy}")
         self.graph = graph
+        self.autonomy = autonomy
+        self.speed = speed
+        self.charge_rate = charge_rate
+        self.charge_model = charge_model(charge, charge_rate) if isinstance(charge, str) else charge
+        self.pads = pads
+        self.station_pads = station_pads or {}
+        self.queue_policy = queue_policy
+        self.avoid_saturated = avoid_saturated
+        self.stations: Dict[str, ChargingStation] = {}
+        self.takeoff_time = takeoff_time
+        self.service_time = service_time
         self.orders = []
+        self.queue = EventQueue()
+        self.drones: List[Drone] = []
+        self.idle: Dict[str, List[Drone]] = {}
+        self.pending: Dict[str, deque] = {}  # Órdenes en espera por almacén (FIFO)
+        self._missions: Dict[Tuple[str, str], Union[Mission, str]] = {}
+        self._detours: Dict[Tuple[str, str], List[Mission]] = {}
+        for storage in graph.vertices_with_role(ROLE_STORAGE):
+            fleet = [Drone(f"{storage}-D{i + 1}", storage, autonomy) for i in range(drones_per_storage)]
+            self.drones.extend(fleet)
+            self.idle[storage] = fleet
+            self.pending[storage] = deque()
+        self._reset_metrics()
+
+    def _reset_metrics(self) -> None:
+        """Reinicia las métricas acumuladas."""
+        self.now = 0.0
+        self.events_processed = 0
+        self.event_counts = [0] * len(EVENT_NAMES)
+        self.accepted = 0
+        self.latencies: List[float] = []
+        self.waits: List[float] = []
+        self.unserved: Dict[str, int] = {}
+        self.reroutes = 0
+        self.detour_time = 0.0
+        self.wall_time = 0.0
+        self.planning_time = 0.0
+
+    def add_orders(self, orders: Iterable, arrivals: Optional[Iterable[float]] = None,
+                   rate: float = 1.0, start: float = 0.0, seed: Optional[int] = None) -> int:
+        """
+        Programa la llegada de órdenes y planifica sus misiones (una por par
+        origen/destino), para que la simulación no calcule rutas. Sin tiempos
+        explícitos las llegadas siguen un proceso de Poisson con la tasa
+        indicada.
+
+        Args:
+            orders: Órdenes (objetos Order con origen en un almacén)
+            arrivals: Minuto de llegada de cada orden (opcional)
+            rate: Órdenes por minuto si no se dan los tiempos
+            start: Minuto desde el que se generan las llegadas
+            seed: Semilla de los tiempos de llegada
+
+        Returns:
+            int: Cantidad de órdenes programadas
+        """
+        orders = list(orders)
+        if arrivals is None:
+            if rate <= 0:
+                raise ValueError("La tasa de llegada debe ser positiva")
+            rng = random.Random(seed)
+            arrivals = []
+            clock = start
+            for _ in orders:
+                clock += rng.expovariate(rate)
+                arrivals.append(clock)
+        else:
+            arrivals = list(arrivals)
+            if len(arrivals) != len(orders):
+                raise ValueError("Debe haber un tiempo de llegada por orden")
+        started = time.perf_counter()
+        for order in orders:
+            if order.origin in self.pending:
+                self._mission(order)
+        self.planning_time += time.perf_counter() - started
+
+        push = self.queue.push
+        for order, arrival in zip(orders, arrivals):
+            push(arrival, ORDER_ARRIVAL, order)
+        self.orders.extend(orders)
+        return len(orders)
+
+    def _route(self, origin: str, destination: str) -> List[str]:
+        """Camino con recargas de la caché compartida ([] si no hay ruta completa)."""
+        result = route_cache.get_or_compute(
+            self.graph, origin, destination, ROUTE_CACHE_ALGORITHM, self.autonomy,
+            lambda: route_with_charging(self.graph, origin, destination, self.autonomy))
+        return result['path'] if result['completed'] else []
+
+    def _weights(self, path: List[str]) -> List[float]:
+        """Pesos de las aristas de un camino."""
+        edge_weights = self.graph.edge_weights
+        return [edge_weights[(path[i], path[i + 1])] for i in range(len(path) - 1)]
+
+    def _nearest_station(self, node: str) -> Tuple[List[str], List[float]]:
+        """
+        Camino más corto desde un nodo hasta la estación de recarga más
+        cercana, sin pasar la autonomía. Como la vuelta, usa las aristas en
+        cualquier sentido.
+
+        Returns:
+            Tuple con (camino, pesos) hasta la estación (listas vacías si
+            ninguna está al alcance)
+        """
+        csr = self.graph.to_csr()
+        roles = csr.role_list()
+        adjacency = (csr.as_lists(), csr.reverse().as_lists())
+        source = csr.vertex_id(node)
+        dist = {source: 0.0}
+        previous = {}
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if u != source and roles[u] == ROLE_CHARGING:
+                path, weights = [u], []
+                while u != source:
+                    u, weight = previous[u]
+                    path.append(u)
+                    weights.append(weight)
+                return [csr.names[v] for v in reversed(path)], weights[::-1]
+            for offsets, targets, edge_weights in adjacency:
+                for k in range(offsets[u], offsets[u + 1]):
+                    v, nd = targets[k], d + edge_weights[k]
+                    if nd <= self.autonomy and nd < dist.get(v, float('inf')):
+                        dist[v] = nd
+                        previous[v] = (u, edge_weights[k])
+                        heapq.heappush(heap, (nd, v))
+        return [], []
+
+    def _round_trip(self, path: List[str], forward: List[float],
+                    unavailable: frozenset = frozenset()) -> Optional[Mission]:
+        """
+        Misión que recorre un camino hasta el cliente y vuelve por el mismo
+        camino en sentido inverso, con los mismos pesos (corredores aéreos).
+        Calcula la energía necesaria desde cada nodo hasta la próxima estación
+        de recarga o el final y las recargas previstas.
+
+        Args:
+            path: Camino desde la base hasta el cliente
+            forward: Peso de cada arista del camino
+            unavailable: Estaciones donde no se recarga
+
+        Returns:
+            Mission, o None si algún tramo entre recargas supera la autonomía
+        """
+        nodes = path + path[-2::-1]
+        weights = forward + forward[::-1]
+        charging = [self.graph.get_role(node) == ROLE_CHARGING and node not in unavailable
+                    for node in nodes]
+        energy = [0.0 if charging[i] or charging[i + 1] else weight for i, weight in enumerate(weights)]
+        need = [0.0] * len(nodes)
+        for i in range(len(weights) - 1, -1, -1):
+            need[i] = energy[i] + (0.0 if charging[i + 1] else need[i + 1])
+        # Desde la base y desde cada estación se sale con la batería llena
+        if any(need[i] > self.autonomy for i in range(len(weights)) if i == 0 or charging[i]):
+            return None
+
+        # Recargas previstas: la misma política que sigue el dron en _advance
+        delivery_step = len(forward)
+        stops = []
+        clock = self.takeoff_time
+        battery = self.autonomy
+        for i, weight in enumerate(weights):
+            if i == delivery_step:
+                clock += self.service_time
+            if charging[i] and battery < need[i]:
+                duration = self.charge_model.duration(battery, self.autonomy)
+                stops.append((i, clock, duration))
+                clock += duration
+                battery = self.autonomy
+            clock += weight / self.speed
+            battery -= energy[i]
+        return Mission(nodes, weights, energy, need, charging, delivery_step, stops)
+
+    def _mission(self, order) -> Union[Mission, str]:
+        """
+        Misión de ida y vuelta de una orden, compartida por todas las órdenes
+        con el mismo origen y destino. La ida es la ruta asignada a la orden
+        (o la ruta con recargas de la caché compartida si no tiene), si la
+        batería que queda al llegar al cliente alcanza para volver hasta la
+        última estación. Si no, el dron va hasta la estación más cercana al
+        cliente y de ahí al cliente, y recarga en ella antes y después de la
+        entrega.
+
+        Returns:
+            Mission, o el motivo por el que la orden no puede atenderse
+        """
+        pair = (order.origin, order.destination)
+        mission = self._missions.get(pair)
+        if mission is not None:
+            return mission
+
+        if order.route is not None and order.route.nodes:
+            path = list(order.route.nodes)
+        else:
+            path = self._route(order.origin, order.destination)
+        if len(path) < 2:
+            mission = 'sin_ruta'
+        else:
+            mission = self._round_trip(path, self._weights(path))
+            station_path, near = self._nearest_station(order.destination) if mission is None else ([], [])
+            to_station = self._route(order.origin, station_path[-1]) if station_path else []
+            if to_station:
+                mission = self._round_trip(to_station + station_path[-2::-1],
+                                           self._weights(to_station) + near[::-1])
+            if mission is None:
+                mission = 'sin_autonomia'
+        self._missions[pair] = mission
+        return mission
+
+    def _station(self, name: str) -> ChargingStation:
+        """Estación de recarga de un nodo (se crea al usarla por primera vez)."""
+        station = self.stations.get(name)
+        if station is None:
+            station = self.stations[name] = ChargingStation(
+                name, self.station_pads.get(name, self.pads), self.queue_policy)
+        return station
+
+    def _detour(self, order, mission: Mission, now: float) -> Mission:
+        """
+        Si alguna recarga prevista de la misión cae en una estación con todos
+        los pads reservados, usa una ruta alternativa del mismo par origen/
+        destino sin estaciones saturadas. Las alternativas se guardan (hasta
+        MAX_DETOURS por par) y solo se busca una nueva, evitando todas las
+        estaciones saturadas, si ninguna de las guardadas sirve.
+
+        Returns:
+            La misión con menos estaciones saturadas
+        """
+        saturated = self.saturated_stations(mission, now)
+        if not saturated:
+            return mission
+        alternatives = self._detours.setdefault((order.origin, order.destination), [])
+        best, best_saturated = mission, saturated
+        avoid = set(saturated)
+        for alternative in alternatives:
+            alternative_saturated = self.saturated_stations(alternative, now)
+            if len(alternative_saturated) < len(best_saturated):
+                best, best_saturated = alternative, alternative_saturated
+                if not best_saturated:
+                    break
+            avoid.update(alternative_saturated)
+
+        if best_saturated and len(alternatives) < MAX_DETOURS:
+            avoid = frozenset(avoid)
+            started = time.perf_counter()
+            result = ChargingAwareRouter(self.graph, self.autonomy, avoid).find_path(
+                order.origin, order.destination)
+            self.detour_time += time.perf_counter() - started
+            detour = None
+            if result['completed'] and len(result['path']) > 1:
+                detour = self._round_trip(result['path'], self._weights(result['path']), avoid)
+            # Un intento fallido también cuenta para el límite
+            alternatives.append(detour or mission)
+            if detour is not None:
+                detour_saturated = self.saturated_stations(detour, now)
+                if len(detour_saturated) < len(best_saturated):
+                    best = detour
+
+        if best is not mission:
+            self.reroutes += 1
+        return best
+
+    def saturated_stations(self, mission: Mission, now: float) -> List[str]:
+        """
+        Estaciones de las recargas previstas de una misión despachada en now
+        que ya tienen todos los pads reservados en ese horario.
+
+        Args:
+            mission: Misión planificada
+            now: Momento del despacho
+
+        Returns:
+            list: Estaciones saturadas
+        """
+        return [mission.nodes[step] for step, offset, duration in mission.stops
+                if self._station(mission.nodes[step]).is_saturated(now + offset, now + offset + duration)]
+
+    def _dispatch(self, drone: Drone, order, arrival: float, now: float) -> None:
+        """Asigna una orden a un dron libre, reserva sus recargas y lo hace despegar."""
+        mission = self._missions[(order.origin, order.destination)]
+        if self.avoid_saturated and mission.stops:
+            mission = self._detour(order, mission, now)
+        drone.start_mission(order, arrival, mission, PRIORITY_RANK.get(order.priority, DEFAULT_PRIORITY_RANK))
+        for step, offset, duration in mission.stops:
+            station = self._station(mission.nodes[step])
+            start = now + offset
+            key = station.reserve(start, start + duration, drone) if duration > 0 else None
+            drone.reservations.append((station, key))
+        drone.transition(TAKEOFF, now)
+        self.waits.append(now - arrival)
+        self.queue.push(now + self.takeoff_time, TAKEOFF_DONE, drone)
+
+    def _advance(self, drone: Drone, now: float) -> None:
+        """Desde el nodo actual de la misión: recarga si hace falta o vuela la próxima arista."""
+        step = drone.step
+        if drone.charging[step] and drone.battery < drone.need[step]:
+            station = self._station(drone.node)
+            if station.arrive(drone, drone.priority, now):
+                self._start_charge(drone, station, now)
+            else:
+                drone.transition(QUEUED, now)
+            return
+        weight = drone.weights[step]
+        duration = weight / self.speed
+        drone.transition(FLYING, now)
+        drone.battery -= drone.energy[step]
+        drone.flight_time += duration
+        self.queue.push(now + duration, EDGE_ARRIVAL, drone)
+
+    def _start_charge(self, drone: Drone, station: ChargingStation, now: float) -> None:
+        """El dron ocupa un pad y carga hasta completar la batería."""
+        duration = self.charge_model.duration(drone.battery, self.autonomy)
+        station.start_charge(duration)
+        drone.transition(CHARGING, now)
+        self.queue.push(now + duration, CHARGE_DONE, drone)
+
+    def _on_order_arrival(self, order, now: float) -> None:
+        """Llega una orden: se descarta si no tiene misión, se despacha o espera un dron libre."""
+        origin = order.origin
+        if origin not in self.pending:
+            self.unserved['sin_flota'] = self.unserved.get('sin_flota', 0) + 1
+            return
+        mission = self._missions[(origin, order.destination)]
+        if isinstance(mission, str):
+            self.unserved[mission] = self.unserved.get(mission, 0) + 1
+            return
+        self.accepted += 1
+        idle = self.idle[origin]
+        if idle:
+            self._dispatch(idle.pop(), order, now, now)
+        else:
+            self.pending[origin].append((order, now))
+
+    def _on_edge_arrival(self, drone: Drone, now: float) -> None:
+        """El dron llega al final de una arista: entrega, vuelve a la base o sigue la misión."""
+        drone.step += 1
+        step = drone.step
+        drone.node = drone.nodes[step]
+        if step == drone.delivery_step:
+            drone.transition(DELIVERING, now)
+            self.queue.push(now + self.service_time, DELIVERY_DONE, drone)
+        elif step == len(drone.weights):
+            self._on_base_arrival(drone, now)
+        else:
+            self._advance(drone, now)
+
+    def _on_delivery_done(self, drone: Drone, now: float) -> None:
+        """El dron terminó de entregar: registra la latencia y emprende el regreso."""
+        self.latencies.append(now - drone.arrival)
+        drone.deliveries += 1
+        self._advance(drone, now)
+
+    def _on_charge_done(self, drone: Drone, now: float) -> None:
+        """El dron terminó de cargar: libera su pad y reserva, y sigue la misión."""
+        drone.battery = self.autonomy
+        reserved, key = drone.reservations.popleft()
+        if key is not None:
+            reserved.cancel(key)
+        station = self.stations[drone.node]
+        waiting = station.release(now)
+        if waiting is not None:
+            self._start_charge(waiting, station, now)
+        self._advance(drone, now)
+
+    def _on_base_arrival(self, drone: Drone, now: float) -> None:
+        """El dron vuelve a su base: cambia la batería y toma la próxima orden en espera."""
+        drone.transition(IDLE, now)
+        drone.battery = self.autonomy
+        drone.finish_mission()
+        waiting = self.pending[drone.base]
+        if waiting:
+            order, arrival = waiting.popleft()
+            self._dispatch(drone, order, arrival, now)
+        else:
+            self.idle[drone.base].append(drone)
+
+    def run(self, until: Optional[float] = None) -> Dict:
+        """
+        Procesa los eventos en orden de tiempo.
+
+        Args:
+            until: Minuto en que se detiene la simulación (None para procesar
+                todos los eventos)
+
+        Returns:
+            dict: Estadísticas de la simulación (ver generate_statistics)
+        """
+        queue = self.queue
+        counts = self.event_counts
+        on_edge_arrival = self._on_edge_arrival
+        handlers = {
+            ORDER_ARRIVAL: self._on_order_arrival,
+            TAKEOFF_DONE: self._advance,
+            EDGE_ARRIVAL: on_edge_arrival,
+            CHARGE_DONE: self._on_charge_done,
+            DELIVERY_DONE: self._on_delivery_done,
+        }
+        limit = float('inf') if until is None else until
+        processed = 0
+        started = time.perf_counter()
+        pop, peek_time = queue.pop, queue.peek_time
+        while queue and peek_time() <= limit:
+            now, _, kind, target = pop()
+            self.now = now
+            counts[kind] += 1
+            processed += 1
+            if kind == EDGE_ARRIVAL:
+                on_edge_arrival(target, now)
+            else:
+                handlers[kind](target, now)
+        if until is not None:
+            self.now = max(self.now, until)
+        self.wall_time += time.perf_counter() - started
+        self.events_processed += processed
+        return self.generate_statistics()
+
+    def generate_statistics(self) -> Dict:
+        """
+        Estadísticas de la simulación hasta el momento actual.
+
+        Returns:
+            dict: Eventos procesados y su velocidad (sin contar las búsquedas
+            de rutas alternativas, que se informan aparte), órdenes entregadas,
+            throughput (entregas por hora), latencia y espera (minutos desde
+            la llegada de la orden), uso de la flota, esperas para recargar
+            (media, máxima e histograma) y estadísticas de cada estación
+            usada (ver ChargingStation.statistics)
+        """
+        horizon = self.now
+        # Velocidad del motor sin las búsquedas de rutas alternativas
+        engine_time = self.wall_time - self.detour_time
+        latencies = np.asarray(self.latencies, dtype=np.float64)
+        waits = np.asarray(self.waits, dtype=np.float64)
+
+        def summary(values):
+            if not len(values):
+                return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+            p50, p95 = np.percentile(values, [50, 95])
+            return {'mean': float(values.mean()), 'p50': float(p50), 'p95': float(p95),
+                    'max': float(values.max())}
 
-    def initialize(self, num_nodes, num_orders):
-        # Inicializar nodos
-        for i in range(num_nodes):
-            self.graph.add_edge(f'Node_{i}', f'Node_{(i+1) % num_nodes}')
-
-        # Inicializar órdenes
-        for j in range(num_orders):
-            self.orders.append(f'Order_{j}')
-
-        print(f'Initialized with {num_nodes} nodes and {num_orders} orders.')
-
-    def run(self):
-        # Ejecutar la simulación
-        print('Running simulation...')
-        for order in self.orders:
-            # Simular procesamiento de cada orden
-            print(f'Processing {order}')
-        print('Simulation complete.')
-
-    def generate_statistics(self):
-        # Generar estadísticas de la simulación
-        print('Generating statistics...')
-        num_nodes = len(self.graph.adjacency_list)
-        num_orders = len(self.orders)
-        print(f'Total nodes: {num_nodes}')
-        print(f'Total orders: {num_orders}')
-        # Aquí se pueden agregar más estadísticas
-        print('Statistics generation complete.') 
\ No newline at end of file
+        busy = sum(drone.busy_time + (horizon - drone.since if drone.state != IDLE else 0.0)
+                   for drone in self.drones)
+        stations = {name: station.statistics(horizon) for name, station in self.stations.items()
+                    if station.charges or station.queue}
+        histogram = [sum(counts) for counts in zip(*(station.wait_histogram
+                                                      for station in self.stations.values()))]
+        charge_arrivals = sum(histogram)
+        charging_wait = {
+            'mean': (sum(station.total_wait for station in self.stations.values()) / charge_arrivals
+                     if charge_arrivals else 0.0),
+            'max': max((station.max_wait for station in self.stations.values()), default=0.0),
+            'histogram': dict(zip(WAIT_BIN_LABELS, histogram or [0] * len(WAIT_BIN_LABELS))),
+        }
+        in_queue = sum(len(waiting) for waiting in self.pending.values())
+        return {
+            'simulated_minutes': horizon,
+            'events': self.events_processed,
+            'events_by_type': dict(zip(EVENT_NAMES, self.event_counts)),
+            'planning_seconds': self.planning_time,
+            'wall_seconds': self.wall_time,
+            'detour_seconds': self.detour_time,
+            'events_per_second': self.events_processed / engine_time if engine_time > 0 else 0.0,
+            'orders': len(self.orders),
+            'delivered': len(self.latencies),
+            'unserved': dict(self.unserved),
+            'waiting': in_queue,
+            'in_flight': self.accepted - len(self.latencies) - in_queue,
+            'throughput_per_hour': len(self.latencies) * 60 / horizon if horizon else 0.0,
+            'latency': summary(latencies),
+            'wait': summary(waits),
+            'drones': len(self.drones),
+            'fleet_utilization': busy / (len(self.drones) * horizon) if self.drones and horizon else 0.0,
+            'charging_wait': charging_wait,
+            'reroutes': self.reroutes,
+            'stations': stations,
+        }
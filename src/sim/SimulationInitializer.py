@@ -1,25 +1,55 @@
 import random
 import string
 from src.model.Graph import Graph
+from src.model.roles import ROLE_CHARGING, ROLE_CLIENT, ROLE_STORAGE, ROLE_NAMES, infer_role
+from src.model.charging_overlay import route_with_charging
+from src.model.parallel_router import ParallelRouter
+from src.model.route_cache import route_cache
+from src.model.network_generator import generate_network
 from src.domain.Client import Client
-from src.domain.Order import Order
-from src.domain.Route import Route
-import streamlit as st
-from collections import deque
+from src.sim.order_stream import (DEFAULT_BUFFER_SIZE, random_pairs, route_stage,
+                                  assign_stage, persist_stage)
+
+# Nombre de las rutas con recargas en la caché compartida de rutas
+ROUTE_CACHE_ALGORITHM = "charging_overlay"
+
+
+def notify_console(level, message):
+    """
+    Muestra un aviso del simulador por consola (uso sin interfaz).
+    
+    Args:
+        level: "info", "warning" o "error"
+        message: Texto del aviso
+    """
+    icons = {'info': 'ℹ️', 'warning': '⚠️', 'error': '❌'}
+    print(f"{icons.get(level, '•')} {message}")
+
 
 class SimulationInitializer:
-    def __init__(self):
+    def __init__(self, notify=None, progress=None):
         """
-        Inicializa el simulador.
+        Inicializa el simulador. No depende de ninguna interfaz: los avisos y
+        el progreso se entregan a funciones que decide quien lo usa.
+        
+        Args:
+            notify: Función (nivel, mensaje) para avisos y errores no fatales;
+                por defecto se muestran por consola
+            progress: Función (etapa, hechos, total) llamada durante las
+                etapas largas ("routes" y "orders"), o None
         """
+        self.notify = notify or notify_console
+        self.progress = progress
         self.graph = None
         self.orders = []
         self.clients = []
         self.routes = []
         self.route_frequencies = {}
+        self.routes_created = 0  # Rutas distintas creadas por el último flujo de órdenes
         self.node_types = {}
         self.DRONE_AUTONOMY = 50
-        self.path_cache = {}  # Cache para rutas ya calculadas
+        self.workers = 1  # Procesos para calcular rutas en lote (ver ParallelRouter)
+        self._parallel = None  # ParallelRouter reutilizado entre lotes del mismo grafo
         self._storage_nodes = []  # Cache para nodos de almacenamiento
         self._charging_nodes = []  # Cache para nodos de carga
         self._client_nodes = []  # Cache para nodos de cliente
@@ -62,10 +92,21 @@ class SimulationInitializer:
                     
         return letters[:count]
 
-    def initialize_network(self, num_nodes, num_edges=None):
+    def initialize_network(self, num_nodes, num_edges=None, mode=None, seed=None, k=4):
         """
         Inicializa la red con la distribución correcta de nodos y sus tipos.
+        
+        Args:
+            num_nodes: Número total de nodos
+            num_edges: Número de aristas
+            mode: None para la red del dashboard (10 a 150 nodos), o "random"
+                o "geometric" para redes grandes (ver generate_network)
+            seed: Semilla de la red en los modos "random" y "geometric"
+            k: Vecinos más cercanos de cada nodo en el modo "geometric"
         """
+        if mode is not None:
+            return self._initialize_generated_network(num_nodes, num_edges, mode, seed, k)
+        
         # Validación de entrada
         if num_nodes < 10 or num_nodes > 150:
             raise ValueError("El número de nodos debe estar entre 10 y 150")
@@ -73,7 +114,6 @@ class SimulationInitializer:
         # Reiniciar todas las estructuras
         self.graph = Graph()
         self.node_types.clear()
-        self.path_cache.clear()
         self._storage_nodes.clear()
         self._charging_nodes.clear()
         self._client_nodes.clear()
@@ -124,13 +164,13 @@ class SimulationInitializer:
         # Crear todos los nodos primero
         for i in range(storage_nodes):
             node_id = f"S{i+1}"
-            self.graph.add_vertex(node_id)
+            self.graph.add_vertex(node_id, ROLE_STORAGE)
             self._storage_nodes.append(node_id)
             self.node_types[node_id] = "storage"
 
         for i in range(charging_nodes):
             node_id = f"C{i+1}"
-            self.graph.add_vertex(node_id)
+            self.graph.add_vertex(node_id, ROLE_CHARGING)
             self._charging_nodes.append(node_id)
             self.node_types[node_id] = "charging"
 
@@ -138,7 +178,7 @@ class SimulationInitializer:
         client_types = ["Regular", "Premium", "VIP"]
         for i in range(client_nodes):
             node_id = f"T{i+1}"
-            self.graph.add_vertex(node_id)
+            self.graph.add_vertex(node_id, ROLE_CLIENT)
             self._client_nodes.append(node_id)
             self.node_types[node_id] = "client"
             
@@ -177,27 +217,54 @@ class SimulationInitializer:
 
         return self.graph
 
+    def _initialize_generated_network(self, num_nodes, num_edges, mode, seed, k):
+        """
+        Inicializa una red grande con el generador escalable, sin construir la
+        lista de todos los pares de nodos.
+        """
+        if num_nodes < 10:
+            raise ValueError("El número de nodos debe ser al menos 10")
+        
+        self.graph = generate_network(num_nodes, num_edges, mode=mode, k=k, seed=seed)
+        self.node_types.clear()
+        self._storage_nodes.clear()
+        self._charging_nodes.clear()
+        self._client_nodes.clear()
+        
+        role_nodes = {ROLE_STORAGE: self._storage_nodes, ROLE_CHARGING: self._charging_nodes,
+                      ROLE_CLIENT: self._client_nodes}
+        for node_id in self.graph.vertices():
+            role = self.graph.get_role(node_id)
+            role_nodes[role].append(node_id)
+            self.node_types[node_id] = ROLE_NAMES[role]
+        
+        # Los clientes se sortean con la misma semilla que la red
+        rng = random.Random(seed)
+        client_types = ["Regular", "Premium", "VIP"]
+        for i, node_id in enumerate(self._client_nodes):
+            client = Client(f"CLI{i+1}", f"Cliente {i+1}", rng.choice(client_types))
+            client.node_id = node_id
+            self.clients.append(client)
+        
+        return self.graph
+
     def get_node_type(self, node_id):
-        """Get the type of a node based on its ID prefix."""
-        if node_id.startswith('S'):
-            return "storage"
-        elif node_id.startswith('C'):
-            return "charging"
-        elif node_id.startswith('T'):
-            return "client"
-        return "unknown"
+        """Get the type of a node from the graph's role table."""
+        if self.graph is not None and self.graph.has_vertex(node_id):
+            return self.graph.get_node_type(node_id)
+        return ROLE_NAMES[infer_role(node_id)]
 
     def is_connected(self):
-        if not self.graph.vertices():
-            return True
-        
-        start = self.graph.vertices()[0]
-        visited = set(self.graph.bfs(start))
-        return len(visited) == len(self.graph.vertices())
+        """Verifica la conectividad con las componentes que mantiene el grafo."""
+        return self.graph.is_connected()
 
     def find_path_with_charging(self, start, end):
         """
         Encuentra una ruta entre dos nodos considerando la autonomía del dron y estaciones de carga.
+        Las rutas con recargas se buscan en el grafo de estaciones de recarga
+        (ver ChargingOverlay), que minimiza primero las recargas y luego el costo;
+        el enrutador de etiquetas (ver ChargingAwareRouter) solo se usa para
+        obtener el camino parcial cuando no hay ruta completa.
         Si no hay ruta completa, devuelve el camino parcial más largo posible y la batería restante.
         Returns:
             dict: {
@@ -211,170 +278,101 @@ class SimulationInitializer:
                 'full_battery_left': int
             }
         """
-        if not (start in self.graph.vertices() and end in self.graph.vertices()):
+        if not (self.graph.has_vertex(start) and self.graph.has_vertex(end)):
             return {'path': [], 'completed': False, 'battery_left': None, 'reason': 'Nodos no válidos', 'partial_path': [], 'partial_battery_left': None, 'full_path': [], 'full_battery_left': None}
 
-        cache_key = f"{start}-{end}"
-        if cache_key in self.path_cache:
-            return self.path_cache[cache_key]
-
-        queue = deque([(start, [start], self.DRONE_AUTONOMY, 0)])
-        visited = set()  # (nodo, batería_restante)
-        best_path = None
-        min_recharges = float('inf')
-        longest_partial = ([], self.DRONE_AUTONOMY, 0)
+        return route_cache.get_or_compute(
+            self.graph, start, end, ROUTE_CACHE_ALGORITHM, self.DRONE_AUTONOMY,
+            lambda: route_with_charging(self.graph, start, end, self.DRONE_AUTONOMY))
 
-        while queue:
-            current, path, battery, num_recharges = queue.popleft()
-
-            # Si llegamos al destino, actualizamos el mejor camino si tiene menos recargas
-            if current == end:
-                if num_recharges < min_recharges:
-                    best_path = (path, battery, num_recharges)
-                    min_recharges = num_recharges
-                continue
-
-            # Si ya encontramos un camino y este tiene más recargas, lo ignoramos
-            if num_recharges >= min_recharges:
-                continue
-
-            # Guardar el camino parcial más largo
-            if len(path) > len(longest_partial[0]):
-                longest_partial = (path, battery, num_recharges)
-
-            neighbors = self.graph.get_neighbors(current)
-            if battery < self.DRONE_AUTONOMY * 0.3:
-                neighbors = sorted(neighbors, key=lambda x: x.startswith('C'), reverse=True)
-
-            for neighbor in neighbors:
-                edge = self.graph.get_edge(current, neighbor)
-                if edge:
-                    edge_cost = edge.element()
-                    new_battery = battery
-                    new_recharges = num_recharges
-                    if current.startswith('C') or neighbor.startswith('C'):
-                        new_battery = self.DRONE_AUTONOMY
-                        if not current.startswith('C'):
-                            new_recharges += 1
-                    else:
-                        new_battery -= edge_cost
-                    state = (neighbor, new_battery)
-                    if new_battery >= 0 and state not in visited:
-                        visited.add(state)
-                        new_path = path + [neighbor]
-                        queue.append((neighbor, new_path, new_battery, new_recharges))
-
-        if best_path:
-            result = {
-                'path': best_path[0],
-                'completed': True,
-                'battery_left': best_path[1],
-                'reason': '',
-                'partial_path': best_path[0],
-                'partial_battery_left': best_path[1],
-                'full_path': best_path[0],
-                'full_battery_left': best_path[1]
-            }
-            self.path_cache[cache_key] = result
-            return result
-        else:
-            # Devolver el camino parcial más largo
-            result = {
-                'path': longest_partial[0],
-                'completed': False,
-                'battery_left': longest_partial[1],
-                'reason': 'No se pudo completar la ruta con la autonomía disponible',
-                'partial_path': longest_partial[0],
-                'partial_battery_left': longest_partial[1],
-                'full_path': [],
-                'full_battery_left': None
-            }
-            self.path_cache[cache_key] = result
-            return result
+    def find_paths_with_charging(self, pairs):
+        """
+        Calcula las rutas de muchos pares origen/destino de una vez. Los pares
+        repetidos se calculan una sola vez y se procesan agrupados por origen;
+        cada par usa la tabla de todos los pares en grafos pequeños o una
+        búsqueda acotada por la autonomía en los grandes, sin guardar árboles
+        de caminos por origen (ver route_with_charging). Con ``self.workers`` mayor
+        que uno los pares se reparten en un pool de procesos, que se reutiliza
+        en los lotes siguientes mientras el grafo no cambie (ver close).
+        
+        Args:
+            pairs: Pares (origen, destino)
+            
+        Returns:
+            dict: (origen, destino) -> resultado en el formato de find_path_with_charging
+        """
+        if self.workers > 1:
+            pending = [(origin, destination) for origin, destination in dict.fromkeys(pairs)
+                       if not route_cache.contains(self.graph, origin, destination,
+                                                   ROUTE_CACHE_ALGORITHM, self.DRONE_AUTONOMY)]
+            if pending:
+                self._parallel = ParallelRouter.reuse(self._parallel, self.graph, self.workers,
+                                                      self.DRONE_AUTONOMY)
+                for (origin, destination), result in self._parallel.find_paths_with_charging(pending).items():
+                    route_cache.put(self.graph, origin, destination,
+                                    ROUTE_CACHE_ALGORITHM, self.DRONE_AUTONOMY, result)
+        
+        by_origin = {}
+        for origin, destination in pairs:
+            by_origin.setdefault(origin, {})[destination] = None
+        
+        results = {}
+        for done, (origin, destinations) in enumerate(by_origin.items(), 1):
+            for destination in destinations:
+                results[(origin, destination)] = self.find_path_with_charging(origin, destination)
+            if self.progress is not None:
+                self.progress("routes", done, len(by_origin))
+        return results
 
-    def generate_orders(self, num_orders):
+    def stream_orders(self, num_orders=None, source=None, buffer_size=DEFAULT_BUFFER_SIZE,
+                      output=None, register=True, track_routes=True):
         """
-        Genera órdenes aleatorias entre nodos de manera optimizada.
-        Ahora prioriza la reutilización de rutas frecuentes si existen entre el origen y destino.
+        Genera órdenes de forma perezosa: cada orden pasa por las etapas de
+        ruteo, asignación y (si hay archivo de salida) persistencia apenas se
+        calcula su bloque de rutas (ver order_stream), sin esperar al resto.
+        
+        Args:
+            num_orders: Cantidad de pares aleatorios (None para un flujo sin fin)
+            source: Pares (origen, destino) a usar en lugar de los aleatorios,
+                p. ej. replay_pairs(archivo)
+            buffer_size: Pares que se rutean juntos
+            output: CSV donde escribir las órdenes a medida que salen (opcional)
+            register: Si agregar las órdenes a la lista de su cliente
+            track_routes: Si guardar las rutas y sus frecuencias (routes y
+                route_frequencies); sin ellas ni register la memoria del
+                flujo no crece con la cantidad de órdenes
+            
+        Returns:
+            Iterador de órdenes con su ruta y costo asignados
         """
         if not self.graph or not self.graph.vertices():
             raise ValueError("El grafo no está inicializado")
-            
-        orders = []
-        client_dict = {client.node_id: client for client in self.clients}
         
         # Reiniciar contadores de frecuencia
         self.route_frequencies = {}
         self.routes = []
         
-        for i in range(num_orders):
-            try:
-                # Seleccionar origen y destino
-                origin = random.choice(self._storage_nodes)
-                destination = random.choice(self._client_nodes)
-                
-                # Buscar si ya existe una ruta frecuente entre este origen y destino
-                ruta_existente = None
-                for route in self.routes:
-                    if route.nodes[0] == origin and route.nodes[-1] == destination:
-                        ruta_existente = route
-                        break
-                
-                if ruta_existente:
-                    path = ruta_existente.nodes
-                    route_key = ' → '.join(path)
-                    ruta_existente.increment_frequency()
-                    route = ruta_existente
-                    completed = True
-                else:
-                    # Encontrar una ruta viable nueva
-                    result = self.find_path_with_charging(origin, destination)
-                    path = result['path']
-                    completed = result['completed']
-                    if not path or not completed:
-                        continue
-                    route_key = ' → '.join(path)
-                    route = Route(f"Route_{len(self.routes)+1}", path)
-                    self.routes.append(route)
-                
-                # Actualizar frecuencia de la ruta
-                if route_key in self.route_frequencies:
-                    self.route_frequencies[route_key] += 1
-                    route.frequency = self.route_frequencies[route_key]
-                else:
-                    self.route_frequencies[route_key] = 1
-                    route.frequency = 1
-                
-                # Calcular el costo total
-                total_cost = sum(self.graph.get_edge(path[j], path[j+1]).element() 
-                               for j in range(len(path)-1))
-                
-                # Obtener cliente
-                client = client_dict.get(destination)
-                if not client:
-                    continue
-                
-                # Crear la orden con todos los campos necesarios
-                order = Order(
-                    order_id=f"ORD_{i+1}",
-                    origin=origin,
-                    destination=destination,
-                    client_id=client.client_id,
-                    client_name=client.name,
-                    priority=client.client_type
-                )
-                
-                # Asignar ruta y costo
-                order.assign_route(route)
-                order.route_cost = total_cost
-                
-                # Registrar orden
-                orders.append(order)
-                client.add_order(order)
-                
-            except Exception as e:
-                st.error(f"Error generando orden {i+1}: {str(e)}")
-                continue
+        total = num_orders if source is None else None
+        if source is None:
+            source = random_pairs(self._storage_nodes, self._client_nodes, num_orders)
+        orders = assign_stage(self, route_stage(self, source, buffer_size), register,
+                              total=total, track_routes=track_routes)
+        if output is not None:
+            orders = persist_stage(orders, output, buffer_size)
+        return orders
+
+    def close(self):
+        """Cierra el pool de procesos de find_paths_with_charging, si se creó."""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+
+    def generate_orders(self, num_orders):
+        """
+        Genera órdenes aleatorias entre nodos y las devuelve en una lista.
+        Las órdenes del mismo par origen/destino reutilizan su ruta.
+        """
+        orders = list(self.stream_orders(num_orders))
         
         if not orders:
             raise ValueError("No se pudo generar ninguna orden válida.")
@@ -382,11 +380,11 @@ class SimulationInitializer:
         # Verificar que la suma de frecuencias es igual al número de órdenes
         total_freq = sum(self.route_frequencies.values())
         if total_freq != len(orders):
-            st.warning(f"Error de consistencia: Total de frecuencias ({total_freq}) ≠ Número de órdenes ({len(orders)})")
+            self.notify("warning", f"Error de consistencia: Total de frecuencias ({total_freq}) ≠ Número de órdenes ({len(orders)})")
             
         return orders
 
-    def initialize_simulation(self, num_nodes, num_edges, num_orders):
+    def initialize_simulation(self, num_nodes, num_edges, num_orders, mode=None, seed=None):
         """
         Inicializa la simulación completa.
         
@@ -394,6 +392,8 @@ class SimulationInitializer:
             num_nodes: Número total de nodos
             num_edges: Número de aristas
             num_orders: Número de órdenes a generar
+            mode: Modo de generación de la red (ver initialize_network)
+            seed: Semilla de la red generada
         """
         # Reiniciar todas las estructuras
         self.graph = None
@@ -404,7 +404,7 @@ class SimulationInitializer:
         self.node_types = {}  # Reiniciar tipos de nodos
         
         # Paso 1: Inicializar la red
-        self.initialize_network(num_nodes, num_edges)
+        self.initialize_network(num_nodes, num_edges, mode=mode, seed=seed)
         
         if not self.graph or not self.graph.vertices():
             raise ValueError("No se pudo inicializar la red correctamente")
@@ -1,4 +1,5 @@
 from src.model.Graph import Graph
+from src.model.roles import ROLE_STORAGE, ROLE_CHARGING
 from src.domain.Client import Client
 from src.domain.Order import Order
 from src.domain.Route import Route
@@ -69,10 +70,9 @@ class SimulationManager:
     def _generate_clients_from_graph(self) -> List[Client]:
         """Genera clientes basados en los nodos del grafo"""
         clients = []
-        nodes = list(self.graph.vertices())
-        
         # Filtrar nodos de cliente (no almacenamiento ni recarga)
-        client_nodes = [node for node in nodes if not node.startswith('S') and not node.startswith('C')]
+        client_nodes = [node for node in self.graph.vertices()
+                        if self.graph.get_role(node) not in (ROLE_STORAGE, ROLE_CHARGING)]
         
         for i, node in enumerate(client_nodes):
             client = Client(
@@ -91,9 +91,10 @@ class SimulationManager:
         nodes = list(self.graph.vertices())
         
         # Nodos de almacenamiento (origen)
-        storage_nodes = [node for node in nodes if node.startswith('S')]
+        storage_nodes = self.graph.vertices_with_role(ROLE_STORAGE)
         # Nodos de cliente (destino)
-        client_nodes = [node for node in nodes if not node.startswith('S') and not node.startswith('C')]
+        client_nodes = [node for node in nodes
+                        if self.graph.get_role(node) not in (ROLE_STORAGE, ROLE_CHARGING)]
         
         if not storage_nodes or not client_nodes:
             # Si no hay nodos de almacenamiento o cliente, usar cualquier nodo
@@ -181,15 +182,13 @@ class SimulationManager:
                 return {"success": False, "message": "No se encontró ruta entre los nodos"}
             
             # Crear objeto Route
-            route = Route(
-                route_id=f"ROUTE_{len(self.routes)+1:03d}",
-                origin=origin,
-                destination=destination,
-                path=path,
-                cost=cost,
-                algorithm=algorithm,
-                created_at=datetime.now()
-            )
+            route = Route(f"ROUTE_{len(self.routes)+1:03d}", path, total_cost=cost)
+            route.origin = origin
+            route.destination = destination
+            route.path = path
+            route.cost = cost
+            route.algorithm = algorithm
+            route.created_at = datetime.now()
             
             # Agregar a la lista de rutas
             self.add_route(route)
@@ -219,7 +218,7 @@ class SimulationManager:
             mst_edges = self.graph.kruskal_mst()
             return {
                 "success": True,
-                "mst_edges": [(edge.endpoints()[0], edge.endpoints()[1], edge.element()) for edge in mst_edges]
+                "mst_edges": mst_edges
             }
         except Exception as e:
             return {"success": False, "message": f"Error al calcular MST: {str(e)}"}
@@ -252,9 +251,9 @@ class SimulationManager:
             return {"success": False, "message": "Simulación no inicializada"}
         
         nodes = list(self.graph.vertices())
-        storage_nodes = [n for n in nodes if n.startswith('S')]
-        recharge_nodes = [n for n in nodes if n.startswith('C')]
-        client_nodes = [n for n in nodes if not n.startswith('S') and not n.startswith('C')]
+        storage_nodes = self.graph.vertices_with_role(ROLE_STORAGE)
+        recharge_nodes = self.graph.vertices_with_role(ROLE_CHARGING)
+        client_nodes = [n for n in nodes if self.graph.get_role(n) not in (ROLE_STORAGE, ROLE_CHARGING)]
         
         completed_orders = [o for o in self.orders if o.status == "Completada"]
         pending_orders = [o for o in self.orders if o.status == "Pendiente"]
@@ -267,7 +266,7 @@ class SimulationManager:
                 "storage_nodes": len(storage_nodes),
                 "recharge_nodes": len(recharge_nodes),
                 "client_nodes": len(client_nodes),
-                "total_edges": len(self.graph.edges()),
+                "total_edges": self.graph.num_edges(),
                 "total_clients": len(self.clients),
                 "total_orders": len(self.orders),
                 "completed_orders": len(completed_orders),
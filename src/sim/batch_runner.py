@@ -0,0 +1,243 @@
+"""
+Ejecución de simulaciones por lotes, sin interfaz.
+Cada corrida genera una red y un flujo de órdenes (aleatorias o repetidas de
+un CSV anterior, ver order_stream) que se rutean y escriben a medida que se
+generan, opcionalmente simula un día de operación de la flota (ver
+Simulation) y escribe en un directorio de salida un CSV con las órdenes y un
+resumen JSON con los tiempos de cada etapa, pensado para tareas programadas
+y nodos de cómputo. Sin flota la memoria del flujo no crece con la cantidad
+de órdenes: no se guardan las órdenes ni el historial de rutas.
+
+Uso:
+    python run_batch.py --nodes 100000 --orders 20000 --runs 3 --drones 2 --output resultados
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+from src.model.route_cache import route_cache
+from src.model.network_generator import GENERATOR_MODES
+from src.sim.SimulationInitializer import SimulationInitializer
+from src.sim.order_stream import DEFAULT_BUFFER_SIZE, replay_pairs
+from src.sim.Simulation import Simulation, DAY_MINUTES
+from src.sim.charging import CHARGE_MODELS, QUEUE_POLICIES
+
+# Modo de la red del dashboard (10 a 150 nodos)
+CLASSIC_MODE = "classic"
+
+# Estaciones de recarga más usadas que se incluyen en el resumen
+BUSIEST_STATIONS = 5
+
+
+def _progress_printer(run: int):
+    """Función de progreso que escribe en stderr una línea cada 10% de cada etapa."""
+    last_step = {}
+
+    def progress(stage: str, done: int, total: int) -> None:
+        step = done * 10 // total if total else 10
+        if last_step.get(stage) != step:
+            last_step[stage] = step
+            print(f"[corrida {run}] {stage}: {done}/{total}", file=sys.stderr, flush=True)
+    return progress
+
+
+def _quiet(level: str, message: str) -> None:
+    """Descarta los avisos informativos y muestra advertencias y errores en stderr."""
+    if level != "info":
+        print(f"[{level}] {message}", file=sys.stderr)
+
+
+def run_once(run: int, num_nodes: int, num_orders: int, num_edges: Optional[int] = None,
+             mode: str = "geometric", k: int = 4, seed: Optional[int] = None, workers: int = 1,
+             output_dir: Optional[str] = None, verbose: bool = True, drones: int = 0,
+             fleet_options: Optional[Dict] = None, replay: Optional[str] = None,
+             buffer_size: int = DEFAULT_BUFFER_SIZE) -> Dict:
+    """
+    Ejecuta una corrida completa: red, órdenes, rutas y, si hay drones, la
+    simulación de la flota con las órdenes repartidas a lo largo de un día.
+
+    Args:
+        run: Número de la corrida (para los nombres de archivo)
+        num_nodes: Cantidad de nodos
+        num_orders: Cantidad de órdenes aleatorias (se ignora con replay)
+        num_edges: Aristas de la red (modos "classic" y "random")
+        mode: "classic", "random" o "geometric"
+        k: Vecinos más cercanos en el modo "geometric"
+        seed: Semilla de la red y de las órdenes
+        workers: Procesos para calcular las rutas
+        output_dir: Directorio donde escribir el CSV de órdenes (None para no escribirlo)
+        verbose: Si mostrar progreso y avisos en stderr
+        drones: Drones por almacén en la simulación de la flota (0 para no simular)
+        fleet_options: Otros argumentos de Simulation (pads, charge, queue_policy, ...)
+        replay: CSV de órdenes cuyos pares origen/destino se repiten en lugar
+            de generar órdenes aleatorias
+        buffer_size: Órdenes que se rutean juntas
+
+    Returns:
+        dict: Resumen de la corrida con sus tiempos en segundos
+    """
+    simulator = SimulationInitializer(
+        notify=None if verbose else _quiet,
+        progress=_progress_printer(run) if verbose else None)
+    simulator.workers = workers
+    summary = {'run': run, 'seed': seed, 'mode': mode, 'nodes': num_nodes}
+    timings = {}
+
+    # La red clásica y las órdenes usan el generador global de random
+    random.seed(seed)
+    start = time.perf_counter()
+    simulator.initialize_network(num_nodes, num_edges,
+                                 mode=None if mode == CLASSIC_MODE else mode, seed=seed, k=k)
+    timings['network'] = time.perf_counter() - start
+    summary['edges'] = simulator.graph.num_edges(directed=True)
+
+    # Las órdenes se escriben a medida que salen del flujo; solo la
+    # simulación de la flota necesita tenerlas todas
+    orders_file = None
+    if output_dir is not None:
+        orders_file = os.path.join(output_dir, f"run_{run:03d}_orders.csv")
+    start = time.perf_counter()
+    stream = simulator.stream_orders(num_orders, source=replay_pairs(replay) if replay else None,
+                                     buffer_size=buffer_size, output=orders_file, register=False,
+                                     track_routes=False)
+    orders = []
+    count = 0
+    total_cost = 0
+    try:
+        for order in stream:
+            count += 1
+            total_cost += order.route_cost
+            if drones > 0:
+                orders.append(order)
+    finally:
+        simulator.close()
+    timings['orders'] = time.perf_counter() - start
+    if not count:
+        raise ValueError("No se pudo generar ninguna orden válida.")
+
+    summary['orders'] = count
+    summary['routes'] = simulator.routes_created
+    summary['total_cost'] = total_cost
+    if orders_file is not None:
+        summary['orders_file'] = orders_file
+    if drones > 0:
+        start = time.perf_counter()
+        fleet = Simulation(simulator.graph, drones_per_storage=drones,
+                           autonomy=simulator.DRONE_AUTONOMY, **(fleet_options or {}))
+        fleet.add_orders(orders, rate=len(orders) / DAY_MINUTES, seed=seed)
+        stats = fleet.run()
+        timings['fleet'] = time.perf_counter() - start
+        stations = stats.pop('stations')
+        stats['busiest_stations'] = dict(sorted(stations.items(),
+                                                key=lambda item: -item[1]['utilization'])[:BUSIEST_STATIONS])
+        summary['fleet'] = stats
+    summary['timings'] = {stage: round(seconds, 4) for stage, seconds in timings.items()}
+    return summary
+
+
+def run_batch(runs: int, num_nodes: int, num_orders: int, num_edges: Optional[int] = None,
+              mode: str = "geometric", k: int = 4, seed: int = 0, workers: int = 1,
+              output_dir: str = "batch_results", verbose: bool = True, drones: int = 0,
+              fleet_options: Optional[Dict] = None, replay: Optional[str] = None,
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> Dict:
+    """
+    Ejecuta varias corridas con semillas consecutivas y escribe summary.json
+    en el directorio de salida. Una corrida fallida queda registrada con su
+    error y no detiene las siguientes.
+
+    Args:
+        runs: Cantidad de corridas
+        seed: Semilla de la primera corrida (la corrida i usa seed + i)
+        output_dir: Directorio de salida (se crea si no existe)
+        (el resto como en run_once)
+
+    Returns:
+        dict: Parámetros, resumen de cada corrida y estadísticas de la caché de rutas
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    for run in range(runs):
+        try:
+            results.append(run_once(run, num_nodes, num_orders, num_edges, mode, k,
+                                    seed + run, workers, output_dir, verbose, drones, fleet_options,
+                                    replay, buffer_size))
+        except Exception as e:
+            results.append({'run': run, 'seed': seed + run, 'error': str(e)})
+
+    summary = {
+        'config': {'runs': runs, 'nodes': num_nodes, 'edges': num_edges, 'orders': num_orders,
+                   'mode': mode, 'k': k, 'seed': seed, 'workers': workers, 'drones': drones,
+                   'fleet': fleet_options or {}, 'replay': replay, 'buffer_size': buffer_size},
+        'runs': results,
+        'route_cache': route_cache.stats()
+    }
+    with open(os.path.join(output_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación de entregas con drones por lotes, sin interfaz")
+    parser.add_argument("--nodes", type=int, default=1000, help="Cantidad de nodos")
+    parser.add_argument("--edges", type=int, default=None,
+                        help="Cantidad de aristas (modos classic y random)")
+    parser.add_argument("--orders", type=int, default=1000, help="Órdenes por corrida")
+    parser.add_argument("--replay", default=None,
+                        help="CSV de órdenes cuyos pares origen/destino se repiten (ignora --orders)")
+    parser.add_argument("--buffer", type=int, default=DEFAULT_BUFFER_SIZE,
+                        help="Órdenes que se rutean juntas en el flujo")
+    parser.add_argument("--mode", choices=(CLASSIC_MODE,) + GENERATOR_MODES, default="geometric",
+                        help="Generador de la red")
+    parser.add_argument("--k", type=int, default=4, help="Vecinos más cercanos (modo geometric)")
+    parser.add_argument("--runs", type=int, default=1, help="Cantidad de corridas")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de la primera corrida")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos para calcular rutas")
+    parser.add_argument("--drones", type=int, default=0,
+                        help="Drones por almacén para simular la flota (0 para no simular)")
+    parser.add_argument("--pads", type=int, default=2, help="Pads de cada estación de recarga")
+    parser.add_argument("--charge-model", choices=CHARGE_MODELS, default="linear",
+                        help="Modelo de tiempo de carga")
+    parser.add_argument("--queue-policy", choices=QUEUE_POLICIES, default="fifo",
+                        help="Cola de espera de las estaciones")
+    parser.add_argument("--no-detours", action="store_true",
+                        help="No desviar las misiones que pasan por estaciones saturadas")
+    parser.add_argument("--output", default="batch_results", help="Directorio de salida")
+    parser.add_argument("--quiet", action="store_true", help="Mostrar solo advertencias y errores")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: Código de salida (1 si alguna corrida falló)
+    """
+    args = build_parser().parse_args(argv)
+    summary = run_batch(args.runs, args.nodes, args.orders, args.edges, args.mode, args.k,
+                        args.seed, args.workers, args.output, verbose=not args.quiet,
+                        drones=args.drones,
+                        fleet_options={'pads': args.pads, 'charge': args.charge_model,
+                                       'queue_policy': args.queue_policy,
+                                       'avoid_saturated': not args.no_detours},
+                        replay=args.replay, buffer_size=args.buffer)
+    failed = [run for run in summary['runs'] if 'error' in run]
+    for run in summary['runs']:
+        if 'error' in run:
+            print(f"❌ Corrida {run['run']}: {run['error']}")
+        else:
+            print(f"✅ Corrida {run['run']}: {run['orders']} órdenes, {run['routes']} rutas, "
+                  f"tiempos {run['timings']}")
+            if 'fleet' in run:
+                fleet = run['fleet']
+                print(f"   🚁 {fleet['delivered']} entregas, {fleet['throughput_per_hour']:.1f} por hora, "
+                      f"latencia media {fleet['latency']['mean']:.1f} min, "
+                      f"espera media para recargar {fleet['charging_wait']['mean']:.1f} min, "
+                      f"{fleet['events_per_second']:.0f} eventos/s")
+    print(f"📁 Resultados en {args.output}")
+    return 1 if failed else 0
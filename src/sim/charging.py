@@ -0,0 +1,256 @@
+"""
+Estaciones de recarga de la simulación de la flota.
+Cada estación tiene una cantidad limitada de pads: si están todos ocupados
+los drones esperan en una cola FIFO o por prioridad de la orden. La duración
+de cada carga la decide un modelo de carga, y las reservas de pads de las
+misiones planificadas se guardan en un árbol de intervalos que el ruteo
+consulta para evitar las estaciones saturadas.
+"""
+
+import bisect
+import heapq
+from collections import deque
+from typing import Dict, Tuple
+from src.tda.IntervalTree import IntervalTree
+
+QUEUE_POLICIES = ("fifo", "priority")
+
+# Rango de prioridad de cada tipo de orden (menor se atiende antes)
+PRIORITY_RANK = {"VIP": 0, "Alta": 0, "Premium": 1, "Regular": 2, "Normal": 2, "Baja": 3}
+DEFAULT_PRIORITY_RANK = 2
+
+# Límites (minutos) del histograma de esperas: sin espera, (0, 1], (1, 2], ..., más de 60
+WAIT_BINS = (0, 1, 2, 5, 10, 20, 30, 60)
+WAIT_BIN_LABELS = tuple(["0"] + [f"{low}-{high}" for low, high in zip(WAIT_BINS, WAIT_BINS[1:])]
+                        + [f"{WAIT_BINS[-1]}+"])
+
+
+class LinearCharge:
+    """Carga a velocidad constante."""
+
+    def __init__(self, rate: float = 5.0):
+        """
+        Args:
+            rate: Unidades de carga por minuto
+        """
+        if rate <= 0:
+            raise ValueError("La velocidad de carga debe ser positiva")
+        self.rate = rate
+
+    def duration(self, battery: float, capacity: float) -> float:
+        """Minutos para cargar desde battery hasta capacity."""
+        return (capacity - battery) / self.rate
+
+
+class TaperedCharge(LinearCharge):
+    """
+    Carga en dos etapas (corriente y luego tensión constante): velocidad
+    completa hasta el umbral y reducida por el factor taper desde ahí.
+    """
+
+    def __init__(self, rate: float = 5.0, threshold: float = 0.8, taper: float = 0.4):
+        """
+        Args:
+            rate: Unidades de carga por minuto en la etapa rápida
+            threshold: Fracción de la capacidad donde empieza la etapa lenta
+            taper: Fracción de la velocidad en la etapa lenta
+        """
+        super().__init__(rate)
+        if not 0 < threshold <= 1 or not 0 < taper <= 1:
+            raise ValueError("El umbral y la reducción deben estar entre 0 y 1")
+        self.threshold = threshold
+        self.taper = taper
+
+    def duration(self, battery: float, capacity: float) -> float:
+        knee = capacity * self.threshold
+        fast = max(0.0, knee - battery) / self.rate
+        slow = (capacity - max(battery, knee)) / (self.rate * self.taper)
+        return fast + slow
+
+
+class SwapCharge:
+    """Cambio de batería de duración fija."""
+
+    def __init__(self, minutes: float = 3.0):
+        """
+        Args:
+            minutes: Minutos de cada cambio
+        """
+        if minutes < 0:
+            raise ValueError("La duración del cambio no puede ser negativa")
+        self.minutes = minutes
+
+    def duration(self, battery: float, capacity: float) -> float:
+        return self.minutes
+
+
+CHARGE_MODELS = ("linear", "tapered", "swap")
+
+
+def charge_model(name: str, rate: float = 5.0):
+    """
+    Crea un modelo de carga por nombre.
+
+    Args:
+        name: "linear", "tapered" o "swap"
+        rate: Velocidad de carga de los modelos "linear" y "tapered"
+
+    Returns:
+        Modelo con el método duration(batería, capacidad)
+
+    Raises:
+        ValueError: Si el modelo no existe
+    """
+    if name == "linear":
+        return LinearCharge(rate)
+    if name == "tapered":
+        return TaperedCharge(rate)
+    if name == "swap":
+        return SwapCharge()
+    raise ValueError(f"Modelo de carga desconocido: {name}")
+
+
+class ChargingStation:
+    """
+    Estación con pads limitados, cola de espera y reservas de pads.
+    """
+
+    __slots__ = ("name", "pads", "policy", "busy", "queue", "reservations", "_sequence",
+                 "charges", "busy_minutes", "wait_histogram", "total_wait", "max_wait", "max_queue")
+
+    def __init__(self, name: str, pads: int = 2, policy: str = "fifo"):
+        """
+        Args:
+            name: Nodo de la estación
+            pads: Drones que pueden cargar a la vez
+            policy: "fifo" o "priority" (por prioridad de la orden y luego llegada)
+        """
+        if pads < 1:
+            raise ValueError("Una estación necesita al menos un pad")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Política de cola desconocida: {policy}")
+        self.name = name
+        self.pads = pads
+        self.policy = policy
+        self.busy = 0
+        self.queue = deque() if policy == "fifo" else []
+        self.reservations = IntervalTree()
+        self._sequence = 0
+        self.charges = 0
+        self.busy_minutes = 0.0
+        self.wait_histogram = [0] * len(WAIT_BIN_LABELS)
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue = 0
+
+    def arrive(self, drone, priority: int, now: float) -> bool:
+        """
+        Un dron llega a cargar.
+
+        Args:
+            drone: Dron que llega
+            priority: Rango de prioridad de su orden (ver PRIORITY_RANK)
+            now: Momento de llegada
+
+        Returns:
+            bool: True si toma un pad libre, False si queda en la cola
+        """
+        if self.busy < self.pads:
+            self.busy += 1
+            self._record_wait(0.0)
+            return True
+        if self.policy == "fifo":
+            self.queue.append((now, drone))
+        else:
+            self._sequence += 1
+            heapq.heappush(self.queue, (priority, self._sequence, now, drone))
+        if len(self.queue) > self.max_queue:
+            self.max_queue = len(self.queue)
+        return False
+
+    def release(self, now: float):
+        """
+        Un dron libera su pad; si hay cola, el siguiente lo toma.
+
+        Returns:
+            El dron que pasa a cargar, o None si no había cola
+        """
+        if not self.queue:
+            self.busy -= 1
+            return None
+        if self.policy == "fifo":
+            arrival, drone = self.queue.popleft()
+        else:
+            _, _, arrival, drone = heapq.heappop(self.queue)
+        self._record_wait(now - arrival)
+        return drone
+
+    def start_charge(self, minutes: float) -> None:
+        """Registra una carga que ocupa un pad durante los minutos dados."""
+        self.charges += 1
+        self.busy_minutes += minutes
+
+    def _record_wait(self, wait: float) -> None:
+        """Suma una espera al histograma."""
+        self.wait_histogram[bisect.bisect_left(WAIT_BINS, wait)] += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def reserve(self, start: float, end: float, drone=None) -> Tuple:
+        """
+        Reserva un pad para una carga planificada.
+
+        Returns:
+            tuple: Clave de la reserva (para cancel)
+        """
+        return self.reservations.insert(start, end, drone)
+
+    def cancel(self, key: Tuple) -> None:
+        """Quita una reserva."""
+        self.reservations.remove(key)
+
+    def is_saturated(self, start: float, end: float) -> bool:
+        """
+        Indica si en algún momento de [start, end) las reservas ocupan todos
+        los pads a la vez. Recorre los inicios y fines de las reservas que se
+        solapan con la ventana (recortados a ella) contando las simultáneas.
+        """
+        if end <= start:
+            return False
+        intervals = self.reservations.overlapping_intervals(start, end)
+        if len(intervals) < self.pads:
+            return False
+        # Un fin se procesa antes que un inicio en el mismo momento: los intervalos son semiabiertos
+        points = sorted([(max(low, start), 1) for low, _ in intervals]
+                        + [(min(high, end), -1) for _, high in intervals])
+        in_use = 0
+        for _, delta in points:
+            in_use += delta
+            if in_use >= self.pads:
+                return True
+        return False
+
+    def statistics(self, horizon: float) -> Dict:
+        """
+        Estadísticas de la estación.
+
+        Args:
+            horizon: Minutos simulados
+
+        Returns:
+            dict: Pads, cargas, minutos de carga, uso de los pads, espera
+            media y máxima, histograma de esperas, cola máxima y actual
+        """
+        arrivals = sum(self.wait_histogram)
+        return {
+            'pads': self.pads,
+            'visits': self.charges,
+            'charging_minutes': self.busy_minutes,
+            'utilization': self.busy_minutes / (self.pads * horizon) if horizon else 0.0,
+            'mean_wait': self.total_wait / arrivals if arrivals else 0.0,
+            'max_wait': self.max_wait,
+            'wait_histogram': dict(zip(WAIT_BIN_LABELS, self.wait_histogram)),
+            'max_queue': self.max_queue,
+            'queued': len(self.queue),
+        }
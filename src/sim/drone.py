@@ -0,0 +1,138 @@
+"""
+Dron de la simulación como máquina de estados.
+Un viaje (misión) es la ruta de la orden desde el almacén hasta el cliente
+seguida del regreso a la base:
+
+    IDLE -> TAKEOFF -> FLYING <-> (QUEUED ->) CHARGING
+                       FLYING -> DELIVERING -> FLYING -> ... -> IDLE
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple
+
+IDLE = "idle"
+TAKEOFF = "takeoff"
+FLYING = "flying"
+QUEUED = "queued"
+CHARGING = "charging"
+DELIVERING = "delivering"
+
+# Transiciones permitidas desde cada estado
+TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    IDLE: (TAKEOFF,),
+    TAKEOFF: (FLYING,),
+    FLYING: (FLYING, QUEUED, CHARGING, DELIVERING, IDLE),
+    QUEUED: (CHARGING,),
+    CHARGING: (FLYING,),
+    DELIVERING: (FLYING,),
+}
+
+
+class Mission:
+    """
+    Misión planificada de ida y vuelta, descrita con listas por posición:
+    ``weights[i]`` y ``energy[i]`` son el peso y el consumo de la arista
+    ``nodes[i] -> nodes[i+1]``, ``need[i]`` la energía necesaria desde
+    ``nodes[i]`` hasta la próxima estación de recarga o el final y
+    ``charging[i]`` indica si en ``nodes[i]`` se puede recargar. ``stops``
+    son las recargas previstas como (posición, minutos desde el despacho,
+    duración) si no hubiera esperas.
+    """
+
+    __slots__ = ("nodes", "weights", "energy", "need", "charging", "delivery_step", "stops")
+
+    def __init__(self, nodes: List[str], weights: List[float], energy: List[float],
+                 need: List[float], charging: List[bool], delivery_step: int,
+                 stops: List[Tuple[int, float, float]]):
+        self.nodes = nodes
+        self.weights = weights
+        self.energy = energy
+        self.need = need
+        self.charging = charging
+        self.delivery_step = delivery_step
+        self.stops = stops
+
+
+class Drone:
+    """
+    Dron con base en un almacén. Copia las listas de la misión en curso
+    (ver Mission) para recorrerlas sin indirecciones.
+    """
+
+    __slots__ = ("drone_id", "base", "node", "battery", "state", "since",
+                 "order", "arrival", "priority", "reservations",
+                 "nodes", "weights", "energy", "need", "charging",
+                 "step", "delivery_step", "busy_time", "flight_time", "deliveries")
+
+    def __init__(self, drone_id: str, base: str, battery: float):
+        """
+        Inicializa el dron detenido en su base con la batería llena.
+
+        Args:
+            drone_id: Identificador del dron
+            base: Almacén donde tiene su base
+            battery: Carga inicial
+        """
+        self.drone_id = drone_id
+        self.base = base
+        self.node = base
+        self.battery = battery
+        self.state = IDLE
+        self.since = 0.0  # Momento en que entró al estado actual
+        self.arrival = 0.0  # Llegada de la orden en curso
+        self.priority = 0  # Rango de prioridad de la orden en curso
+        self.reservations = deque()  # (estación, clave) de las recargas reservadas
+        self.finish_mission()
+        self.busy_time = 0.0
+        self.flight_time = 0.0
+        self.deliveries = 0
+
+    def transition(self, state: str, time: float) -> None:
+        """
+        Cambia de estado, acumulando el tiempo ocupado.
+
+        Args:
+            state: Estado nuevo
+            time: Momento del cambio
+
+        Raises:
+            ValueError: Si la transición no está permitida
+        """
+        if state not in TRANSITIONS[self.state]:
+            raise ValueError(f"Transición inválida del dron {self.drone_id}: {self.state} -> {state}")
+        if self.state != IDLE:
+            self.busy_time += time - self.since
+        self.state = state
+        self.since = time
+
+    def start_mission(self, order, arrival: float, mission: Mission, priority: int = 0) -> None:
+        """
+        Asigna una misión: ida hasta el cliente y vuelta a la base.
+
+        Args:
+            order: Orden a entregar
+            arrival: Momento en que llegó la orden
+            mission: Misión planificada
+            priority: Rango de prioridad de la orden en las colas de recarga
+        """
+        self.order = order
+        self.arrival = arrival
+        self.priority = priority
+        self.nodes = mission.nodes
+        self.weights = mission.weights
+        self.energy = mission.energy
+        self.need = mission.need
+        self.charging = mission.charging
+        self.step = 0
+        self.delivery_step = mission.delivery_step
+
+    def finish_mission(self) -> None:
+        """Libera la misión terminada."""
+        self.order = None
+        self.nodes: List[str] = []
+        self.weights: List[float] = []
+        self.energy: List[float] = []
+        self.need: List[float] = []
+        self.charging: List[bool] = []
+        self.step = 0
+        self.delivery_step = 0
@@ -0,0 +1,59 @@
+"""
+Cola de eventos de la simulación de eventos discretos.
+Los eventos son tuplas (tiempo, secuencia, tipo, objetivo) en un heap
+binario: la secuencia desempata los eventos simultáneos en el orden en que
+se programaron, así que la simulación es determinista y nunca compara los
+objetivos entre sí.
+"""
+
+import heapq
+import itertools
+from typing import Any, Tuple
+
+# Tipos de evento
+ORDER_ARRIVAL = 0   # Llega una orden a su almacén de origen
+TAKEOFF_DONE = 1    # El dron terminó de despegar
+EDGE_ARRIVAL = 2    # El dron llegó al final de una arista
+CHARGE_DONE = 3     # El dron terminó de recargar
+DELIVERY_DONE = 4   # El dron terminó de entregar
+
+EVENT_NAMES = ("order_arrival", "takeoff_done", "edge_arrival", "charge_done", "delivery_done")
+
+Event = Tuple[float, int, int, Any]
+
+
+class EventQueue:
+    """
+    Cola de prioridad de eventos ordenada por tiempo.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def push(self, time: float, kind: int, target: Any) -> None:
+        """
+        Programa un evento.
+
+        Args:
+            time: Momento del evento
+            kind: Tipo de evento
+            target: Orden o dron al que corresponde
+        """
+        heapq.heappush(self._heap, (time, next(self._sequence), kind, target))
+
+    def pop(self) -> Event:
+        """
+        Extrae el próximo evento.
+
+        Returns:
+            Tuple con (tiempo, secuencia, tipo, objetivo)
+        """
+        return heapq.heappop(self._heap)
+
+    def peek_time(self) -> float:
+        """Momento del próximo evento (inf si la cola está vacía)."""
+        return self._heap[0][0] if self._heap else float('inf')
+
+    def __len__(self) -> int:
+        return len(self._heap)
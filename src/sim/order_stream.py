@@ -0,0 +1,228 @@
+"""
+Flujo de órdenes por etapas con generadores.
+Las órdenes salen de una fuente perezosa (aleatoria o un archivo a repetir)
+y pasan por las etapas de ruteo, asignación y persistencia, cada una un
+generador que consume a la anterior:
+
+    fuente -> route_stage -> assign_stage -> persist_stage -> consumidor
+
+Solo el ruteo acumula órdenes, en bloques de a lo más ``buffer_size`` pares
+para calcular sus rutas en lote (ver find_paths_with_charging); las demás
+etapas procesan una orden a la vez, así que el consumidor recibe las
+primeras órdenes antes de que termine la generación. Las rutas distintas y
+sus frecuencias se acumulan en el simulador (crecen hasta cubrir los pares
+almacén/cliente); sin ese historial la memoria queda acotada por el
+bloque de ruteo, las RECENT_ROUTES rutas recientes y la caché de rutas, y
+no crece con la cantidad de órdenes.
+"""
+
+import csv
+import itertools
+import random
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.domain.Order import Order
+from src.domain.Route import Route
+
+# Pares origen/destino que se rutean juntos
+DEFAULT_BUFFER_SIZE = 1000
+
+# Órdenes procesadas entre avisos de progreso
+PROGRESS_STEP = 1000
+
+# Rutas recientes que se reutilizan cuando no se guarda el historial de rutas
+RECENT_ROUTES = 10000
+
+ORDER_CSV_HEADER = ["order_id", "client_id", "priority", "origin", "destination", "route_cost", "path"]
+
+
+def order_row(order) -> List:
+    """Fila del CSV de órdenes (ver ORDER_CSV_HEADER)."""
+    path_nodes = order.route.nodes if order.route else []
+    return [order.order_id, order.client_id, order.priority, order.origin,
+            order.destination, order.route_cost, " ".join(path_nodes)]
+
+
+def random_pairs(storage_nodes: List[str], client_nodes: List[str],
+                 num_orders: Optional[int] = None, rng=None) -> Iterator[Tuple[str, str]]:
+    """
+    Fuente aleatoria de pares (almacén, cliente).
+
+    Args:
+        storage_nodes: Nodos de almacenamiento
+        client_nodes: Nodos de cliente
+        num_orders: Cantidad de pares (None para un flujo sin fin)
+        rng: Generador de números aleatorios (por defecto el módulo random)
+
+    Returns:
+        Iterador de pares (origen, destino)
+    """
+    if not storage_nodes or not client_nodes:
+        raise ValueError("Se necesitan almacenes y clientes para generar órdenes")
+    choice = (rng or random).choice
+    counter = itertools.count() if num_orders is None else range(num_orders)
+    for _ in counter:
+        yield choice(storage_nodes), choice(client_nodes)
+
+
+def replay_pairs(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Fuente que repite los pares de un CSV de órdenes (con columnas origin y
+    destination, como el que escribe persist_stage), leyéndolo fila a fila.
+
+    Args:
+        path: Archivo CSV
+
+    Returns:
+        Iterador de pares (origen, destino)
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or not {"origin", "destination"} <= set(reader.fieldnames):
+            raise ValueError(f"El archivo {path} no tiene columnas origin y destination")
+        for row in reader:
+            yield row["origin"], row["destination"]
+
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    """Agrupa un iterable en listas de a lo más size elementos."""
+    if size < 1:
+        raise ValueError("El tamaño del bloque debe ser positivo")
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def route_stage(initializer, pairs: Iterable[Tuple[str, str]],
+                buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[Tuple[int, str, str, Dict]]:
+    """
+    Etapa de ruteo: calcula en lote las rutas de cada bloque de pares.
+
+    Args:
+        initializer: SimulationInitializer con la red ya creada
+        pairs: Pares (origen, destino)
+        buffer_size: Pares por bloque
+
+    Returns:
+        Iterador de (número de orden, origen, destino, resultado de find_path_with_charging)
+    """
+    number = 0
+    for chunk in batched(pairs, buffer_size):
+        results = initializer.find_paths_with_charging(chunk)
+        for origin, destination in chunk:
+            number += 1
+            yield number, origin, destination, results[(origin, destination)]
+
+
+def assign_stage(initializer, routed: Iterable[Tuple[int, str, str, Dict]],
+                 register: bool = True, total: Optional[int] = None,
+                 track_routes: bool = True) -> Iterator[Order]:
+    """
+    Etapa de asignación: crea la orden de cada ruta completa, le asigna su
+    ruta (reutilizando la del mismo par origen/destino), su costo y su
+    cliente, y actualiza las rutas y frecuencias del simulador. Los pares
+    sin ruta completa o sin cliente se descartan. La cantidad de rutas
+    creadas queda en ``initializer.routes_created`` (sin historial, una ruta
+    que salió de las recientes y vuelve a aparecer se cuenta de nuevo).
+
+    Args:
+        initializer: SimulationInitializer con la red y los clientes
+        routed: Salida de route_stage
+        register: Si agregar cada orden a la lista de órdenes de su cliente
+        total: Cantidad de órdenes esperada, para informar el progreso
+        track_routes: Si guardar las rutas y sus frecuencias en el simulador;
+            si no, solo se reutilizan las RECENT_ROUTES rutas más recientes
+
+    Returns:
+        Iterador de órdenes
+    """
+    graph = initializer.graph
+    client_dict = {client.node_id: client for client in initializer.clients}
+    routes_by_pair = OrderedDict()
+    frequencies = initializer.route_frequencies
+    created = 0
+    initializer.routes_created = 0
+
+    for number, origin, destination, result in routed:
+        try:
+            route = routes_by_pair.get((origin, destination))
+            if route is None:
+                path = result['path']
+                if not path or not result['completed']:
+                    continue
+                created += 1
+                initializer.routes_created = created
+                route = Route(f"Route_{created}", path)
+                routes_by_pair[(origin, destination)] = route
+                if track_routes:
+                    initializer.routes.append(route)
+                elif len(routes_by_pair) > RECENT_ROUTES:
+                    routes_by_pair.popitem(last=False)
+            else:
+                route.increment_frequency()
+                if not track_routes:
+                    routes_by_pair.move_to_end((origin, destination))
+            path = route.nodes
+
+            client = client_dict.get(destination)
+            if not client:
+                continue
+
+            # Actualizar frecuencia de la ruta
+            if track_routes:
+                route_key = ' → '.join(path)
+                frequencies[route_key] = frequencies.get(route_key, 0) + 1
+                route.frequency = frequencies[route_key]
+
+            order = Order(
+                order_id=f"ORD_{number}",
+                origin=origin,
+                destination=destination,
+                client_id=client.client_id,
+                client_name=client.name,
+                priority=client.client_type,
+                origin_role=graph.get_role(origin),
+                destination_role=graph.get_role(destination)
+            )
+            order.assign_route(route)
+            order.route_cost = sum(graph.get_edge_weight(path[j], path[j+1])
+                                   for j in range(len(path)-1))
+            if register:
+                client.add_order(order)
+            yield order
+
+        except Exception as e:
+            initializer.notify("error", f"Error generando orden {number}: {str(e)}")
+            continue
+        finally:
+            if (initializer.progress is not None and total
+                    and (number % PROGRESS_STEP == 0 or number == total)):
+                initializer.progress("orders", number, total)
+
+
+def persist_stage(orders: Iterable[Order], path: str,
+                  buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[Order]:
+    """
+    Etapa de persistencia: escribe cada orden en un CSV y la deja pasar.
+    El archivo se vacía a disco cada buffer_size órdenes, de modo que se
+    puede leer mientras el flujo sigue.
+
+    Args:
+        orders: Órdenes con su ruta asignada
+        path: Archivo CSV de destino
+        buffer_size: Órdenes entre escrituras a disco
+
+    Returns:
+        Iterador con las mismas órdenes
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(ORDER_CSV_HEADER)
+        for written, order in enumerate(orders, 1):
+            writer.writerow(order_row(order))
+            if written % buffer_size == 0:
+                f.flush()
+            yield order
@@ -0,0 +1,193 @@
+class IntervalNode:
+    def __init__(self, start, end, key, value):
+        self.start = start
+        self.end = end
+        self.key = key  # (inicio, fin, secuencia): orden total entre intervalos
+        self.value = value
+        self.max_end = end  # Mayor fin del subárbol
+        self.height = 1
+        self.left = None
+        self.right = None
+
+
+class IntervalTree:
+    """
+    Árbol de intervalos semiabiertos [inicio, fin) sobre un AVL ordenado por
+    inicio, donde cada nodo guarda el mayor fin de su subárbol. Las consultas
+    de solapamiento descartan los subárboles que terminan antes de la ventana,
+    así que cuestan O(log n + k) para k intervalos encontrados.
+    Usado como índice de reservas de las estaciones de recarga.
+    """
+    def __init__(self):
+        """Inicializa el árbol vacío."""
+        self.root = None
+        self._size = 0
+        self._sequence = 0
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, start, end, value=None):
+        """
+        Agrega un intervalo.
+
+        Returns:
+            tuple: Clave del intervalo, necesaria para quitarlo con remove
+        """
+        if end <= start:
+            raise ValueError("El intervalo debe terminar después de empezar")
+        self._sequence += 1
+        key = (start, end, self._sequence)
+
+        def _insert(node):
+            if not node:
+                return IntervalNode(start, end, key, value)
+            if key < node.key:
+                node.left = _insert(node.left)
+            else:
+                node.right = _insert(node.right)
+            return self._balance(node)
+
+        self.root = _insert(self.root)
+        self._size += 1
+        return key
+
+    def remove(self, key):
+        """
+        Quita el intervalo con la clave dada.
+
+        Returns:
+            bool: True si el intervalo existía
+        """
+        removed = False
+
+        def _remove(node, key):
+            nonlocal removed
+            if not node:
+                return None
+            if key < node.key:
+                node.left = _remove(node.left, key)
+            elif key > node.key:
+                node.right = _remove(node.right, key)
+            else:
+                removed = True
+                if not node.left:
+                    return node.right
+                if not node.right:
+                    return node.left
+                successor = node.right
+                while successor.left:
+                    successor = successor.left
+                node.start, node.end = successor.start, successor.end
+                node.key, node.value = successor.key, successor.value
+                node.right = _remove(node.right, successor.key)
+            return self._balance(node)
+
+        self.root = _remove(self.root, key)
+        if removed:
+            self._size -= 1
+        return removed
+
+    def overlapping(self, start, end):
+        """Valores de los intervalos que se solapan con [start, end), ordenados por inicio."""
+        found = []
+
+        def _collect(node):
+            if not node or node.max_end <= start:
+                return
+            _collect(node.left)
+            if node.start < end:
+                if node.end > start:
+                    found.append(node.value)
+                _collect(node.right)
+
+        _collect(self.root)
+        return found
+
+    def overlapping_intervals(self, start, end):
+        """Intervalos (inicio, fin) que se solapan con [start, end), ordenados por inicio."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node or node.max_end <= start:
+                continue
+            if node.start < end:
+                if node.end > start:
+                    found.append((node.start, node.end))
+                stack.append(node.right)
+            stack.append(node.left)
+        found.sort()
+        return found
+
+    def count_overlapping(self, start, end, limit=None):
+        """
+        Cantidad de intervalos que se solapan con [start, end).
+
+        Args:
+            limit: Deja de contar al llegar a este valor (None para contar todos)
+        """
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node or node.max_end <= start:
+                continue
+            if node.start < end:
+                if node.end > start:
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return count
+                stack.append(node.right)
+            stack.append(node.left)
+        return count
+
+    def _height(self, node):
+        """Altura de un nodo."""
+        return node.height if node else 0
+
+    def _update(self, node):
+        """Actualiza la altura y el mayor fin de un nodo."""
+        node.height = max(self._height(node.left), self._height(node.right)) + 1
+        max_end = node.end
+        if node.left and node.left.max_end > max_end:
+            max_end = node.left.max_end
+        if node.right and node.right.max_end > max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+
+    def _balance_factor(self, node):
+        """Factor de balance de un nodo."""
+        return self._height(node.left) - self._height(node.right)
+
+    def _balance(self, node):
+        """Actualiza y balancea el árbol en un nodo."""
+        self._update(node)
+        balance = self._balance_factor(node)
+        if balance > 1:
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _rotate_left(self, z):
+        """Rotación a la izquierda."""
+        y = z.right
+        z.right = y.left
+        y.left = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def _rotate_right(self, z):
+        """Rotación a la derecha."""
+        y = z.left
+        z.left = y.right
+        y.right = z
+        self._update(z)
+        self._update(y)
+        return y
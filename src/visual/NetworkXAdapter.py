@@ -2,33 +2,82 @@ import networkx as nx
 import matplotlib.pyplot as plt
 
 class NetworkXAdapter:
+    # Colores por tipo de nodo
+    TYPE_COLORS = {
+        'storage': '#3498db',   # Azul
+        'charging': '#f1c40f',  # Amarillo
+        'client': '#2ecc71'     # Verde
+    }
+
     def __init__(self, graph):
         self.graph = graph
+        self.graph.enable_journal()  # Para aplicar solo los cambios al reconvertir
         self.nx_graph = nx.Graph()
         self.node_colors = {}
         self.highlighted_path = None
         self.node_positions = None  # Para mantener las posiciones consistentes
+        self._graph_version = None  # Versión del grafo ya convertida
 
     def convert_to_networkx(self):
+        """
+        Sincroniza el grafo de NetworkX con el grafo del modelo. Si el grafo no
+        cambió no se hace nada; si su registro de cambios cubre la última
+        conversión solo se aplican las diferencias, y si no se reconstruye.
+        Las posiciones se conservan y solo se calculan para los nodos nuevos.
+        """
+        if self._graph_version == self.graph.version and self.nx_graph:
+            return
+        
+        changes = None
+        if self._graph_version is not None:
+            changes = self.graph.changes_since(self._graph_version)
+        if changes is None:
+            self._rebuild()
+        else:
+            self._apply_changes(changes)
+        self._graph_version = self.graph.version
+        self._update_positions()
+
+    def _rebuild(self):
+        """Convierte el grafo completo."""
         self.nx_graph.clear()
+        self.node_colors = {}
         
         # Agregar nodos con sus tipos
         for vertex in self.graph.vertices():
-            if vertex.startswith('S'):  # Storage nodes
-                self.node_colors[vertex] = '#3498db'  # Azul
-            elif vertex.startswith('C'):  # Charging nodes
-                self.node_colors[vertex] = '#f1c40f'  # Amarillo
-            elif vertex.startswith('T'):  # Target/Client nodes
-                self.node_colors[vertex] = '#2ecc71'  # Verde
-            self.nx_graph.add_node(vertex)
+            self._add_node(vertex)
         
         # Agregar aristas con pesos
-        for start in self.graph.vertices():
-            for end in self.graph.get_neighbors(start):
-                weight = self.graph.get_edge_weight(start, end)
-                self.nx_graph.add_edge(start, end, weight=weight)
+        for start, end, weight in self.graph.iter_edges(directed=True):
+            self.nx_graph.add_edge(start, end, weight=weight)
+
+    def _add_node(self, vertex):
+        """Agrega o actualiza un nodo con su tipo y color."""
+        node_type = self.graph.get_node_type(vertex)
+        if node_type in self.TYPE_COLORS:
+            self.node_colors[vertex] = self.TYPE_COLORS[node_type]
+        else:
+            self.node_colors.pop(vertex, None)
+        self.nx_graph.add_node(vertex, node_type=node_type)
 
-        # Calcular posiciones solo si no existen
+    def _apply_changes(self, changes):
+        """
+        Aplica los cambios del registro del grafo.
+        
+        Args:
+            changes: Cambios devueltos por Graph.changes_since
+        """
+        for change in changes:
+            kind = change['kind']
+            if kind in ('add_vertex', 'set_role'):
+                self._add_node(change['vertex'])
+            elif kind in ('add_edge', 'update_edge_weight'):
+                # El grafo de NetworkX es no dirigido: una arista y su inversa
+                # comparten el peso de la última escrita, como en _rebuild
+                self.nx_graph.add_edge(change['start'], change['end'], weight=change['weight'])
+
+    def _update_positions(self):
+        """Calcula posiciones solo para los nodos que todavía no tienen."""
         if self.node_positions is None:
             # Usar un layout determinista con seed fijo
             self.node_positions = nx.spring_layout(
@@ -37,6 +86,20 @@ class NetworkXAdapter:
                 iterations=50,
                 seed=42  # Seed fijo para consistencia
             )
+            return
+        
+        missing = [node for node in self.nx_graph if node not in self.node_positions]
+        if missing:
+            # Los nodos ya ubicados quedan fijos para que el dibujo no se mueva
+            fixed = [node for node in self.nx_graph if node in self.node_positions]
+            self.node_positions = nx.spring_layout(
+                self.nx_graph,
+                k=2.0,
+                pos={node: self.node_positions[node] for node in fixed},
+                fixed=fixed or None,
+                iterations=50,
+                seed=42
+            )
 
     def highlight_path(self, path):
         """
@@ -75,8 +138,9 @@ class NetworkXAdapter:
                                  width=2)
         
         # Dibujar nodos por tipo en orden específico
-        for node_prefix in ['S', 'C', 'T']:  # Dibujar en orden: Storage, Charging, Targets
-            nodes = [n for n in self.nx_graph.nodes() if n.startswith(node_prefix)]
+        node_types = self.nx_graph.nodes(data='node_type')
+        for node_type in ['storage', 'charging', 'client']:  # Dibujar en orden: Storage, Charging, Targets
+            nodes = [n for n, t in node_types if t == node_type]
             if nodes:
                 nx.draw_networkx_nodes(self.nx_graph, self.node_positions,
                                      nodelist=nodes,
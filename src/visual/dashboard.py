@@ -10,10 +10,24 @@ from src.domain.Route import Route
 from src.domain.Order import Order
 import pandas as pd
 import json
-from src.model.algorithms import DijkstraAlgorithm
+from src.model.algorithms import RouteOptimizer
+from src.model.roles import ROLE_CHARGING
 from src.shared_data import shared_data_manager
 from datetime import datetime
 
+# Algoritmos disponibles en la calculadora de rutas (nombres de RouteOptimizer)
+ROUTE_ALGORITHMS = {
+    'Dijkstra': 'dijkstra',
+    'Dijkstra bidireccional': 'bidirectional',
+    'A*': 'astar',
+}
+
+
+def notify_streamlit(level, message):
+    """Muestra los avisos del simulador en el dashboard (st.info, st.warning o st.error)."""
+    getattr(st, level, st.info)(message)
+
+
 # Must be the first Streamlit command
 st.set_page_config(
     page_title="Sistema de Entrega con Drones",
@@ -228,7 +242,7 @@ def run_simulation_tab():
             with st.spinner('Inicializando simulación...'):
                 try:
                     # Siempre crear una nueva instancia al iniciar la simulación
-                    st.session_state.simulation_initializer = SimulationInitializer()
+                    st.session_state.simulation_initializer = SimulationInitializer(notify=notify_streamlit)
                     st.session_state.avl_tree = AVL()
                     st.session_state.routes = []
                     st.session_state.route_counter = 0
@@ -271,7 +285,7 @@ def run_simulation_tab():
                     
                     # Mostrar estadísticas de la simulación creada
                     actual_nodes = len(graph.vertices())
-                    actual_edges = len([edge for edge in graph.edges()])
+                    actual_edges = graph.num_edges()
                     actual_orders = len(orders) if orders else 0
                     actual_clients = len(clients) if clients else 0
                     
@@ -299,17 +313,21 @@ def explore_network_tab():
     if 'node_visits' not in st.session_state:
         st.session_state.node_visits = {}
 
-    nodes = list(st.session_state.graph.vertices())
-    storage_nodes = [n for n in nodes if n.startswith('S')]
-    client_nodes = [n for n in nodes if n.startswith('T')]
+    graph = st.session_state.graph
+    nodes = list(graph.vertices())
+    storage_nodes = graph.vertices_with_role('storage')
+    client_nodes = graph.vertices_with_role('client')
     
     # Inicializar el visualizador de mapa solo una vez
     if 'map_visualizer' not in st.session_state:
         from src.visual.map_visualizer import MapVisualizer
         st.session_state.map_visualizer = MapVisualizer()
         
-        # Generar posiciones de nodos una sola vez y guardarlas en session_state
-        st.session_state.node_positions = st.session_state.map_visualizer.generate_node_positions(nodes, 'random')
+        # Generar posiciones de nodos una sola vez y guardarlas en el grafo,
+        # donde las usan A* y la API
+        if len(graph.positions()) < len(nodes):
+            graph.set_positions(st.session_state.map_visualizer.generate_node_positions(nodes, 'random'))
+        st.session_state.node_positions = graph.positions()
     
     map_viz = st.session_state.map_visualizer
     
@@ -341,8 +359,20 @@ def explore_network_tab():
     
     with col3:
         st.markdown("#### 🚁 Algoritmo")
-        st.info("**Dijkstra** - Algoritmo de caminos más cortos")
-        algorithm = 'Dijkstra'  # Algoritmo fijo
+        algorithm = st.selectbox(
+            'Seleccionar algoritmo',
+            list(ROUTE_ALGORITHMS.keys()),
+            key='route_algorithm',
+            help="Todos encuentran el camino más corto; difieren en cuántos nodos exploran"
+        )
+        route_count = st.number_input(
+            'Rutas a mostrar',
+            min_value=1,
+            max_value=5,
+            value=1,
+            key='route_count',
+            help="Con más de una se superponen en el mapa las siguientes rutas más cortas (Yen)"
+        )
 
     if 'current_path' not in st.session_state:
         st.session_state.current_path = None
@@ -356,15 +386,18 @@ def explore_network_tab():
     with col1:
         if st.button('✈️ Calculate Route', use_container_width=True, type='primary'):
             # Validación: Solo permitir rutas de Almacenamiento → Cliente
-            if not start_node.startswith('S') or not end_node.startswith('T'):
+            if graph.get_node_type(start_node) != 'storage' or graph.get_node_type(end_node) != 'client':
                 st.error('❌ Solo se permiten rutas de Almacenamiento (S) → Cliente (T)')
                 return
             
-            # Usar algoritmo Dijkstra (fijo)
-            dijkstra = DijkstraAlgorithm(st.session_state.graph)
-            path, total_cost, info = dijkstra.find_shortest_path(start_node, end_node)
+            # Usar el algoritmo seleccionado (las rutas repetidas salen de la caché)
+            optimizer = RouteOptimizer(st.session_state.graph)
+            dijkstra = optimizer.dijkstra
+            info = optimizer.optimize_route(start_node, end_node, ROUTE_ALGORITHMS[algorithm])
+            path, total_cost = info['path'], info['total_cost']
             completed = info.get('autonomy_respected', False)
-            charging_points = info.get('charging_stations', [])
+            # Copia: el resultado de la caché es compartido
+            charging_points = list(info.get('charging_stations', []))
             reason = '' if completed else 'No se respeta la autonomía o no hay ruta.'
             segments = []
             valid_path = completed
@@ -375,8 +408,8 @@ def explore_network_tab():
                     edge = st.session_state.graph.get_edge(path[i], path[i+1])
                     if edge:
                         edge_cost = edge.element()
-                        if path[i].startswith('C') or path[i+1].startswith('C'):
-                            charging_node = path[i] if path[i].startswith('C') else path[i+1]
+                        if graph.get_role(path[i]) == ROLE_CHARGING or graph.get_role(path[i+1]) == ROLE_CHARGING:
+                            charging_node = path[i] if graph.get_role(path[i]) == ROLE_CHARGING else path[i+1]
                             if charging_node not in charging_points:
                                 charging_points.append(charging_node)
                             current_autonomy = dijkstra.MAX_AUTONOMY
@@ -388,8 +421,15 @@ def explore_network_tab():
                         st.error(f"❌ No hay conexión directa entre {path[i]} y {path[i+1]}")
                         break
 
-                # Resaltar la ruta en el mapa
+                # Resaltar la ruta en el mapa y superponer las alternativas
                 map_viz.highlight_path(path)
+                alternatives = []
+                if route_count > 1:
+                    routes = optimizer.optimize_route(start_node, end_node, 'k_shortest',
+                                                      k=int(route_count))['alternatives']
+                    alternatives = [(route['path'], route['total_cost']) for route in routes
+                                    if route['path'] != path][:int(route_count) - 1]
+                    map_viz.show_alternative_routes(alternatives)
                 st.session_state.current_path = path
                 st.session_state.current_cost = total_cost
                 st.session_state.path_calculated = completed
@@ -405,7 +445,7 @@ def explore_network_tab():
                     if edge:
                         edge_cost = edge.element()
                         # Si el siguiente nodo es de recarga, restaurar batería
-                        if path[i+1].startswith('C'):
+                        if graph.get_role(path[i+1]) == ROLE_CHARGING:
                             current_battery = MAX_AUTONOMY
                         # Consumir batería del segmento actual
                         current_battery -= edge_cost
@@ -425,7 +465,9 @@ def explore_network_tab():
                     'charging_stations': charging_points,
                     'segments': segments,
                     'completed': completed,
-                    'algorithm': algorithm
+                    'algorithm': algorithm,
+                    'expanded_nodes': info.get('expanded_nodes', 0),
+                    'alternatives': alternatives
                 }
                 
                 st.success(f"✅ Ruta calculada con {algorithm}")
@@ -490,12 +532,15 @@ def explore_network_tab():
         with col1:
             st.markdown(f"""
             **🚁 Algoritmo:** {summary['algorithm']}  
+            **🔎 Nodos explorados:** {summary.get('expanded_nodes', 0)}  
             **📍 Ruta:** {summary['route']}  
             **💰 Costo Total:** {summary['total_cost']:.2f} unidades  
             **🔋 Energía Consumida:** {summary['total_battery_used']:.1f} / 50 unidades  
             **🔋 Uso de Batería:** {summary['battery_usage']:.1f}%  
             **📦 Nodos:** {len(st.session_state.current_path)}
             """)
+            for i, (alt_path, alt_cost) in enumerate(summary.get('alternatives', []), 1):
+                st.markdown(f"**🔀 Alternativa {i}:** {' → '.join(alt_path)} (costo {alt_cost:.2f})")
         
         with col2:
             if summary['charging_stations']:
@@ -608,7 +653,7 @@ def explore_network_tab():
             st.metric("Nodos Almacenamiento", len(storage_nodes))
         
         with col3:
-            charging_nodes = [n for n in nodes if n.startswith('C')]
+            charging_nodes = graph.vertices_with_role('charging')
             st.metric("Nodos Recarga", len(charging_nodes))
         
         with col4:
@@ -857,10 +902,11 @@ def general_statistics_tab():
     st.subheader('📊 Nodos Más Visitados por Rol')
     
     # Obtener y filtrar nodos por tipo
-    nodes = list(st.session_state.graph.vertices())
-    storage_nodes = [n for n in nodes if n.startswith('S')]
-    charging_nodes = [n for n in nodes if n.startswith('C')]
-    client_nodes = [n for n in nodes if n.startswith('T')]
+    graph = st.session_state.graph
+    nodes = list(graph.vertices())
+    storage_nodes = graph.vertices_with_role('storage')
+    charging_nodes = graph.vertices_with_role('charging')
+    client_nodes = graph.vertices_with_role('client')
     
     # Crear tres columnas para los gráficos
     col1, col2, col3 = st.columns(3)
@@ -881,18 +927,18 @@ def general_statistics_tab():
         return None
 
     # Agregar visitas de todas las rutas por tipo de nodo
-    def aggregate_visits_by_type(node_type_prefix):
+    def aggregate_visits_by_type(node_type):
         visits = {}
         for route in getattr(st.session_state, 'routes', []):
             for node, count in route.get_node_visits().items():
-                if node.startswith(node_type_prefix):
+                if graph.get_node_type(node) == node_type:
                     visits[node] = visits.get(node, 0) + count
         # Ordenar por visitas descendente
         return sorted(visits.items(), key=lambda x: x[1], reverse=True)
 
     with col1:
         st.markdown("👥 Clientes Más Visitados")
-        client_visits = aggregate_visits_by_type('T')
+        client_visits = aggregate_visits_by_type('client')
         if client_visits:
             fig = create_bar_chart(client_visits[:5], 'Top 5 Clientes Más Visitados', '#66B2FF')
             if fig:
@@ -903,7 +949,7 @@ def general_statistics_tab():
 
     with col2:
         st.markdown("🔋 Estaciones de Recarga Más Visitadas")
-        charging_visits = aggregate_visits_by_type('C')
+        charging_visits = aggregate_visits_by_type('charging')
         if charging_visits:
             fig = create_bar_chart(charging_visits[:5], 'Top 5 Estaciones de Recarga Más Visitadas', '#66B2FF')
             if fig:
@@ -914,7 +960,7 @@ def general_statistics_tab():
 
     with col3:
         st.markdown("📦 Almacenes Más Visitados")
-        storage_visits = aggregate_visits_by_type('S')
+        storage_visits = aggregate_visits_by_type('storage')
         if storage_visits:
             fig = create_bar_chart(storage_visits[:5], 'Top 5 Almacenes Más Visitados', '#66B2FF')
             if fig:
@@ -958,7 +1004,7 @@ def general_statistics_tab():
         st.metric("Nodos Cliente", len(client_nodes))
     
     with col3:
-        total_edges = sum(1 for _ in st.session_state.graph.edges())
+        total_edges = st.session_state.graph.num_edges()
         st.metric("Total de Conexiones", total_edges)
         avg_connections = total_edges / len(nodes) if len(nodes) > 0 else 0
         st.metric("Promedio de Conexiones", f"{avg_connections:.2f}")
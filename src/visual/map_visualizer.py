@@ -3,6 +3,7 @@ import random
 import math
 from typing import List, Dict, Tuple, Optional
 import streamlit as st
+from src.model.roles import ROLE_NAMES, infer_role
 
 class MapVisualizer:
     def __init__(self):
@@ -12,6 +13,7 @@ class MapVisualizer:
         # Coordenadas exactas de Temuco, Chile
         self.temuco_center = [-38.7385268, -72.5900592]
         self.map = None
+        self.graph = None  # Grafo mostrado, usado para consultar los roles de los nodos
         self.node_positions = {}
         self.normal_edges = []  # Lista para almacenar las rutas normales
         self.mst_mode = False   # Flag para indicar si estamos en modo MST
@@ -66,6 +68,9 @@ class MapVisualizer:
             'mst': '#9932CC',          # Púrpura para MST
             'animation': '#FF0000'     # Rojo para animación
         }
+        
+        # Colores para las rutas alternativas, en orden de costo
+        self.alternative_colors = ['#1E88E5', '#43A047', '#8E24AA', '#00ACC1', '#6D4C41']
     
     def generate_node_positions(self, nodes: List[str], graph_type: str = 'random') -> Dict[str, Tuple[float, float]]:
         """
@@ -138,11 +143,14 @@ class MapVisualizer:
         if not graph:
             return None
         
+        self.graph = graph
         nodes = list(graph.vertices())
         
-        # Usar las posiciones proporcionadas o generar nuevas
+        # Usar las posiciones proporcionadas, las guardadas en el grafo o generar nuevas
         if node_positions is not None:
             self.node_positions = node_positions
+        elif hasattr(graph, 'positions') and len(graph.positions()) == len(nodes):
+            self.node_positions = graph.positions()
         elif not hasattr(self, 'node_positions') or not self.node_positions:
             self.node_positions = self.generate_node_positions(nodes, 'random')
         
@@ -256,15 +264,11 @@ class MapVisualizer:
         """Agrega las conexiones entre nodos al mapa con mejor visualización."""
         self.normal_edges = []  # Limpiar lista de rutas normales
         
-        for edge in graph.edges():
-            u, v = edge.endpoints()
+        for u, v, edge_weight in graph.iter_edges():
             if u in self.node_positions and v in self.node_positions:
                 lat1, lon1 = self.node_positions[u]
                 lat2, lon2 = self.node_positions[v]
                 
-                # Obtener el peso de la arista
-                edge_weight = edge.element()
-                
                 # Color azul para todas las aristas
                 color = '#1976D2'  # Azul Google/Material
                 weight_normalized = 3  # Grosor medio
@@ -338,6 +342,33 @@ class MapVisualizer:
                 popup=f"Segmento: {path[i]} → {path[i+1]}"
             ).add_to(self.map)
     
+    def show_alternative_routes(self, routes: List[Tuple[List[str], float]], weight: int = 4):
+        """
+        Superpone rutas alternativas en el mapa con líneas discontinuas.
+        
+        Args:
+            routes: Lista de (camino, costo) ordenada de menor a mayor costo
+            weight: Grosor de las líneas
+        """
+        if not self.map:
+            return
+        
+        for i, (path, cost) in enumerate(routes):
+            route_coords = [self.node_positions[node] for node in path if node in self.node_positions]
+            if len(route_coords) < 2:
+                continue
+            
+            color = self.alternative_colors[i % len(self.alternative_colors)]
+            folium.PolyLine(
+                locations=route_coords,
+                weight=weight,
+                color=color,
+                opacity=0.7,
+                dash_array='8, 8',
+                popup=f"<b>Alternativa {i + 1} (costo {cost}):</b><br>{' → '.join(path)}",
+                tooltip=f"Ruta alternativa {i + 1} - costo {cost}"
+            ).add_to(self.map)
+    
     def hide_normal_edges(self):
         """Oculta las rutas normales del mapa."""
         if self.map and self.normal_edges:
@@ -488,14 +519,10 @@ class MapVisualizer:
         self.map.get_root().html.add_child(folium.Element(summary_html))
     
     def _get_node_type(self, node: str) -> str:
-        """Determina el tipo de nodo basado en su ID."""
-        if node.startswith('S'):
-            return 'storage'
-        elif node.startswith('C'):
-            return 'charging'
-        elif node.startswith('T'):
-            return 'client'
-        return 'unknown'
+        """Determina el tipo de nodo según su rol en el grafo."""
+        if self.graph is not None and self.graph.has_vertex(node):
+            return self.graph.get_node_type(node)
+        return ROLE_NAMES[infer_role(node)]
     
     def save_map(self, filename: str = "mapa_drones.html"):
         """
@@ -10,6 +10,7 @@ import io
 import os
 import json
 from datetime import datetime
+from src.model.roles import ROLE_NAMES, infer_role
 
 class ReportGenerator:
     def __init__(self):
@@ -42,6 +43,12 @@ class ReportGenerator:
             spaceAfter=6
         )
     
+    def _get_node_type(self, graph, node):
+        """Obtiene el tipo de un nodo desde el grafo, o por su ID si no hay grafo."""
+        if graph:
+            return graph.get_node_type(node)
+        return ROLE_NAMES[infer_role(node)]
+    
     def _get_field(self, obj, field, default='N/A'):
         if isinstance(obj, dict):
             return obj.get(field, default)
@@ -196,9 +203,10 @@ class ReportGenerator:
             story.append(Paragraph("No hay datos de nodos disponibles.", self.normal_style))
             return story
         
-        storage_nodes = [n for n in nodes if n.startswith('S')]
-        charging_nodes = [n for n in nodes if n.startswith('C')]
-        client_nodes = [n for n in nodes if n.startswith('T')]
+        node_types = [self._get_node_type(graph, n) for n in nodes]
+        storage_nodes = [n for n, t in zip(nodes, node_types) if t == 'storage']
+        charging_nodes = [n for n, t in zip(nodes, node_types) if t == 'charging']
+        client_nodes = [n for n, t in zip(nodes, node_types) if t == 'client']
         
         # Crear gráfico de pie
         fig, ax = plt.subplots(figsize=(8, 6))
@@ -294,7 +302,7 @@ class ReportGenerator:
         if not nodes:
             story.append(Paragraph("No hay datos de nodos disponibles.", self.normal_style))
             return story
-        charging_nodes = [n for n in nodes if n.startswith('C')]
+        charging_nodes = [n for n in nodes if self._get_node_type(graph, n) == 'charging']
         if not charging_nodes:
             story.append(Paragraph("No hay estaciones de recarga disponibles.", self.normal_style))
             return story
@@ -338,7 +346,7 @@ class ReportGenerator:
         if not nodes:
             story.append(Paragraph("No hay datos de nodos disponibles.", self.normal_style))
             return story
-        storage_nodes = [n for n in nodes if n.startswith('S')]
+        storage_nodes = [n for n in nodes if self._get_node_type(graph, n) == 'storage']
         if not storage_nodes:
             story.append(Paragraph("No hay nodos de almacenamiento disponibles.", self.normal_style))
             return story
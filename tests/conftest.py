@@ -0,0 +1,93 @@
+import heapq
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.model.algorithms import DijkstraAlgorithm
+from src.model.network_generator import generate_network
+from src.model.roles import ROLE_CHARGING
+
+# Redes geométricas de prueba: pesos hasta 30, de modo que muchas rutas
+# necesitan recargas con la autonomía de 50
+NETWORK_SEEDS = (0, 1, 2, 3)
+NETWORK_NODES = 300
+PAIRS_PER_NETWORK = 60
+
+
+# Pesos de las redes con aristas más largas que la autonomía, que Dijkstra
+# con consider_charging solo usa hacia estaciones de recarga
+LONG_RANGE_MAX_WEIGHT = 80
+
+
+def make_network(seed, max_weight=30):
+    return generate_network(NETWORK_NODES, mode="geometric", k=4, max_weight=max_weight, seed=seed)
+
+
+def random_pairs(graph, count=PAIRS_PER_NETWORK, seed=0):
+    names = graph.to_csr().names
+    rng = random.Random(seed)
+    return [(rng.choice(names), rng.choice(names)) for _ in range(count)]
+
+
+@pytest.fixture(params=NETWORK_SEEDS)
+def network(request):
+    """Red geométrica y pares origen/destino al azar."""
+    graph = make_network(request.param)
+    return graph, random_pairs(graph, seed=request.param)
+
+
+@pytest.fixture(params=NETWORK_SEEDS)
+def long_range_network(request):
+    """Red geométrica con aristas que superan la autonomía, y pares al azar."""
+    graph = make_network(request.param, LONG_RANGE_MAX_WEIGHT)
+    return graph, random_pairs(graph, seed=request.param)
+
+
+def reference_charging_route(graph, start, end, autonomy=50):
+    """
+    (recargas, costo) mínimos en orden lexicográfico con el modelo de batería
+    de ChargingAwareRouter, por Dijkstra sobre los estados (nodo, batería).
+    Requiere pesos enteros. Devuelve None si no hay ruta.
+    """
+    csr = graph.to_csr()
+    offsets, targets, weights = csr.as_lists()
+    roles = csr.role_list()
+    source, target = csr.vertex_id(start), csr.vertex_id(end)
+    best = {(source, autonomy): (0, 0)}
+    pq = [(0, 0, source, autonomy)]
+    while pq:
+        recharges, cost, u, battery = heapq.heappop(pq)
+        if best[(u, battery)] < (recharges, cost):
+            continue
+        if u == target:
+            return recharges, cost
+        at_station = roles[u] == ROLE_CHARGING
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if at_station or roles[v] == ROLE_CHARGING:
+                state = (v, autonomy)
+                label = (recharges if at_station else recharges + 1, cost + weights[k])
+            else:
+                if battery < weights[k]:
+                    continue
+                state = (v, battery - weights[k])
+                label = (recharges, cost + weights[k])
+            if state not in best or label < best[state]:
+                best[state] = label
+                heapq.heappush(pq, label + state)
+    return None
+
+
+def dijkstra_cost(graph, start, end, consider_charging=False):
+    """Costo de la ruta de Dijkstra con cola binaria (inf si no hay ruta)."""
+    _, cost, _ = DijkstraAlgorithm(graph, queue="heap").find_shortest_path(start, end, consider_charging)
+    return cost
+
+
+def path_cost(graph, path):
+    """Suma de los pesos de las aristas de un camino."""
+    return sum(graph.get_edge_weight(path[i], path[i + 1]) for i in range(len(path) - 1))
@@ -0,0 +1,35 @@
+import sys
+
+import pytest
+
+from conftest import dijkstra_cost, make_network, path_cost
+from src.model import all_pairs
+from src.model.all_pairs import AllPairsShortestPaths
+
+
+@pytest.mark.parametrize("method", ["floyd_warshall", "dijkstra"])
+def test_tabla_igual_a_dijkstra(network, method):
+    graph, pairs = network
+    table = AllPairsShortestPaths(graph, method)
+    for start, end in pairs:
+        path, cost = table.path(start, end)
+        assert cost == dijkstra_cost(graph, start, end)
+        if path is not None:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
+
+
+def test_tabla_rechaza_grafos_grandes(monkeypatch):
+    graph = make_network(0)
+    monkeypatch.setattr(all_pairs, "ALL_PAIRS_MAX_VERTICES", 100)
+    with pytest.raises(ValueError):
+        AllPairsShortestPaths(graph)
+
+
+def test_floyd_warshall_usa_busqueda_por_par_sobre_el_limite(monkeypatch, network):
+    graph, pairs = network
+    monkeypatch.setattr(sys.modules[type(graph).__module__], "ALL_PAIRS_MAX_VERTICES", 100)
+    for start, end in pairs:
+        _, cost = graph.floyd_warshall_shortest_path(start, end)
+        assert cost == dijkstra_cost(graph, start, end)
+    assert graph._all_pairs is None
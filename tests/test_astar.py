@@ -0,0 +1,26 @@
+from conftest import dijkstra_cost, path_cost
+from src.model.algorithms import AStarAlgorithm
+
+
+def test_astar_igual_a_dijkstra(network):
+    graph, pairs = network
+    assert graph.to_csr().heuristic_scale() > 0
+    astar = AStarAlgorithm(graph)
+    for start, end in pairs:
+        path, cost, _ = astar.find_shortest_path(start, end, consider_charging=False)
+        assert cost == dijkstra_cost(graph, start, end)
+        if path:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
+
+
+def test_astar_con_autonomia_igual_a_dijkstra(long_range_network):
+    graph, pairs = long_range_network
+    assert graph.to_csr().heuristic_scale() > 0
+    astar = AStarAlgorithm(graph)
+    for start, end in pairs:
+        path, cost, _ = astar.find_shortest_path(start, end, consider_charging=True)
+        assert cost == dijkstra_cost(graph, start, end, consider_charging=True)
+        if path:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
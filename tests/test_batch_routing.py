@@ -0,0 +1,19 @@
+from conftest import dijkstra_cost
+from src.model.algorithms import RouteOptimizer
+
+
+def check_batch(graph, pairs, consider_charging):
+    results = RouteOptimizer(graph).route_many(pairs, consider_charging)
+    assert len(results) == len(pairs)
+    for (start, end), result in zip(pairs, results):
+        assert result['total_cost'] == dijkstra_cost(graph, start, end, consider_charging)
+        if result['path']:
+            assert result['path'][0] == start and result['path'][-1] == end
+
+
+def test_lote_igual_a_dijkstra(network):
+    check_batch(*network, consider_charging=False)
+
+
+def test_lote_con_autonomia_igual_a_dijkstra(long_range_network):
+    check_batch(*long_range_network, consider_charging=True)
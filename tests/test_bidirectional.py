@@ -0,0 +1,24 @@
+from conftest import dijkstra_cost, path_cost
+from src.model.algorithms import BidirectionalDijkstra
+
+
+def test_bidireccional_igual_a_dijkstra(network):
+    graph, pairs = network
+    bidirectional = BidirectionalDijkstra(graph)
+    for start, end in pairs:
+        path, cost, _ = bidirectional.find_shortest_path(start, end, consider_charging=False)
+        assert cost == dijkstra_cost(graph, start, end)
+        if path:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
+
+
+def test_bidireccional_con_autonomia_igual_a_dijkstra(long_range_network):
+    graph, pairs = long_range_network
+    bidirectional = BidirectionalDijkstra(graph)
+    for start, end in pairs:
+        path, cost, _ = bidirectional.find_shortest_path(start, end, consider_charging=True)
+        assert cost == dijkstra_cost(graph, start, end, consider_charging=True)
+        if path:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
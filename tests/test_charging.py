@@ -0,0 +1,23 @@
+from src.sim.charging import ChargingStation
+
+
+def test_reservas_sin_solape_no_saturan():
+    station = ChargingStation('C1', pads=2)
+    station.reserve(0, 2)
+    station.reserve(3, 5)
+    assert not station.is_saturated(0, 10)
+
+
+def test_reservas_simultaneas_saturan():
+    station = ChargingStation('C1', pads=2)
+    station.reserve(0, 4)
+    station.reserve(3, 5)
+    assert station.is_saturated(0, 10)
+    assert not station.is_saturated(4, 10)
+
+
+def test_reservas_contiguas_no_se_solapan():
+    station = ChargingStation('C1', pads=1)
+    station.reserve(0, 2)
+    assert not station.is_saturated(2, 4)
+    assert station.is_saturated(1, 3)
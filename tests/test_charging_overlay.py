@@ -0,0 +1,41 @@
+from conftest import path_cost, reference_charging_route
+from src.model import charging_overlay
+from src.model.charging_overlay import route_with_charging
+
+
+def check_route(graph, start, end, result):
+    expected = reference_charging_route(graph, start, end, 50)
+    if expected is None:
+        assert result is None or not result['completed']
+    else:
+        assert result['completed']
+        assert (result['recharges'], result['total_cost']) == expected
+        path = result['path']
+        assert path[0] == start and path[-1] == end
+        assert path_cost(graph, path) == result['total_cost']
+
+
+def test_grafo_de_estaciones_igual_a_la_referencia(network):
+    graph, pairs = network
+    overlay = graph.charging_overlay(50)
+    for start, end in pairs:
+        check_route(graph, start, end, overlay.find_path(start, end))
+
+
+def test_ruta_con_recargas_igual_a_la_referencia(network):
+    graph, pairs = network
+    for start, end in pairs:
+        check_route(graph, start, end, route_with_charging(graph, start, end, 50))
+
+
+def test_atajo_acotado_igual_a_la_referencia(network, monkeypatch):
+    graph, pairs = network
+    monkeypatch.setattr(charging_overlay, "FLOYD_WARSHALL_MAX_VERTICES", 0)
+    for start, end in pairs:
+        check_route(graph, start, end, route_with_charging(graph, start, end, 50))
+
+
+def test_ruta_con_aristas_largas_igual_a_la_referencia(long_range_network):
+    graph, pairs = long_range_network
+    for start, end in pairs:
+        check_route(graph, start, end, route_with_charging(graph, start, end, 50))
@@ -0,0 +1,28 @@
+from src.model.algorithms import ChargingAwareRouter
+
+from conftest import reference_charging_route
+
+
+def test_ruta_con_recargas_igual_a_la_referencia(network):
+    graph, pairs = network
+    router = ChargingAwareRouter(graph, autonomy=50)
+    for start, end in pairs:
+        result = router.find_path(start, end)
+        expected = reference_charging_route(graph, start, end, 50)
+        if expected is None:
+            assert not result['completed']
+        else:
+            assert result['completed']
+            assert (result['recharges'], result['total_cost']) == expected
+
+
+def test_camino_recorre_aristas_del_grafo(network):
+    graph, pairs = network
+    router = ChargingAwareRouter(graph, autonomy=50)
+    for start, end in pairs:
+        result = router.find_path(start, end)
+        if not result['completed']:
+            continue
+        path = result['path']
+        assert path[0] == start and path[-1] == end
+        assert sum(graph.get_edge_weight(a, b) for a, b in zip(path, path[1:])) == result['total_cost']
@@ -0,0 +1,70 @@
+import random
+
+from src.model import Graph
+from src.model.traversal import reachable
+
+
+def undirected(graph):
+    """Copia del grafo con cada arista en ambas direcciones."""
+    copy = Graph()
+    for vertex in graph.vertices():
+        copy.add_vertex(vertex)
+    for start, end in graph.edge_weights:
+        copy.add_edge(start, end)
+        copy.add_edge(end, start)
+    return copy
+
+
+def bfs_components(graph):
+    """Componentes conexas por BFS sobre la copia no dirigida."""
+    copy = undirected(graph)
+    components, seen = [], set()
+    for vertex in copy.vertices():
+        if vertex not in seen:
+            component = reachable(copy, vertex)
+            seen |= component
+            components.append(component)
+    return components
+
+
+def check_components(graph, rng):
+    components = bfs_components(graph)
+    assert graph.component_count() == len(components)
+    assert graph.is_connected() == (len(components) <= 1)
+    component_of = {vertex: i for i, component in enumerate(components) for vertex in component}
+    vertices = list(component_of)
+    for _ in range(200):
+        start, end = rng.choice(vertices), rng.choice(vertices)
+        assert graph.same_component(start, end) == (component_of[start] == component_of[end])
+        assert graph.component_size(start) == len(components[component_of[start]])
+
+
+def test_componentes_iguales_a_bfs(network):
+    graph, _ = network
+    check_components(graph, random.Random(0))
+
+
+def test_componentes_al_agregar_aristas():
+    rng = random.Random(1)
+    graph = Graph()
+    nodes = [f"N{i}" for i in range(200)]
+    for node in nodes:
+        graph.add_vertex(node)
+    for step in range(1, 301):
+        graph.add_edge(rng.choice(nodes), rng.choice(nodes), rng.randint(1, 9))
+        if step % 25 == 0:
+            check_components(graph, rng)
+
+
+def test_componentes_de_grafo_desde_csr(network):
+    graph, _ = network
+    copy = Graph.from_csr(graph.to_csr())
+    assert copy.component_count() == graph.component_count()
+    check_components(copy, random.Random(2))
+
+
+def test_vertices_inexistentes_no_estan_conectados(network):
+    graph, _ = network
+    vertex = graph.to_csr().names[0]
+    assert not graph.same_component(vertex, "NO_EXISTE")
+    assert graph.component_size("NO_EXISTE") == 0
@@ -0,0 +1,40 @@
+from conftest import dijkstra_cost, path_cost
+from src.model.contraction_hierarchy import ContractionHierarchy
+
+
+def check_hierarchy(hierarchy, graph, pairs, consider_charging):
+    for start, end in pairs:
+        path, cost, _ = hierarchy.query(start, end)
+        assert cost == dijkstra_cost(graph, start, end, consider_charging)
+        if path is not None:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
+
+
+def test_jerarquia_igual_a_dijkstra(network):
+    graph, pairs = network
+    hierarchy = ContractionHierarchy.build(graph, consider_charging=False)
+    check_hierarchy(hierarchy, graph, pairs, consider_charging=False)
+
+
+def test_jerarquia_con_autonomia_igual_a_dijkstra(long_range_network):
+    graph, pairs = long_range_network
+    hierarchy = ContractionHierarchy.build(graph)
+    check_hierarchy(hierarchy, graph, pairs, consider_charging=True)
+
+
+def test_jerarquia_guardada_responde_igual(long_range_network, tmp_path):
+    graph, pairs = long_range_network
+    path = str(tmp_path / "ch.npz")
+    ContractionHierarchy.build(graph).save(path)
+    hierarchy = ContractionHierarchy.load(path)
+    assert hierarchy.matches(graph)
+    check_hierarchy(hierarchy, graph, pairs, consider_charging=True)
+
+
+def test_jerarquia_no_coincide_tras_cambiar_el_grafo(network):
+    graph, _ = network
+    hierarchy = ContractionHierarchy.build(graph)
+    start, end = graph.to_csr().names[:2]
+    graph.add_edge(start, end, 1000)
+    assert not hierarchy.matches(graph)
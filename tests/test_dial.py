@@ -0,0 +1,36 @@
+import pytest
+
+from src.model import Graph
+from src.model.algorithms import DijkstraAlgorithm
+
+
+def check_dial(graph, pairs, consider_charging):
+    dial = DijkstraAlgorithm(graph, queue="dial")
+    heap = DijkstraAlgorithm(graph, queue="heap")
+    csr = graph.to_csr()
+    for start, _ in pairs:
+        source = csr.vertex_id(start)
+        dial_distances, _, _ = dial.search(source, consider_charging=consider_charging)
+        heap_distances, _, _ = heap.search(source, consider_charging=consider_charging)
+        assert list(dial_distances) == list(heap_distances)
+
+
+def test_dial_igual_a_heap(network):
+    check_dial(*network, consider_charging=False)
+
+
+def test_dial_con_autonomia_igual_a_heap(long_range_network):
+    check_dial(*long_range_network, consider_charging=True)
+
+
+def test_auto_elige_dial_con_pesos_enteros_pequenos(network):
+    graph, _ = network
+    assert DijkstraAlgorithm(graph).queue_kind() == "dial"
+
+
+def test_dial_rechaza_pesos_no_enteros():
+    graph = Graph()
+    graph.add_edge("A", "B", 1.5)
+    assert DijkstraAlgorithm(graph).queue_kind() == "heap"
+    with pytest.raises(ValueError):
+        DijkstraAlgorithm(graph, queue="dial").queue_kind()
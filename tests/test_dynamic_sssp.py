@@ -0,0 +1,70 @@
+import random
+
+from src.model.algorithms import DijkstraAlgorithm
+from src.model.shortest_path_tree import ShortestPathTreeCache
+
+UPDATES = 40
+
+
+def check_trees(graph, trees, consider_charging):
+    """Cada árbol reparado tiene las distancias de un Dijkstra nuevo y padres coherentes."""
+    csr = graph.to_csr()
+    dijkstra = DijkstraAlgorithm(csr, queue="heap")
+    for source in list(trees._trees):
+        tree = trees.get(source)
+        distances, _, _ = dijkstra.search(csr.vertex_id(source), consider_charging=consider_charging)
+        assert list(tree.distances) == list(distances)
+        for v, parent in enumerate(tree.previous):
+            if parent != -1:
+                weight = csr.get_edge_weight(csr.names[parent], csr.names[v])
+                assert tree.distances[v] == tree.distances[parent] + weight
+
+
+def random_updates(graph, seed):
+    """Cambios de peso al azar, tanto alzas como bajas, sobre aristas existentes."""
+    rng = random.Random(seed)
+    edges = sorted(graph.edge_weights)
+    for _ in range(UPDATES):
+        start, end = rng.choice(edges)
+        weight = graph.get_edge_weight(start, end)
+        yield start, end, weight, rng.choice([max(1, weight // 3), weight * 3, rng.randint(1, 80)])
+
+
+def test_arboles_reparados_iguales_a_dijkstra(network):
+    graph, pairs = network
+    trees = graph.shortest_path_trees()
+    trees.warm(start for start, _ in pairs[:10])
+    warmed = dict(trees._trees)
+    for start, end, _, weight in random_updates(graph, len(pairs)):
+        graph.update_edge_weight(start, end, weight)
+        check_trees(graph, trees, consider_charging=False)
+    # Los árboles se repararon en el lugar, no se recalcularon
+    assert all(trees._trees[source] is tree for source, tree in warmed.items())
+
+
+def test_arboles_con_autonomia_reparados_iguales_a_dijkstra(long_range_network):
+    graph, pairs = long_range_network
+    trees = ShortestPathTreeCache(graph, consider_charging=True)
+    trees.warm(start for start, _ in pairs[:10])
+    csr = graph.to_csr()
+    for start, end, old_weight, weight in random_updates(graph, len(pairs)):
+        if old_weight == weight:
+            continue
+        graph.update_edge_weight(start, end, weight)
+        trees.update_edge(csr.vertex_id(start), csr.vertex_id(end), old_weight, weight)
+        check_trees(graph, trees, consider_charging=True)
+
+
+def test_reporte_incluye_los_destinos_que_cambian(network):
+    graph, pairs = network
+    trees = graph.shortest_path_trees()
+    sources = [start for start, _ in pairs[:5]]
+    trees.warm(sources)
+    for start, end, _, weight in random_updates(graph, 7):
+        before = {source: list(trees.get(source).distances) for source in sources}
+        report = graph.update_edge_weight(start, end, weight)
+        for source in sources:
+            after = trees.get(source).distances
+            names = graph.to_csr().names
+            moved = {names[v] for v, d in enumerate(before[source]) if d != after[v]}
+            assert moved <= set(report.get(source, []))
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import dijkstra_cost, path_cost
+from src.model.algorithms import YenKShortestPaths
+from src.model.network_generator import generate_network
+from src.model.roles import ROLE_CHARGING
+
+K = 5
+
+
+def simple_path_costs(graph, start, end, consider_charging):
+    """Costos de todos los caminos simples entre dos nodos, en orden."""
+    def allowed(u, v):
+        weight = graph.get_edge_weight(u, v)
+        return not consider_charging or weight <= 50 or graph.get_role(v) == ROLE_CHARGING
+
+    costs = []
+    stack = [(start, [start], 0)]
+    while stack:
+        u, path, cost = stack.pop()
+        if u == end:
+            costs.append(cost)
+            continue
+        for v in graph.get_neighbors(u):
+            if v not in path and allowed(u, v):
+                stack.append((v, path + [v], cost + graph.get_edge_weight(u, v)))
+    return sorted(costs)
+
+
+@pytest.mark.parametrize("consider_charging", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_k_caminos_iguales_a_la_enumeracion(seed, consider_charging):
+    graph = generate_network(10, mode="geometric", k=3, max_weight=80, seed=seed)
+    yen = YenKShortestPaths(graph)
+    names = graph.to_csr().names
+    for start in names[:3]:
+        for end in names[-3:]:
+            paths, _ = yen.find_k_shortest_paths(start, end, K, consider_charging)
+            expected = simple_path_costs(graph, start, end, consider_charging)[:K]
+            assert [cost for _, cost in paths] == expected
+
+
+def test_primer_camino_igual_a_dijkstra(network):
+    graph, pairs = network
+    yen = YenKShortestPaths(graph)
+    for start, end in pairs[:20]:
+        paths, _ = yen.find_k_shortest_paths(start, end, K, consider_charging=False)
+        if not paths:
+            assert dijkstra_cost(graph, start, end) == float('inf')
+            continue
+        assert paths[0][1] == dijkstra_cost(graph, start, end)
+        costs = [cost for _, cost in paths]
+        assert costs == sorted(costs)
+        assert len({tuple(path) for path, _ in paths}) == len(paths)
+        for path, cost in paths:
+            assert path[0] == start and path[-1] == end
+            assert len(set(path)) == len(path)
+            assert path_cost(graph, path) == cost
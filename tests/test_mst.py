@@ -0,0 +1,45 @@
+import pytest
+
+from src.model.mst import minimum_spanning_forest, mst_edge_list
+from src.model.union_find import UnionFind
+
+METHODS = ("kruskal", "prim", "boruvka")
+
+
+def add_islands(graph):
+    """Agrega componentes aisladas para que el resultado sea un bosque."""
+    graph.add_edge("X1", "X2", 4)
+    graph.add_edge("X2", "X3", 2)
+    graph.add_edge("X3", "X1", 3)
+    graph.add_vertex("X4")
+
+
+def test_mismo_peso_con_los_tres_metodos(network):
+    graph, _ = network
+    add_islands(graph)
+    totals = {method: minimum_spanning_forest(graph, method)[2].sum() for method in METHODS}
+    assert len(set(totals.values())) == 1
+
+
+def test_mismas_aristas_con_los_tres_metodos(network):
+    graph, _ = network
+    edges = {method: sorted(mst_edge_list(graph, method)) for method in METHODS}
+    assert edges["kruskal"] == edges["prim"] == edges["boruvka"]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_bosque_sin_ciclos_que_cubre_cada_componente(network, method):
+    graph, _ = network
+    add_islands(graph)
+    csr = graph.to_csr()
+    sources, targets, _ = minimum_spanning_forest(graph, method)
+    forest = UnionFind(csr.num_vertices())
+    for u, v in zip(sources.tolist(), targets.tolist()):
+        assert forest.union(u, v)
+    assert len(sources) == csr.num_vertices() - graph.component_count()
+
+
+def test_metodo_desconocido_rechazado(network):
+    graph, _ = network
+    with pytest.raises(ValueError):
+        minimum_spanning_forest(graph, "dfs")
@@ -0,0 +1,60 @@
+import itertools
+import tracemalloc
+
+import pytest
+
+from src.model.route_cache import route_cache
+from src.sim import order_stream
+from src.sim.SimulationInitializer import SimulationInitializer
+
+# Órdenes antes de medir (para llenar las cachés acotadas) y medidas después
+WARMUP_ORDERS = 500
+MEASURED_ORDERS = 1000
+MAX_GROWTH_BYTES = 256 * 1024
+
+
+@pytest.fixture
+def simulator():
+    simulator = SimulationInitializer(notify=lambda *args: None)
+    simulator.initialize_network(300, mode="geometric", seed=1)
+    yield simulator
+    simulator.close()
+
+
+def test_flujo_sin_historial_no_acumula_memoria(simulator, monkeypatch):
+    monkeypatch.setattr(order_stream, "RECENT_ROUTES", 100)
+    monkeypatch.setattr(route_cache, "max_entries", 200)
+    stream = simulator.stream_orders(None, buffer_size=100, register=False, track_routes=False)
+    for _ in itertools.islice(stream, WARMUP_ORDERS):
+        pass
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        count = sum(1 for _ in itertools.islice(stream, MEASURED_ORDERS))
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert count == MEASURED_ORDERS
+    assert growth < MAX_GROWTH_BYTES
+    assert simulator.routes == [] and simulator.route_frequencies == {}
+    assert len(simulator.graph.shortest_path_trees()) == 0
+    assert all(not client.orders for client in simulator.clients)
+    assert simulator.routes_created > 0
+
+
+def test_flujo_con_historial_guarda_rutas_y_frecuencias(simulator):
+    orders = list(simulator.stream_orders(200, buffer_size=50))
+    assert orders
+    assert len(simulator.routes) == simulator.routes_created
+    assert sum(simulator.route_frequencies.values()) == len(orders)
+    assert sum(len(client.orders) for client in simulator.clients) == len(orders)
+    for order in orders:
+        assert order.route.nodes[0] == order.origin and order.route.nodes[-1] == order.destination
+
+
+def test_bloques_de_ruteo_acotados():
+    assert [len(chunk) for chunk in order_stream.batched(range(7), 3)] == [3, 3, 1]
+    with pytest.raises(ValueError):
+        list(order_stream.batched(range(7), 0))
@@ -0,0 +1,37 @@
+from conftest import dijkstra_cost, make_network, random_pairs, reference_charging_route
+from src.model.parallel_router import ParallelRouter
+
+
+def test_rutas_en_paralelo_iguales_a_dijkstra():
+    graph = make_network(1)
+    pairs = random_pairs(graph, seed=1)
+    with ParallelRouter(graph, workers=2) as router:
+        results = router.route_many(pairs, consider_charging=False)
+    for (start, end), result in zip(pairs, results):
+        assert result['total_cost'] == dijkstra_cost(graph, start, end)
+
+
+def test_rutas_con_recargas_en_paralelo_iguales_a_la_referencia():
+    graph = make_network(2)
+    pairs = random_pairs(graph, seed=2)
+    with ParallelRouter(graph, workers=2) as router:
+        results = router.find_paths_with_charging(pairs)
+    for start, end in pairs:
+        result = results[(start, end)]
+        expected = reference_charging_route(graph, start, end, 50)
+        if expected is None:
+            assert not result['completed']
+        else:
+            assert (result['recharges'], result['total_cost']) == expected
+
+
+def test_reutiliza_el_pool_mientras_el_grafo_no_cambia():
+    graph = make_network(0)
+    router = ParallelRouter.reuse(None, graph, workers=2)
+    assert ParallelRouter.reuse(router, graph, workers=2) is router
+    assert ParallelRouter.reuse(router, graph, workers=3) is not router
+    router = ParallelRouter.reuse(None, graph, workers=2)
+    graph.update_edge_weight(*next(iter(graph.edge_weights)), 1000)
+    replaced = ParallelRouter.reuse(router, graph, workers=2)
+    assert replaced is not router
+    replaced.close()
@@ -0,0 +1,80 @@
+import pytest
+
+from conftest import make_network
+from src.model import Graph
+from src.model.algorithms import RouteOptimizer
+from src.model.route_cache import RouteCache
+
+
+def test_cambio_del_grafo_invalida_las_rutas():
+    graph = make_network(0)
+    start, end = graph.to_csr().names[:2]
+    cache = RouteCache()
+    cache.put(graph, start, end, "dijkstra", 50, {'total_cost': 3})
+    assert cache.get(graph, start, end, "dijkstra", 50) == {'total_cost': 3}
+    graph.update_edge_weight(*next(iter(graph.edge_weights)), 1000)
+    assert cache.get(graph, start, end, "dijkstra", 50) is None
+    cache.put(graph, start, end, "dijkstra", 50, {'total_cost': 4})
+    graph.add_edge(start, end, 1000)
+    assert cache.get(graph, start, end, "dijkstra", 50) is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_optimizador_recalcula_tras_cambiar_el_grafo():
+    graph = Graph()
+    graph.add_edge("A", "B", 5)
+    graph.add_edge("B", "C", 5)
+    graph.add_edge("A", "C", 20)
+    optimizer = RouteOptimizer(graph)
+    assert optimizer.route_many([("A", "C")], consider_charging=False)[0]['total_cost'] == 10
+    graph.update_edge_weight("B", "C", 30)
+    assert optimizer.route_many([("A", "C")], consider_charging=False)[0]['total_cost'] == 20
+
+
+def test_claves_distinguen_algoritmo_y_autonomia():
+    graph = make_network(0)
+    start, end = graph.to_csr().names[:2]
+    cache = RouteCache()
+    cache.put(graph, start, end, "dijkstra", 50, "con autonomía")
+    assert cache.get(graph, start, end, "dijkstra", None) is None
+    assert cache.get(graph, start, end, "astar", 50) is None
+
+
+def test_cache_descarta_las_rutas_menos_usadas():
+    graph = make_network(0)
+    a, b, c, d = graph.to_csr().names[:4]
+    cache = RouteCache(max_entries=2)
+    cache.put(graph, a, b, "dijkstra", None, 1)
+    cache.put(graph, a, c, "dijkstra", None, 2)
+    cache.get(graph, a, b, "dijkstra", None)
+    cache.put(graph, a, d, "dijkstra", None, 3)
+    assert cache.contains(graph, a, b, "dijkstra", None)
+    assert not cache.contains(graph, a, c, "dijkstra", None)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_guardar_y_cargar_en_un_grafo_igual(tmp_path):
+    graph = make_network(0)
+    start, end = graph.to_csr().names[:2]
+    path = str(tmp_path / "routes.pkl")
+    cache = RouteCache()
+    cache.put(graph, start, end, "dijkstra", 50, {'total_cost': 3})
+    assert cache.save(path, graph) == 1
+
+    same = make_network(0)
+    loaded = RouteCache()
+    assert loaded.load(path, same) == 1
+    assert loaded.get(same, start, end, "dijkstra", 50) == {'total_cost': 3}
+    assert RouteCache().load(path, make_network(1)) == 0
+
+
+def test_cargar_archivo_inexistente(tmp_path):
+    assert RouteCache().load(str(tmp_path / "no_existe.pkl"), make_network(0)) == 0
+
+
+@pytest.mark.parametrize("content", [b"no es un pickle", b"", b"\x80\x04N."])
+def test_cargar_archivo_danado(tmp_path, content):
+    path = tmp_path / "routes.pkl"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        RouteCache().load(str(path), make_network(0))
@@ -0,0 +1,56 @@
+import pytest
+
+from conftest import dijkstra_cost, make_network, path_cost
+from src.model.shortest_path_tree import ShortestPathTreeCache
+
+
+def check_trees(graph, pairs, consider_charging):
+    trees = ShortestPathTreeCache(graph, consider_charging, max_trees=len(pairs))
+    for start, end in pairs:
+        path, cost = trees.path(start, end)
+        assert cost == dijkstra_cost(graph, start, end, consider_charging)
+        if path is not None:
+            assert path[0] == start and path[-1] == end
+            assert path_cost(graph, path) == cost
+
+
+def test_arboles_iguales_a_dijkstra(network):
+    check_trees(*network, consider_charging=False)
+
+
+def test_arboles_con_autonomia_iguales_a_dijkstra(long_range_network):
+    check_trees(*long_range_network, consider_charging=True)
+
+
+def test_cache_descarta_el_arbol_menos_usado():
+    graph = make_network(0)
+    a, b, c = graph.to_csr().names[:3]
+    trees = ShortestPathTreeCache(graph, max_trees=2)
+    trees.get(a)
+    trees.get(b)
+    trees.get(a)
+    trees.get(c)
+    assert len(trees) == 2 and trees.evictions == 1
+    assert a in trees and c in trees and b not in trees
+
+
+def test_cache_no_supera_max_trees():
+    graph = make_network(0)
+    trees = ShortestPathTreeCache(graph, max_trees=5)
+    trees.warm(graph.to_csr().names[:50])
+    assert len(trees) == 5 and trees.evictions == 45
+
+
+def test_cache_sin_arboles_rechazada():
+    with pytest.raises(ValueError):
+        ShortestPathTreeCache(make_network(0), max_trees=0)
+
+
+def test_cache_del_grafo_se_vacia_al_agregar_aristas():
+    graph = make_network(0)
+    a, b = graph.to_csr().names[:2]
+    trees = graph.shortest_path_trees()
+    trees.get(a)
+    graph.add_edge(a, b, 1)
+    assert len(trees) == 0
+    assert trees.path(a, b) == ([a, b], 1)